@@ -0,0 +1,331 @@
+import mmap
+import os
+from collections import deque
+from itertools import permutations
+
+
+class BaseMotifs:
+    """
+    Heuristique par bases de motifs (pattern databases) pour la recherche A*.
+
+    Les disques sont répartis en groupes disjoints. Pour un groupe de k disques,
+    une table donne la distance exacte pour ranger ces k disques sur la tour cible
+    en ignorant tous les autres, depuis n'importe quel empilement (même illégal).
+    Chaque déplacement ne bouge qu'un disque, donc la somme des distances des
+    groupes reste admissible et cohérente.
+
+    La table d'un groupe ne dépend que de k (seul l'ordre relatif des tailles
+    compte) : elle est calculée une seule fois, enregistrée dans un fichier
+    binaire (un octet par configuration) puis projetée en mémoire avec mmap.
+
+    Une configuration légale (sans base) reçoit directement sa distance exacte,
+    calculée comme dans SolveurOptimal.
+
+    Attributs:
+        codec (CodecEtat): Le codec des états encodés de la recherche.
+        idx_tour_cible (int): Index 0-basé de la tour cible.
+        groupes (list[list[int]]): Rangs des disques de chaque groupe (du plus petit au plus grand).
+    """
+    DOSSIER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bases_motifs")
+    ENTETE = b"BDM"
+    INCONNU = 255
+    # Nombre maximal de disques d'un groupe (une table de 7 disques se calcule en une seconde environ)
+    TAILLE_GROUPE = 7
+
+    # Tables déjà chargées, partagées par toutes les parties : {k: mmap}
+    tables = {}
+    # Index des permutations et des découpages pour chaque k : {k: (dict, dict)}
+    index = {}
+
+    def __init__(self, codec, idx_tour_cible=2, taille_groupe=TAILLE_GROUPE):
+        self.codec = codec
+        self.idx_tour_cible = idx_tour_cible
+        # Les plus grands disques sont regroupés ensemble : ce sont eux qui coûtent le plus
+        self.groupes = []
+        haut = codec.nb_disques
+        while haut > 0:
+            bas = max(0, haut - taille_groupe)
+            self.groupes.append(list(range(bas, haut)))
+            haut = bas
+        self.groupe_du_disque = {rang: g for g, groupe in enumerate(self.groupes) for rang in groupe}
+        self.masques_groupes = [sum(1 << (rang * codec.bits_tour) for rang in groupe) for groupe in self.groupes]
+
+        # Les tables sont calculées pour la tour cible 2 : on échange les tours au besoin
+        self.renumerotation = list(range(codec.nb_tours))
+        self.renumerotation[idx_tour_cible], self.renumerotation[2] = 2, idx_tour_cible
+
+        # Pour chaque groupe, tour et longueur de base : rangs relatifs des disques du groupe dans la base
+        self.bases_groupes = []
+        for groupe in self.groupes:
+            relatif = {rang: i for i, rang in enumerate(groupe)}
+            self.bases_groupes.append([
+                [tuple(relatif[rang] for rang in base[:longueur] if rang in relatif)
+                 for longueur in range(len(base) + 1)]
+                for base in codec.bases
+            ])
+        self.tables_groupes = [self.charger_table(len(groupe)) for groupe in self.groupes]
+
+    @classmethod
+    def indexer(cls, k):
+        """
+        Prépare (une fois) les index de rang des permutations et des découpages pour k disques.
+
+        Une configuration de k disques sur 3 tours est la concaténation des tours
+        (une permutation des k disques) plus la hauteur des deux premières tours.
+
+        Args:
+            k (int): Nombre de disques du groupe.
+
+        Returns:
+            tuple[dict, dict]: (rang de chaque permutation, rang de chaque découpage).
+        """
+        if k not in cls.index:
+            rangs_permutations = {perm: i for i, perm in enumerate(permutations(range(k)))}
+            rangs_decoupages = {}
+            for hauteur_0 in range(k + 1):
+                for hauteur_1 in range(k + 1 - hauteur_0):
+                    rangs_decoupages[(hauteur_0, hauteur_1)] = len(rangs_decoupages)
+            cls.index[k] = (rangs_permutations, rangs_decoupages)
+        return cls.index[k]
+
+    @classmethod
+    def rang_configuration(cls, k, contenus):
+        """
+        Calcule le rang d'une configuration de k disques (index dans la table).
+
+        Args:
+            k (int): Nombre de disques du groupe.
+            contenus (tuple): Trois tuples de rangs relatifs 0..k-1 (fond -> sommet).
+
+        Returns:
+            int: Rang de la configuration.
+        """
+        rangs_permutations, rangs_decoupages = cls.indexer(k)
+        return (rangs_permutations[contenus[0] + contenus[1] + contenus[2]] * len(rangs_decoupages)
+                + rangs_decoupages[(len(contenus[0]), len(contenus[1]))])
+
+    @classmethod
+    def construire_table(cls, k):
+        """
+        Calcule les distances exactes de toutes les configurations de k disques vers la tour 2.
+
+        Parcours en largeur à rebours depuis l'objectif : l'inverse du déplacement
+        d'un disque d de la tour a vers la tour b retire d du sommet de b (s'il
+        y est posé légalement) et le replace sur n'importe quelle autre tour.
+
+        Args:
+            k (int): Nombre de disques du groupe.
+
+        Returns:
+            bytearray: Distance de chaque configuration, indexée par rang.
+        """
+        rangs_permutations, rangs_decoupages = cls.indexer(k)
+        table = bytearray([cls.INCONNU]) * (len(rangs_permutations) * len(rangs_decoupages))
+
+        objectif = ((), (), tuple(range(k - 1, -1, -1)))
+        table[cls.rang_configuration(k, objectif)] = 0
+        file_attente = deque([objectif])
+        while file_attente:
+            etat = file_attente.popleft()
+            distance = table[cls.rang_configuration(k, etat)] + 1
+            for b in range(3):
+                pile = etat[b]
+                # Le disque a dû être posé sur une tour vide ou sur un disque plus grand
+                if not pile or (len(pile) > 1 and pile[-2] < pile[-1]):
+                    continue
+                for a in range(3):
+                    if a == b:
+                        continue
+                    precedent = list(etat)
+                    precedent[b] = pile[:-1]
+                    precedent[a] = etat[a] + (pile[-1],)
+                    precedent = tuple(precedent)
+                    rang = cls.rang_configuration(k, precedent)
+                    if table[rang] == cls.INCONNU:
+                        table[rang] = distance
+                        file_attente.append(precedent)
+        return table
+
+    @classmethod
+    def tailles_groupes(cls, nb_disques, taille_groupe=TAILLE_GROUPE):
+        """
+        Nombre de disques de chaque groupe, dans l'ordre de __init__.
+
+        Args:
+            nb_disques (int): Nombre de disques de la partie.
+            taille_groupe (int): Nombre maximal de disques d'un groupe.
+
+        Returns:
+            list[int]: Les tailles des groupes.
+        """
+        tailles = [taille_groupe] * (nb_disques // taille_groupe)
+        if nb_disques % taille_groupe:
+            tailles.append(nb_disques % taille_groupe)
+        return tailles
+
+    @classmethod
+    def chemin(cls, k):
+        """
+        Chemin du fichier de la table de k disques.
+
+        Args:
+            k (int): Nombre de disques du groupe.
+
+        Returns:
+            str: Le chemin.
+        """
+        return os.path.join(cls.DOSSIER, f"motifs_{k}.bin")
+
+    @classmethod
+    def disponible(cls, nb_disques, taille_groupe=TAILLE_GROUPE):
+        """
+        Indique si toutes les tables d'une partie sont déjà chargées ou enregistrées
+        (utilisables sans les construire).
+
+        Args:
+            nb_disques (int): Nombre de disques de la partie.
+            taille_groupe (int): Nombre maximal de disques d'un groupe.
+
+        Returns:
+            bool: True si les tables peuvent être chargées immédiatement.
+        """
+        for k in cls.tailles_groupes(nb_disques, taille_groupe):
+            if k in cls.tables:
+                continue
+            try:
+                with open(cls.chemin(k), "rb") as fichier:
+                    if fichier.read(len(cls.ENTETE) + 1) != cls.ENTETE + bytes([k]):
+                        return False
+            except OSError:
+                return False
+        return True
+
+    @classmethod
+    def construire_tables(cls, nb_disques, taille_groupe=TAILLE_GROUPE):
+        """
+        Calcule et enregistre les tables d'une partie qui manquent encore.
+
+        Args:
+            nb_disques (int): Nombre de disques de la partie.
+            taille_groupe (int): Nombre maximal de disques d'un groupe.
+        """
+        for k in set(cls.tailles_groupes(nb_disques, taille_groupe)):
+            cls.charger_table(k)
+
+    @classmethod
+    def charger_table(cls, k):
+        """
+        Charge la table de k disques en la projetant en mémoire, après l'avoir
+        calculée et enregistrée si le fichier n'existe pas encore.
+
+        Args:
+            k (int): Nombre de disques du groupe.
+
+        Returns:
+            mmap.mmap: La table (en-tête compris, voir ENTETE).
+        """
+        if k in cls.tables:
+            return cls.tables[k]
+
+        chemin = cls.chemin(k)
+        entete = cls.ENTETE + bytes([k])
+        if not os.path.exists(chemin):
+            table = cls.construire_table(k)
+            os.makedirs(cls.DOSSIER, exist_ok=True)
+            temporaire = f"{chemin}.{os.getpid()}.tmp"
+            with open(temporaire, "wb") as fichier:
+                fichier.write(entete)
+                fichier.write(table)
+            os.replace(temporaire, chemin)
+
+        with open(chemin, "rb") as fichier:
+            table = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        if table[:len(entete)] != entete:
+            raise ValueError(f"Fichier de base de motifs invalide : {chemin}")
+        cls.tables[k] = table
+        return table
+
+    def distance_groupe(self, code, g):
+        """
+        Distance exacte pour ranger les disques du groupe g, les autres étant ignorés.
+
+        Args:
+            code (int): L'état encodé (voir CodecEtat).
+            g (int): Index du groupe.
+
+        Returns:
+            int: Nombre minimal de déplacements des disques du groupe.
+        """
+        codec = self.codec
+        groupe = self.groupes[g]
+        contenus = [(), (), ()]
+        for idx_tour in range(codec.nb_tours):
+            longueur = codec.lire_base(code, idx_tour)
+            # Disques libres du groupe sur cette tour, lus du plus grand au plus petit
+            libres = (codec.masque_tour_egale(code, idx_tour) & self.masques_groupes[g]
+                      & ~codec.masques_bases[idx_tour][longueur])
+            rangs_libres = []
+            while libres:
+                bit = libres.bit_length() - 1
+                rangs_libres.append(bit // codec.bits_tour - groupe[0])
+                libres ^= 1 << bit
+            contenus[self.renumerotation[idx_tour]] = self.bases_groupes[g][idx_tour][longueur] + tuple(rangs_libres)
+        rang = self.rang_configuration(len(groupe), contenus)
+        return self.tables_groupes[g][len(self.ENTETE) + 1 + rang]
+
+    def distance_legale(self, code):
+        """
+        Distance exacte depuis une configuration légale (aucune base), comme SolveurOptimal :
+        chaque disque absent de sa cible coûte 2^rang déplacements.
+
+        Args:
+            code (int): L'état encodé, sans base.
+
+        Returns:
+            int: Nombre minimal de déplacements.
+        """
+        codec = self.codec
+        cible = self.idx_tour_cible
+        distance = 0
+        for rang in range(codec.nb_disques - 1, -1, -1):
+            idx_tour = codec.lire_tour(code, rang)
+            if idx_tour != cible:
+                distance += 1 << rang
+                cible = 3 - idx_tour - cible
+        return distance
+
+    def heuristique(self, code):
+        """
+        Distance exacte si l'état est légal, sinon somme des distances de tous les groupes.
+
+        Args:
+            code (int): L'état encodé.
+
+        Returns:
+            int: Valeur heuristique admissible pour l'état.
+        """
+        if code >> self.codec.decalage_bases == 0:
+            return self.distance_legale(code)
+        return sum(self.distance_groupe(code, g) for g in range(len(self.groupes)))
+
+    def heuristique_voisin(self, h_parent, code_parent, code_voisin):
+        """
+        Met à jour l'heuristique après un déplacement : seul le groupe du disque déplacé change.
+
+        Une base ne fait que raccourcir, donc un état légal n'a que des voisins
+        légaux ; un voisin légal reçoit directement sa distance exacte.
+
+        Args:
+            h_parent (int): Heuristique de l'état parent.
+            code_parent (int): L'état parent encodé.
+            code_voisin (int): L'état voisin encodé.
+
+        Returns:
+            int: Heuristique de l'état voisin.
+        """
+        if code_voisin >> self.codec.decalage_bases == 0:
+            return self.distance_legale(code_voisin)
+        difference = (code_parent ^ code_voisin) & self.codec.masque_disques
+        rang = ((difference & -difference).bit_length() - 1) // self.codec.bits_tour
+        g = self.groupe_du_disque[rang]
+        return h_parent - self.distance_groupe(code_parent, g) + self.distance_groupe(code_voisin, g)
@@ -0,0 +1,167 @@
+from collections import OrderedDict
+
+from CodecEtat import CodecEtat
+
+
+class CacheDistances:
+    """
+    Mémorise, pour chaque état rencontré sur une solution calculée, la distance
+    exacte jusqu'à l'objectif et le meilleur prochain mouvement.
+
+    Comme pour la recherche, les états sont rangés sous leur forme canonique
+    (CodecEtat.encoder puis CodecEtat.canoniser, les tours autres que la cible
+    étant interchangeables) : un état et ses symétriques partagent la même entrée.
+    Le mouvement est gardé dans la numérotation de l'état canonique et ramené aux
+    vraies tours à la lecture. Un codec dépend des bases de l'état (voir CodecEtat) :
+    il est gardé pour chaque signature (tour cible, bases, tailles), qui fait
+    partie de la clé.
+
+    La taille est bornée : les états les moins récemment utilisés sont oubliés
+    en premier (LRU).
+
+    Attributs:
+        taille_max (int): Nombre maximal d'états conservés.
+        entrees (OrderedDict): {(signature, code canonique): (distance, mouvement canonique)},
+            du moins au plus récent.
+        codecs (dict): {signature: CodecEtat} des états déjà rencontrés.
+    """
+    # Nombre maximal de codecs gardés (un par signature ; les bases ne font que raccourcir au fil d'une partie)
+    NB_CODECS_MAX = 1000
+
+    def __init__(self, taille_max=50000):
+        self.taille_max = taille_max
+        self.entrees = OrderedDict()
+        self.codecs = {}
+
+    def __len__(self):
+        return len(self.entrees)
+
+    @staticmethod
+    def appliquer(etat_tuple, mouvement):
+        """
+        Applique un mouvement (numéros de tour 1-basés) à un état, sans vérification.
+
+        Args:
+            etat_tuple (tuple): L'état sous forme de tuple de tuples (fond -> sommet).
+            mouvement (tuple[int, int]): (tour départ, tour arrivée).
+
+        Returns:
+            tuple: Le nouvel état.
+        """
+        depart, arrivee = mouvement[0] - 1, mouvement[1] - 1
+        tours = list(etat_tuple)
+        tours[arrivee] = tours[arrivee] + tours[depart][-1:]
+        tours[depart] = tours[depart][:-1]
+        return tuple(tours)
+
+    def cle(self, etat_tuple, idx_tour_cible=None):
+        """
+        Calcule la clé canonique d'un état.
+
+        Args:
+            etat_tuple (tuple): L'état.
+            idx_tour_cible (int | None): Index 0-basé de la tour cible (la dernière si None).
+
+        Returns:
+            tuple[tuple, list[int] | None]: (clé, permutation telle que la tour i de l'état
+            canonique soit la tour permutation[i] de l'état donné, ou None si l'état est
+            déjà canonique).
+        """
+        nb_tours = len(etat_tuple)
+        if idx_tour_cible is None:
+            idx_tour_cible = nb_tours - 1
+        bases = tuple(contenu[:CodecEtat.longueur_base(contenu)] for contenu in etat_tuple)
+        signature = (idx_tour_cible, bases, tuple(sorted(taille for contenu in etat_tuple for taille in contenu)))
+        codec = self.codecs.get(signature)
+        if codec is None:
+            if len(self.codecs) >= self.NB_CODECS_MAX:
+                self.codecs.clear()
+            codec = self.codecs[signature] = CodecEtat(etat_tuple, nb_tours)
+        interchangeables = [idx_tour for idx_tour in range(nb_tours) if idx_tour != idx_tour_cible]
+        code, permutation = codec.canoniser(codec.encoder(etat_tuple), interchangeables)
+        return (signature, code), permutation
+
+    def enregistrer(self, etat_tuple, distance, mouvement, idx_tour_cible=None):
+        """
+        Ajoute ou rafraîchit un état, en oubliant le plus ancien si la taille maximale est atteinte.
+
+        Args:
+            etat_tuple (tuple): L'état.
+            distance (int): Nombre de mouvements restant jusqu'à l'objectif.
+            mouvement (tuple[int, int] | None): Meilleur prochain mouvement (None à l'objectif).
+            idx_tour_cible (int | None): Index 0-basé de la tour cible (la dernière si None).
+        """
+        cle, permutation = self.cle(etat_tuple, idx_tour_cible)
+        if mouvement is not None and permutation is not None:
+            # Numéro de tour réel -> numéro dans l'état canonique
+            canonique = {idx_reel + 1: idx_canonique + 1 for idx_canonique, idx_reel in enumerate(permutation)}
+            mouvement = (canonique[mouvement[0]], canonique[mouvement[1]])
+        self.entrees[cle] = (distance, mouvement)
+        self.entrees.move_to_end(cle)
+        if len(self.entrees) > self.taille_max:
+            self.entrees.popitem(last=False)
+
+    def enregistrer_solution(self, etat_initial_tuple, mouvements, idx_tour_cible=None):
+        """
+        Enregistre tous les états d'une solution optimale.
+
+        Les états sont insérés de l'objectif vers le départ, pour que les plus
+        proches du départ (les prochains demandés) soient les derniers oubliés ;
+        ceux qui seraient oubliés aussitôt (au-delà de taille_max) ne sont pas calculés.
+
+        Args:
+            etat_initial_tuple (tuple): L'état de départ de la solution.
+            mouvements (list[tuple[int, int]]): Les mouvements optimaux (tour départ, tour arrivée).
+            idx_tour_cible (int | None): Index 0-basé de la tour cible (la dernière si None).
+        """
+        nb_gardes = min(len(mouvements) + 1, self.taille_max)
+        etats = [etat_initial_tuple]
+        for mouvement in mouvements[:nb_gardes - 1]:
+            etats.append(self.appliquer(etats[-1], mouvement))
+
+        for i in range(nb_gardes - 1, -1, -1):
+            mouvement = mouvements[i] if i < len(mouvements) else None
+            self.enregistrer(etats[i], len(mouvements) - i, mouvement, idx_tour_cible)
+
+    def consulter(self, etat_tuple, idx_tour_cible=None):
+        """
+        Cherche un état dans le cache.
+
+        Args:
+            etat_tuple (tuple): L'état.
+            idx_tour_cible (int | None): Index 0-basé de la tour cible (la dernière si None).
+
+        Returns:
+            tuple[int, tuple[int, int] | None] | None: (distance, prochain mouvement en numéros
+            des tours de etat_tuple), ou None si absent.
+        """
+        cle, permutation = self.cle(etat_tuple, idx_tour_cible)
+        entree = self.entrees.get(cle)
+        if entree is None:
+            return None
+        self.entrees.move_to_end(cle)
+        distance, mouvement = entree
+        if mouvement is not None and permutation is not None:
+            mouvement = (permutation[mouvement[0] - 1] + 1, permutation[mouvement[1] - 1] + 1)
+        return distance, mouvement
+
+    def mouvements_depuis(self, etat_tuple, idx_tour_cible=None):
+        """
+        Reconstitue la solution complète depuis un état, en suivant les prochains mouvements du cache.
+
+        Args:
+            etat_tuple (tuple): L'état de départ.
+            idx_tour_cible (int | None): Index 0-basé de la tour cible (la dernière si None).
+
+        Returns:
+            list[tuple[int, int]] | None: Les mouvements, ou None si la chaîne est incomplète.
+        """
+        mouvements = []
+        entree = self.consulter(etat_tuple, idx_tour_cible)
+        while entree is not None and entree[1] is not None:
+            mouvements.append(entree[1])
+            etat_tuple = self.appliquer(etat_tuple, entree[1])
+            entree = self.consulter(etat_tuple, idx_tour_cible)
+        if entree is None:
+            return None
+        return mouvements
@@ -0,0 +1,379 @@
+from array import array
+
+
+class CodecEtat:
+    """
+    Encode un état du jeu dans un seul entier pour la recherche A*.
+
+    Chaque disque (classé par rang, 0 = le plus petit) occupe `bits_tour` bits
+    donnant sa tour. Une configuration illégale (mode aléatoire) est décrite en
+    plus par la longueur de la « base » de chaque tour : la partie basse, figée
+    dans l'ordre de départ, qui ne respecte pas les règles. Au-dessus d'une base,
+    les disques sont forcément empilés du plus grand au plus petit, donc leur
+    tour suffit à retrouver leur ordre.
+
+    Disposition des bits (du poids faible au poids fort) :
+        [tour du disque 0] ... [tour du disque n-1] [base tour 0] ... [base tour k-1]
+
+    Attributs:
+        nb_tours (int): Nombre de tours.
+        tailles_asc (list[int]): Tailles des disques du plus petit au plus grand.
+        bases (list[tuple[int]]): Rangs des disques de la base de chaque tour (fond -> sommet).
+        bits_tour (int): Nombre de bits pour la tour d'un disque.
+        bits_base (int): Nombre de bits pour la longueur d'une base.
+    """
+    def __init__(self, etat_initial_tuple, nb_tours=None):
+        self.nb_tours = nb_tours if nb_tours is not None else len(etat_initial_tuple)
+        self.tailles_asc = sorted(taille for contenu_tour in etat_initial_tuple for taille in contenu_tour)
+        self.rang = {taille: i for i, taille in enumerate(self.tailles_asc)}
+        self.nb_disques = len(self.tailles_asc)
+
+        self.bits_tour = max(1, (self.nb_tours - 1).bit_length())
+        self.bits_base = max(1, self.nb_disques.bit_length())
+        self.decalage_bases = self.nb_disques * self.bits_tour
+        self.masque_tour = (1 << self.bits_tour) - 1
+        self.masque_base = (1 << self.bits_base) - 1
+
+        # Bit de poids faible de chaque champ « tour d'un disque »
+        self.masque_unites = sum(1 << (i * self.bits_tour) for i in range(self.nb_disques))
+        self.masque_disques = self.masque_unites * self.masque_tour
+        # Motif « tous les disques sur la tour j », pour chaque j
+        self.motifs_tours = [self.masque_unites * j for j in range(self.nb_tours)]
+
+        self.bases = []
+        self.reductions = []
+        self.masques_bases = []
+        for idx_tour in range(self.nb_tours):
+            contenu = etat_initial_tuple[idx_tour] if idx_tour < len(etat_initial_tuple) else ()
+            rangs = tuple(self.rang[taille] for taille in contenu)
+            base = rangs[:self.longueur_base(rangs)]
+            self.bases.append(base)
+            # Longueur canonique de la base une fois réduite à m disques
+            self.reductions.append([self.longueur_base(base[:m]) for m in range(len(base) + 1)])
+            masques = [0]
+            for rang in base:
+                masques.append(masques[-1] | (1 << (rang * self.bits_tour)))
+            self.masques_bases.append(masques)
+        # Champ « longueur de la base » de chaque tour
+        self.champs_bases = [self.masque_base << (self.decalage_bases + idx_tour * self.bits_base)
+                             for idx_tour in range(self.nb_tours)]
+
+    @staticmethod
+    def longueur_base(rangs):
+        """
+        Calcule la longueur de la partie illégale en bas d'une tour.
+
+        La base s'arrête au dernier disque posé sur un disque plus petit que lui :
+        tout ce qui est au-dessus est empilé légalement.
+
+        Args:
+            rangs (tuple[int]): Contenu de la tour (fond -> sommet).
+
+        Returns:
+            int: Nombre de disques de la base (0 si la tour est légale).
+        """
+        for i in range(len(rangs) - 1, 0, -1):
+            if rangs[i] > rangs[i - 1]:
+                return i + 1
+        return 0
+
+    def lire_base(self, code, idx_tour):
+        """
+        Lit la longueur de la base d'une tour dans un état encodé.
+
+        Args:
+            code (int): L'état encodé.
+            idx_tour (int): Index 0-basé de la tour.
+
+        Returns:
+            int: Longueur de la base.
+        """
+        return (code >> (self.decalage_bases + idx_tour * self.bits_base)) & self.masque_base
+
+    def lire_tour(self, code, rang):
+        """
+        Lit la tour d'un disque dans un état encodé.
+
+        Args:
+            code (int): L'état encodé.
+            rang (int): Rang du disque (0 = le plus petit).
+
+        Returns:
+            int: Index 0-basé de la tour.
+        """
+        return (code >> (rang * self.bits_tour)) & self.masque_tour
+
+    def encoder(self, etat_tuple):
+        """
+        Encode un état (tuple de tuples de tailles) en entier.
+
+        Args:
+            etat_tuple (tuple): L'état sous forme de tuple de tuples (fond -> sommet).
+
+        Returns:
+            int: L'état encodé.
+
+        Raises:
+            ValueError: Si la partie illégale d'une tour ne provient pas de l'état initial du codec.
+        """
+        code = 0
+        for idx_tour, contenu_tour in enumerate(etat_tuple):
+            rangs = tuple(self.rang[taille] for taille in contenu_tour)
+            for rang in rangs:
+                code |= idx_tour << (rang * self.bits_tour)
+            longueur = self.longueur_base(rangs)
+            if rangs[:longueur] != self.bases[idx_tour][:longueur]:
+                raise ValueError("État non représentable par ce codec.")
+            code |= longueur << (self.decalage_bases + idx_tour * self.bits_base)
+        return code
+
+    def decoder(self, code):
+        """
+        Décode un entier en état (tuple de tuples de tailles).
+
+        Args:
+            code (int): L'état encodé.
+
+        Returns:
+            tuple: L'état sous forme de tuple de tuples (fond -> sommet).
+        """
+        contenus = []
+        for idx_tour in range(self.nb_tours):
+            longueur = self.lire_base(code, idx_tour)
+            base = self.bases[idx_tour][:longueur]
+            libres = [rang for rang in range(self.nb_disques - 1, -1, -1)
+                      if self.lire_tour(code, rang) == idx_tour and rang not in base]
+            contenus.append(tuple(self.tailles_asc[rang] for rang in base + tuple(libres)))
+        return tuple(contenus)
+
+    def encoder_tours(self, tours):
+        """
+        Encode directement une liste d'objets Tour.
+
+        Args:
+            tours (list[Tour]): Les tours du jeu.
+
+        Returns:
+            int: L'état encodé.
+        """
+        return self.encoder(tuple(tuple(tour.tailles) for tour in tours))
+
+    def decoder_tours(self, code, tours):
+        """
+        Replace les disques existants des tours selon un état encodé
+        (appeler ensuite JeuHanoi.recalculer_disques_places).
+
+        Args:
+            code (int): L'état encodé.
+            tours (list[Tour]): Les tours du jeu.
+        """
+        for tour, contenu_tour in zip(tours, self.decoder(code)):
+            tour.tailles = array('B', contenu_tour)
+
+    def code_objectif(self, idx_tour_cible):
+        """
+        Encode l'état final : tous les disques sur la tour cible, sans base.
+
+        Args:
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            int: L'état objectif encodé.
+        """
+        return self.motifs_tours[idx_tour_cible]
+
+    def masque_tour_egale(self, code, idx_tour):
+        """
+        Renvoie un masque ayant le bit de poids faible de chaque disque posé sur idx_tour.
+
+        Args:
+            code (int): L'état encodé.
+            idx_tour (int): Index 0-basé de la tour.
+
+        Returns:
+            int: Masque des disques de la tour.
+        """
+        x = (code ^ self.motifs_tours[idx_tour]) & self.masque_disques
+        reduit = x
+        for decalage in range(1, self.bits_tour):
+            reduit |= x >> decalage
+        return self.masque_unites & ~reduit
+
+    def sommets(self, code):
+        """
+        Trouve le disque au sommet de chaque tour.
+
+        Args:
+            code (int): L'état encodé.
+
+        Returns:
+            list[int]: Rang du disque au sommet de chaque tour, -1 si la tour est vide.
+        """
+        sommets = []
+        for idx_tour in range(self.nb_tours):
+            longueur = self.lire_base(code, idx_tour)
+            libres = self.masque_tour_egale(code, idx_tour) & ~self.masques_bases[idx_tour][longueur]
+            if libres:
+                sommets.append(((libres & -libres).bit_length() - 1) // self.bits_tour)
+            elif longueur:
+                sommets.append(self.bases[idx_tour][longueur - 1])
+            else:
+                sommets.append(-1)
+        return sommets
+
+    def deplacer(self, code, sommets, idx_source, idx_dest):
+        """
+        Applique le déplacement du sommet de idx_source vers idx_dest (supposé valide).
+
+        Args:
+            code (int): L'état encodé.
+            sommets (list[int]): Sommets de l'état (voir `sommets`).
+            idx_source (int): Index 0-basé de la tour source.
+            idx_dest (int): Index 0-basé de la tour destination.
+
+        Returns:
+            int: Le nouvel état encodé.
+        """
+        rang = sommets[idx_source]
+        nouveau = code ^ ((idx_source ^ idx_dest) << (rang * self.bits_tour))
+        longueur = self.lire_base(code, idx_source)
+        if longueur and self.bases[idx_source][longueur - 1] == rang:
+            # Le disque quittait la base : on la raccourcit à sa longueur canonique
+            decalage = self.decalage_bases + idx_source * self.bits_base
+            reduite = self.reductions[idx_source][longueur - 1]
+            nouveau ^= (longueur ^ reduite) << decalage
+        return nouveau
+
+    def generer_voisins(self, code):
+        """
+        Génère tous les états voisins valides d'un état encodé.
+
+        Args:
+            code (int): L'état encodé.
+
+        Returns:
+            list: Liste de tuples (code voisin, (index_tour_source, index_tour_destination)).
+        """
+        voisins = []
+        sommets = self.sommets(code)
+        for idx_source, rang in enumerate(sommets):
+            if rang < 0:
+                continue
+            for idx_dest, rang_dest in enumerate(sommets):
+                if idx_dest != idx_source and (rang_dest < 0 or rang < rang_dest):
+                    voisins.append((self.deplacer(code, sommets, idx_source, idx_dest), (idx_source, idx_dest)))
+        return voisins
+
+    def nb_disques_hors_cible(self, code, idx_tour_cible):
+        """
+        Compte les disques qui ne sont pas sur la tour cible.
+
+        Args:
+            code (int): L'état encodé.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            int: Nombre de disques hors de la tour cible.
+        """
+        return self.nb_disques - bin(self.masque_tour_egale(code, idx_tour_cible)).count("1")
+
+    def disques_mal_places(self, code, idx_tour_cible):
+        """
+        Heuristique admissible et cohérente pour n'importe quel nombre de tours :
+        un disque hors de la tour cible doit bouger au moins une fois, un disque
+        sur la cible mais pas dans la bonne pile du fond (les plus grands, dans
+        l'ordre) doit en partir puis y revenir.
+
+        Args:
+            code (int): L'état encodé.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            int: Nombre de disques hors cible + 2 x nombre de disques mal placés sur la cible.
+        """
+        masque_cible = self.masque_tour_egale(code, idx_tour_cible)
+        sur_cible = bin(masque_cible).count("1")
+
+        # Longueur de la pile correcte au fond de la cible : d'abord la base, puis les disques libres
+        longueur = self.lire_base(code, idx_tour_cible)
+        attendu = self.nb_disques - 1
+        bien_places = 0
+        for rang in self.bases[idx_tour_cible][:longueur]:
+            if rang != attendu:
+                break
+            bien_places += 1
+            attendu -= 1
+        else:
+            libres = masque_cible & ~self.masques_bases[idx_tour_cible][longueur]
+            while attendu >= 0 and libres >> (attendu * self.bits_tour) & 1:
+                bien_places += 1
+                attendu -= 1
+        return self.nb_disques - sur_cible + 2 * (sur_cible - bien_places)
+
+    def canoniser(self, code, tours_interchangeables):
+        """
+        Ramène un état à un représentant de sa classe de symétrie : les tours
+        interchangeables (que l'objectif ne distingue pas, par exemple les tours
+        autres que la cible) qui n'ont pas de base ont la même distance à l'objectif
+        une fois échangées ; elles sont donc renumérotées par ordre décroissant de
+        leur plus grand disque (les tours vides en dernier).
+
+        Une tour avec une base n'est jamais échangée : sa base appartient à son index
+        (voir bases), et l'état échangé ne serait pas accessible depuis le départ.
+
+        Args:
+            code (int): L'état encodé.
+            tours_interchangeables (list[int]): Index 0-basés des tours que l'objectif ne distingue pas.
+
+        Returns:
+            tuple[int, list[int] | None]: (état canonique encodé, permutation telle que la
+            tour i de l'état canonique soit la tour permutation[i] de l'état donné, ou None
+            si l'état est déjà canonique).
+        """
+        libres = [idx_tour for idx_tour in tours_interchangeables if not code & self.champs_bases[idx_tour]]
+        if len(libres) < 2:
+            return code, None
+        masques = [self.masque_tour_egale(code, idx_tour) for idx_tour in libres]
+        if len(libres) == 2:
+            # Cas des 3 tours : un seul échange possible
+            if masques[0] >= masques[1]:
+                return code, None
+            ordre = [1, 0]
+        else:
+            ordre = sorted(range(len(libres)), key=masques.__getitem__, reverse=True)
+            if ordre == list(range(len(libres))):
+                return code, None
+
+        permutation = list(range(self.nb_tours))
+        canonique = code
+        for position, i in zip(libres, ordre):
+            permutation[position] = libres[i]
+            # Le champ « tour » de chacun de ces disques passe de libres[i] à position
+            canonique ^= masques[i] * (libres[i] ^ position)
+        return canonique, permutation
+
+    def chemin_reel(self, canoniser, code_depart, chemin_canonique):
+        """
+        Convertit un chemin trouvé sur les états canoniques en mouvements entre les
+        vraies tours, en suivant la correspondance des numérotations d'un état à l'autre.
+
+        Args:
+            canoniser (callable): code -> (code canonique, permutation ou None), voir canoniser.
+            code_depart (int): L'état de départ réel encodé.
+            chemin_canonique (list[tuple[int, int]]): Mouvements (dans la numérotation de
+                l'état canonique d'où chacun part), de l'objectif vers le départ.
+
+        Returns:
+            list[tuple[int, int]]: Mouvements 0-indexés réels, de l'objectif vers le départ.
+        """
+        code, permutation = canoniser(code_depart)
+        # vraie_tour[i] : tour réelle correspondant à la tour i de l'état canonique courant
+        vraie_tour = permutation if permutation is not None else list(range(self.nb_tours))
+        chemin = []
+        for idx_source, idx_dest in reversed(chemin_canonique):
+            chemin.append((vraie_tour[idx_source], vraie_tour[idx_dest]))
+            code, permutation = canoniser(self.deplacer(code, self.sommets(code), idx_source, idx_dest))
+            if permutation is not None:
+                vraie_tour = [vraie_tour[i] for i in permutation]
+        chemin.reverse()
+        return chemin
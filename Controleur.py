@@ -2,6 +2,10 @@ from JeuHanoi import JeuHanoi
 from Quiz import Quiz
 from Vue import Vue
 from Tour import Tour 
+from SolveurArrierePlan import SolveurArrierePlan
+from MoteurIndices import MoteurIndices
+from LecteurSolution import LecteurSolution
+from MoteurPartie import MoteurPartie
 import tkinter as tk
 from tkinter import messagebox, simpledialog
 import datetime
@@ -15,18 +19,39 @@ class Controleur:
         jeuhanoi (JeuHanoi): L'objet principal du jeu.
         vue (Vue): L'interface graphique.
         quiz (Quiz): Le gestionnaire de quiz.
+        moteur (MoteurPartie): Les règles de la partie (coups, quiz, victoire, score), sans affichage.
+        lecteur (LecteurSolution): Joue la résolution automatique à vitesse réglable.
+        moteur_indices (MoteurIndices): Calcule le coup conseillé par « Aide-moi » en temps borné.
+        nb_tours (int): Nombre de tours des nouvelles parties.
     """
+    # Vitesse de lecture de la résolution automatique au niveau 0 (un coup toutes les 400 ms)
+    VITESSE_BASE = 2.5
+    # Nombre maximal de disques proposé
+    NB_DISQUES_MAX = 20
+    # Nombre maximal de tours proposé
+    NB_TOURS_MAX = 6
+    # Temps accordé au calcul d'un indice, en secondes
+    DELAI_AIDE = 0.05
+
     def __init__(self):
+        self.nb_tours = 3
         self.jeuhanoi = JeuHanoi()
         self.quiz = Quiz()
+        self.moteur = MoteurPartie(self.quiz)
         self.vue = Vue(self)
+        # Résolutions A* lancées hors de la boucle Tk
+        self.solveur_fond = SolveurArrierePlan(self.vue.fenetre)
+        # Indices en temps borné, avec le même cache que les résolutions complètes
+        self.moteur_indices = MoteurIndices(self.DELAI_AIDE, self.solveur_fond.cache)
+        # Lecture des solutions : plusieurs coups par image, rendu à cadence fixe
+        self.lecteur = LecteurSolution(self.vue.fenetre, self.VITESSE_BASE)
         
         # Charger les questions du quiz
         self.quiz.charger_questions_csv("dico_quizz_tour.csv")
         
         # Variables pour la sélection des tours
         self.tour_selectionnee = None
-        self.dernier_coup_correct = False
+        self.victoire_annoncee = False
         
         
         # Démarrer une partie par défaut
@@ -46,12 +71,21 @@ class Controleur:
         Returns:
             None
         """
-        self.nb_disques = nb_disques
-        self.jeuhanoi = JeuHanoi(nb_disques)
-        self.jeuhanoi.initialiser_disques(mode_aleatoire)
-        self.jeuhanoi.demarrer_chrono()
+        # Une résolution de la partie précédente n'a plus de sens
+        self.solveur_fond.annuler()
+        self.lecteur.arreter()
+        self.vue.afficher_progression("")
+
+        self.jeuhanoi = self.moteur.demarrer_partie(nb_disques, mode_aleatoire, self.nb_tours)
+        # Les bases de motifs (3 tours) manquantes sont calculées hors de la boucle Tk, puis seulement chargées
+        self.moteur_indices.oublier()
+        jeu = self.jeuhanoi
+        if self.nb_tours == 3:
+            self.solveur_fond.preparer_bases_motifs(nb_disques, lambda: self.preparer_indices(jeu))
+        else:
+            self.preparer_indices(jeu)
         self.tour_selectionnee = None
-        self.dernier_coup_correct = False
+        self.victoire_annoncee = False
         self.vue.tour_selectionnee = None
         
         # Mettre à jour l'interface
@@ -71,37 +105,37 @@ class Controleur:
         Returns:
             None
         """
-        if self.jeuhanoi.jouer_coup(tour_depart, tour_arrivee):
-            # Marquer le coup comme correct
-                self.dernier_coup_correct = True
-
-            # Mettre à jour l'interface
-                self.vue.mettre_a_jour_interface(self.jeuhanoi)
-
-                # Poser une question de quiz après un coup 'correct' sur la tour 3
-                # Ne pas poser de question si on est en mode résolution automatique
-
-                if self.dernier_coup_correct and (tour_arrivee.numero == 3) and (tour_arrivee.disques[-1].taille == self.nb_disques+1) and resolution_auto == False:
-                    self.nb_disques-=1
-                    question, _ = self.quiz.poser_question()
-                    self.vue.afficher_quiz(question)
-                    
-                # Vérifier si le joueur a gagné
-                if self.jeuhanoi.gagner():
-                    self.jeuhanoi.arreter_chrono()
-                    score_final = max(1000 - self.jeuhanoi.nbr_coups * 10 - int(self.jeuhanoi.chrono) * 5, 0)
-                    self.jeuhanoi.ajouter_score(score_final)
-                    self.vue.mettre_a_jour_interface(self.jeuhanoi)
-                    if self.jeuhanoi.mode_jeu =='auto':
-                        messagebox.showinfo("Résolution époustouflante", 
-                        f"Résolution automatique en {self.jeuhanoi.nbr_coups} coups et {int(self.jeuhanoi.chrono)} secondes!")
-        
-                    else: 
-                        messagebox.showinfo("Félicitations", 
-                                    f"Vous avez gagné en {self.jeuhanoi.nbr_coups} coups et {int(self.jeuhanoi.chrono)} secondes!")
-        else:
-            self.dernier_coup_correct = False
-        
+        if self.moteur.jouer_coup(tour_depart.numero, tour_arrivee.numero, resolution_auto):
+            # Mettre à jour l'interface (seul le disque déplacé est redessiné)
+            self.vue.afficher_deplacement(self.jeuhanoi, tour_arrivee)
+
+            # Le moteur pose une question de quiz après un coup 'correct' sur la tour cible
+            # (jamais en mode résolution automatique)
+            if self.moteur.question_en_attente is not None:
+                self.vue.afficher_quiz(self.moteur.question_en_attente)
+
+            # Vérifier si le joueur a gagné
+            self.annoncer_victoire()
+
+    def annoncer_victoire(self):
+        """
+        Affiche le score final une fois la victoire constatée par le moteur.
+
+        Returns:
+            None
+        """
+        if not self.moteur.gagnee or self.victoire_annoncee:
+            return
+        self.victoire_annoncee = True
+        self.vue.afficher_informations(self.jeuhanoi)
+        if self.jeuhanoi.mode_jeu =='auto':
+            messagebox.showinfo("Résolution époustouflante", 
+            f"Résolution automatique en {self.jeuhanoi.nbr_coups} coups et {int(self.jeuhanoi.chrono)} secondes!")
+
+        else: 
+            messagebox.showinfo("Félicitations", 
+                        f"Vous avez gagné en {self.jeuhanoi.nbr_coups} coups et {int(self.jeuhanoi.chrono)} secondes!")
+
     def traiter_clic_tour(self, numero_tour):
         """
         Gère la logique de sélection/déplacement à partir du clic utilisateur.
@@ -127,45 +161,140 @@ class Controleur:
                 self.gerer_deplacement_joueur(self.tour_selectionnee, tour)
             
             # Désélectionner la tour
-            self.tour_selectionnee = None
-            self.vue.tour_selectionnee = None
-            self.vue.afficher_tout(self.jeuhanoi)
+            self.deselectionner()
 
 
 
     def demarrer_resolution_auto(self):
         """
         Lance la résolution automatique du problème.
+        Une configuration légale est jouée directement ; sinon la recherche tourne
+        en arrière-plan et les mouvements sont joués à sa réception.
 
         Returns:
             None
         """
-        # Réinitialiser le jeu
-        nb_disques = self.jeuhanoi.nombre_disques
+        self.lecteur.arreter()
+        self.jeuhanoi.mode_jeu = 'auto'
+        if self.jeuhanoi.a_solution_directe():
+            # Solution sans recherche, générée au fil de la lecture
+            self.solveur_fond.annuler()
+            self.lancer_lecture(self.jeuhanoi.generer_mouvements_optimaux())
+            return
+        self.vue.afficher_progression("Recherche de la solution...")
+        self.solveur_fond.lancer(self.jeuhanoi, self.executer_resolution_auto,
+                                 self.afficher_progression_solveur)
 
-        
-        # Obtenir la séquence de mouvements
-        mouvements = self.jeuhanoi.resoudre_automatiquement()
-        
-        # Exécuter les mouvements avec un délai
-        def executer_mouvement(index):
-            if index < len(mouvements):
-                depart, arrivee = mouvements[index]
-                self.gerer_deplacement_joueur(
-                    self.jeuhanoi.tours[depart-1], 
-                    self.jeuhanoi.tours[arrivee-1], True
-                )
-            
-                self.vue.fenetre.after(400, lambda: executer_mouvement(index + 1))
-        
-        # Démarrer l'exécution automatique
-        self.vue.fenetre.after(400, lambda: executer_mouvement(0))
-        
+    def executer_resolution_auto(self, etat_resolu, mouvements):
+        """
+        Joue les mouvements reçus du solveur, à la vitesse choisie.
+
+        Args:
+            etat_resolu (tuple): L'état à partir duquel la solution a été calculée.
+            mouvements (list[tuple[int, int]]): Les mouvements (tour départ, tour arrivée).
+
+        Returns:
+            None
+        """
+        self.vue.afficher_progression("")
+        if etat_resolu != self.jeuhanoi.etat_tuple():
+            # Le joueur a bougé un disque pendant la recherche : on recommence
+            self.demarrer_resolution_auto()
+            return
+        self.lancer_lecture(mouvements)
+
+    def lancer_lecture(self, mouvements):
+        """
+        Joue des mouvements sur la partie : plusieurs coups par image à grande vitesse,
+        l'affichage n'étant rafraîchi qu'une fois par image.
+
+        Args:
+            mouvements (iterable): Les mouvements (tour départ, tour arrivée).
+
+        Returns:
+            None
+        """
+        self.lecteur.lancer(lambda lot: self.moteur.jouer_coups(lot, resolution_auto=True), mouvements,
+                            lambda: self.vue.afficher_tout(self.jeuhanoi),
+                            self.terminer_lecture)
+
+    def terminer_lecture(self, complete):
+        """
+        Appelée à la fin de la lecture d'une solution.
+
+        Args:
+            complete (bool): True si tous les mouvements ont été joués.
+
+        Returns:
+            None
+        """
+        self.annoncer_victoire()
+
+    def aller_a_la_fin(self):
+        """
+        Joue d'un coup tous les mouvements restants de la résolution automatique, sans les afficher.
+
+        Returns:
+            None
+        """
+        self.lecteur.aller_a_la_fin()
+
+    def changer_vitesse(self, niveau):
+        """
+        Règle la vitesse de la résolution automatique.
+
+        Args:
+            niveau (float): Chaque niveau multiplie la vitesse par 10 (0 = un coup toutes les 400 ms).
+
+        Returns:
+            None
+        """
+        self.lecteur.changer_vitesse(self.VITESSE_BASE * 10 ** niveau)
+
+    def annuler_coup(self):
+        """
+        Annule le dernier coup de la partie en cours (ignoré pendant une résolution automatique).
+
+        Returns:
+            None
+        """
+        if not self.jeuhanoi.etat_partie or self.lecteur.en_cours():
+            return
+        if self.moteur.annuler_coup() is not None:
+            self.deselectionner()
+            self.vue.afficher_tout(self.jeuhanoi)
+
+    def retablir_coup(self):
+        """
+        Rejoue le dernier coup annulé de la partie en cours.
+
+        Returns:
+            None
+        """
+        if not self.jeuhanoi.etat_partie or self.lecteur.en_cours():
+            return
+        if self.moteur.retablir_coup() is not None:
+            self.deselectionner()
+            self.vue.afficher_tout(self.jeuhanoi)
+            if self.moteur.question_en_attente is not None:
+                self.vue.afficher_quiz(self.moteur.question_en_attente)
+            self.annoncer_victoire()
+
+    def deselectionner(self):
+        """
+        Annule la sélection de tour en cours.
+
+        Returns:
+            None
+        """
+        self.tour_selectionnee = None
+        self.vue.tour_selectionnee = None
+        self.vue.afficher_selection()
 
     def demander_aide(self):
         """
-        Récupère le premier mouvement de la résolution automatique
-        et l'exécute pour aider le joueur.
+        Exécute le coup conseillé par le moteur d'indices, calculé en DELAI_AIDE
+        secondes au plus, et signale s'il n'est pas prouvé optimal.
 
         Returns:
             None
@@ -174,22 +303,65 @@ class Controleur:
             messagebox.showinfo("Aide", "Aucune partie en cours pour recevoir de l'aide.")
             return
 
-        # Obtenir la séquence complète de mouvements à partir de l'état actuel
-        mouvements_aide = self.jeuhanoi.resoudre_automatiquement() #
-        
-        if mouvements_aide: # S'il y a des mouvements disponibles
-            # Récupérer le tout premier mouvement
-            depart_num, arrivee_num = mouvements_aide[0] 
+        self.solveur_fond.annuler()
+        mouvement, prouve = self.moteur_indices.indice(self.jeuhanoi)
+        if mouvement is None:
+            if prouve:
+                messagebox.showinfo("Aide", "Les disques sont déjà rangés sur la tour cible.")
+            else:
+                messagebox.showinfo("Aide", "L'aide se prépare encore, réessayez dans un instant.")
+            return
+        self.jouer_aide(mouvement)
+        if not prouve:
+            self.vue.afficher_progression("Indice rapide : coup non prouvé optimal")
 
-            # Convertir les numéros de tour (1, 2, 3) en objets Tour (0-indexés)
-            tour_depart_obj = self.jeuhanoi.tours[depart_num - 1]
-            tour_arrivee_obj = self.jeuhanoi.tours[arrivee_num - 1]
+    def preparer_indices(self, jeu):
+        """
+        Prépare le moteur d'indices pour une partie, une fois ses bases de motifs
+        enregistrées (sans rien calculer dans la boucle Tk).
 
-            # Exécuter ce premier mouvement
-            self.jeuhanoi.mode_jeu = 'manuel'
-            self.gerer_deplacement_joueur(tour_depart_obj, tour_arrivee_obj, resolution_auto=False) 
-            
+        Args:
+            jeu (JeuHanoi): La partie pour laquelle la préparation a été demandée.
 
+        Returns:
+            None
+        """
+        if jeu is self.jeuhanoi:
+            self.moteur_indices.preparer(jeu, construire=False)
+
+    def jouer_aide(self, mouvement):
+        """
+        Exécute le coup conseillé par le moteur d'indices sur la partie en cours.
+
+        Args:
+            mouvement (tuple[int, int]): Le coup conseillé (tour départ, tour arrivée).
+
+        Returns:
+            None
+        """
+        self.vue.afficher_progression("")
+        depart_num, arrivee_num = mouvement
+
+        # Convertir les numéros de tour (1, 2, 3) en objets Tour (0-indexés)
+        tour_depart_obj = self.jeuhanoi.tours[depart_num - 1]
+        tour_arrivee_obj = self.jeuhanoi.tours[arrivee_num - 1]
+
+        # Exécuter ce mouvement
+        self.jeuhanoi.mode_jeu = 'manuel'
+        self.gerer_deplacement_joueur(tour_depart_obj, tour_arrivee_obj, resolution_auto=False)
+
+    def afficher_progression_solveur(self, nb_developpes):
+        """
+        Affiche l'avancement de la recherche en cours.
+
+        Args:
+            nb_developpes (int): Nombre d'états développés par A*.
+
+        Returns:
+            None
+        """
+        self.vue.afficher_progression(f"Recherche : {nb_developpes} états explorés...")
+            
 
 
 
@@ -219,10 +391,28 @@ class Controleur:
         """
         try:
             nb = int(nombre_disques)
-            if 3 <= nb <= 8:  # Limiter entre 3 et 8 disques
+            if 3 <= nb <= self.NB_DISQUES_MAX:  # Limiter entre 3 et NB_DISQUES_MAX disques
                 self.demarrer_partie(nb, False)
         except ValueError:
             pass
+
+    def config_nbr_tours(self, nombre_tours):
+        """
+        Configure le nombre de tours et relance une partie (la dernière tour est l'arrivée).
+
+        Args:
+            nombre_tours (int): Nombre de tours choisi par l'utilisateur.
+
+        Returns:
+            None
+        """
+        try:
+            nb = int(nombre_tours)
+            if 3 <= nb <= self.NB_TOURS_MAX:
+                self.nb_tours = nb
+                self.demarrer_partie(self.jeuhanoi.nombre_disques, False)
+        except ValueError:
+            pass
         
 
     def gerer_reponse_quiz(self, reponse):
@@ -235,22 +425,17 @@ class Controleur:
         Returns:
             None
         """
-        if not self.jeuhanoi.etat_partie:
+        resultat = self.moteur.repondre_quiz(reponse)
+        if resultat is None:
             return
-            
-        if self.quiz.verifier_reponse(reponse):
-            # Bonne réponse: bonus de temps
-            bonus = self.quiz.attribuer_bonus_temps()
-            self.jeuhanoi.temps_debut = max(0, self.jeuhanoi.temps_debut + bonus)
-            messagebox.showinfo("Correct!", f"Bonne réponse! -{bonus} secondes.")
+
+        correcte, secondes = resultat
+        if correcte:
+            messagebox.showinfo("Correct!", f"Bonne réponse! -{secondes} secondes.")
         else:
-            # Mauvaise réponse: malus de temps
-            malus = self.quiz.attribuer_malus_temps()
-            self.jeuhanoi.temps_debut -= malus
             messagebox.showinfo("Incorrect", 
                                f"Mauvaise réponse. La réponse correcte était: {self.quiz.reponse_attendue}. "
-                               f" +{malus} secondes")
+                               f" +{secondes} secondes")
         
-        # Mettre à jour l'interface
-        self.vue.mettre_a_jour_interface(self.jeuhanoi)
-
+        # Mettre à jour l'interface (rien n'a bougé sur le plateau)
+        self.vue.afficher_informations(self.jeuhanoi)
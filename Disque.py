@@ -6,10 +6,19 @@ class Disque:
     """
     Représente un disque du jeu.
 
+    Les disques sont des valeurs (taille et couleur) : Disque.partage renvoie
+    une instance unique par taille, partagée par toutes les parties, et les
+    tours ne stockent que les tailles.
+
     Attributs:
         taille (int): Le diamètre du disque.
         couleur (str): La couleur utilisée pour représenter graphiquement le disque.
     """
+    __slots__ = ('taille', 'couleur')
+
+    # Instances partagées, par taille
+    instances = {}
+
     def __init__(self, taille, couleur=None):
         #random.seed(taille+10)
 
@@ -17,3 +26,18 @@ class Disque:
         # Générer une couleur aléatoire si aucune n'est fournie
         self.couleur = couleur or "#{:06x}".format(random.randint(0, 0xFFFFFF))
 
+    @classmethod
+    def partage(cls, taille):
+        """
+        Renvoie l'instance partagée du disque d'une taille donnée (créée au premier appel).
+
+        Args:
+            taille (int): Le diamètre du disque.
+
+        Returns:
+            Disque: Le disque partagé.
+        """
+        disque = cls.instances.get(taille)
+        if disque is None:
+            disque = cls.instances[taille] = cls(taille)
+        return disque
@@ -0,0 +1,123 @@
+class FileSeaux:
+    """
+    File de priorité à seaux pour A*, indexée par les valeurs entières de f puis de g.
+
+    Chaque déplacement coûte 1 et f est un petit entier : un seau par valeur de f
+    (et, dans chaque seau, une pile par valeur de g) remplace le tas binaire.
+    L'extraction renvoie le plus petit f puis, à f égal, le plus grand g (l'état
+    le plus avancé), sans aucune comparaison de tuples.
+
+    Un seau n'est créé qu'à son premier état : avec une heuristique très pondérée
+    (f = g + poids * h), les valeurs de f sont éparses et la plupart des seaux
+    restent à None.
+
+    Un état de nouveau ajouté (meilleur chemin trouvé) laisse son ancienne entrée
+    dans sa pile : elle n'est plus comptée dans la taille et est retirée quand
+    avancer la rencontre au sommet d'une pile. Un état n'est ajouté de nouveau
+    qu'avec un g plus petit : g suffit à reconnaître son entrée vivante.
+
+    Attributs:
+        seaux (list[list[list[int]] | None]): seaux[f][g] = pile des états encodés.
+        g_max (list[int]): Pour chaque f, le plus grand g dont la pile peut être non vide.
+        f_min (int): Plus petit f dont le seau peut être non vide.
+        g_vivant (dict): {état encodé: g de son entrée vivante} des états de la file.
+        taille (int): Nombre d'entrées vivantes dans la file.
+    """
+    def __init__(self):
+        self.seaux = []
+        self.g_max = []
+        self.f_min = 0
+        self.g_vivant = {}
+        self.taille = 0
+
+    def __len__(self):
+        return self.taille
+
+    def __contains__(self, code):
+        return code in self.g_vivant
+
+    def ajouter(self, f, g, code):
+        """
+        Ajoute un état à la file, ou remplace son entrée s'il y est déjà.
+
+        Args:
+            f (int): Coût total estimé f = g + h.
+            g (int): Coût depuis le départ.
+            code (int): L'état encodé.
+        """
+        if len(self.seaux) <= f:
+            self.seaux.extend([None] * (f + 1 - len(self.seaux)))
+            self.g_max.extend([-1] * (f + 1 - len(self.g_max)))
+        seau = self.seaux[f]
+        if seau is None:
+            seau = self.seaux[f] = []
+        while len(seau) <= g:
+            seau.append([])
+        seau[g].append(code)
+        if g > self.g_max[f]:
+            self.g_max[f] = g
+        if f < self.f_min or self.taille == 0:
+            self.f_min = f
+        if code not in self.g_vivant:
+            self.taille += 1
+        self.g_vivant[code] = g
+
+    def f_minimal(self):
+        """
+        Renvoie le plus petit f présent dans la file, sans rien retirer.
+
+        Returns:
+            int | None: Le plus petit f, ou None si la file est vide.
+        """
+        if self.taille == 0:
+            return None
+        self.avancer()
+        return self.f_min
+
+    def avancer(self):
+        """
+        Place f_min (et g_max[f_min]) sur la première pile dont le sommet est une
+        entrée vivante, en retirant les entrées périmées rencontrées.
+        Les pointeurs ne reculent jamais entre deux ajouts : coût O(1) amorti.
+        """
+        f = self.f_min
+        seaux = self.seaux
+        g_vivant = self.g_vivant
+        while True:
+            seau = seaux[f]
+            if seau is None:
+                f += 1
+                continue
+            g = self.g_max[f]
+            while g >= 0:
+                pile = seau[g]
+                while pile and g_vivant.get(pile[-1]) != g:
+                    pile.pop()
+                if pile:
+                    break
+                g -= 1
+            self.g_max[f] = g
+            if g >= 0:
+                break
+            f += 1
+        self.f_min = f
+
+    def extraire(self):
+        """
+        Retire l'état de plus petit f et, à f égal, de plus grand g.
+
+        Returns:
+            tuple[int, int, int]: (f, g, code).
+
+        Raises:
+            IndexError: Si la file est vide.
+        """
+        if self.taille == 0:
+            raise IndexError("extraction dans une file vide")
+        self.avancer()
+        f = self.f_min
+        g = self.g_max[f]
+        code = self.seaux[f][g].pop()
+        del self.g_vivant[code]
+        self.taille -= 1
+        return f, g, code
@@ -1,9 +1,13 @@
 from Disque import Disque
 from Tour import Tour
+from SolveurOptimal import SolveurOptimal
+from SolveurConfigurations import SolveurConfigurations
+from CodecEtat import CodecEtat
+from StatistiquesSolveur import StatistiquesSolveur
+from JournalCoups import JournalCoups
+from array import array
 import random
 import time
-import copy
-import heapq
 
 
 class JeuHanoi:
@@ -12,14 +16,25 @@ class JeuHanoi:
 
     Attributs:
         nombre_disques (int): Nombre total de disques dans le jeu.
+        idx_tour_cible (int): Index 0-basé de la tour où les disques doivent être
+            rassemblés pour gagner (la dernière).
         mode_jeu (str): 'manuel' ou 'auto'.
         score (int): Score actuel du joueur.
         chrono (float): Temps écoulé.
         nbr_coups (int): Nombre de coups effectués.
         etat_partie (bool): True si la partie est en cours, False sinon.
         ordre_disques_initiaux (list[Disque]): Ordre de départ des disques.
+        horloge (callable): Renvoie l'heure courante en secondes (time.time par défaut).
+        disques_places (int): Nombre de disques déjà à leur place définitive, au fond de la
+            tour cible (suivi à chaque coup).
+        tailles_cibles (array): Tailles attendues sur la tour cible, du fond au sommet.
+        journal (JournalCoups): Les coups joués depuis le dernier placement des disques (annuler/rétablir).
     """
-    def __init__(self, nombre_disques=3, mode_jeu='manuel'):
+    # Modes de recherche disponibles pour les configurations illégales
+    MODES_SOLVEUR = SolveurConfigurations.MODES_SOLVEUR
+    def __init__(self, nombre_disques=3, mode_jeu='manuel', nb_tours=3):
+        if nb_tours < 3:
+            raise ValueError("Il faut au moins 3 tours.")
         self.nombre_disques = nombre_disques
         self.mode_jeu = mode_jeu
         self.score = 0
@@ -29,9 +44,15 @@ class JeuHanoi:
         self.etat_partie = False
         self.ordre_disques_initiaux = []
         self.mode_aleatoire = False
+        # Source du temps du chronomètre (remplaçable pour une simulation)
+        self.horloge = time.time
+        self.disques_places = 0
+        self.tailles_cibles = array('B')
+        self.journal = JournalCoups(())
         
         # Initialiser les tours
-        self.tours = [Tour(i+1) for i in range(3)]
+        self.tours = [Tour(i+1) for i in range(nb_tours)]
+        self.idx_tour_cible = nb_tours - 1
         
         # Initialiser les disques dans l'ordre standard
         self.initialiser_disques()
@@ -45,10 +66,10 @@ class JeuHanoi:
         """
         # Vider toutes les tours
         for tour in self.tours:
-            tour.disques = []
+            tour.tailles = array('B')
             
-        # Créer les disques
-        disques = [Disque(i+1) for i in range(self.nombre_disques, 0, -1)]
+        # Créer les disques (instances partagées entre les parties)
+        disques = [Disque.partage(i+1) for i in range(self.nombre_disques, 0, -1)]
         
         if mode_aleatoire:
             random.shuffle(disques)
@@ -59,6 +80,22 @@ class JeuHanoi:
         # Placer les disques sur la première tour
         for disque in disques:
             self.tours[0].empiler(disque)
+        self.recalculer_disques_places()
+        self.journal = JournalCoups(self.etat_tuple())
+
+    def recalculer_disques_places(self):
+        """
+        Recalcule (en O(n)) les tailles attendues sur la tour cible et le nombre de
+        disques déjà bien placés à son fond. À appeler après avoir modifié les
+        tours autrement que par jouer_coup.
+        """
+        self.tailles_cibles = array('B', sorted((taille for tour in self.tours for taille in tour.tailles),
+                                                reverse=True))
+        tailles = self.tours[self.idx_tour_cible].tailles
+        nb = 0
+        while nb < len(tailles) and tailles[nb] == self.tailles_cibles[nb]:
+            nb += 1
+        self.disques_places = nb
 
     def deplacement_valide(self, tour_depart, tour_arrivee):
         """
@@ -72,16 +109,16 @@ class JeuHanoi:
             bool: True si le déplacement est autorisé, False sinon.
         """
         # Vérifier si la tour de départ est vide
-        if tour_depart.est_vide():
+        if not tour_depart.tailles:
             return False
             
         # Si la tour d'arrivée est vide, le déplacement est valide
-        if tour_arrivee.est_vide():
+        if not tour_arrivee.tailles:
             return True
             
         # Vérifier si le disque du dessus de la tour de départ est plus petit
         # que celui du dessus de la tour d'arrivée
-        return tour_depart.top_disque().taille < tour_arrivee.top_disque().taille
+        return tour_depart.tailles[-1] < tour_arrivee.tailles[-1]
         
     def jouer_coup(self, tour_depart, tour_arrivee):
         """
@@ -95,12 +132,100 @@ class JeuHanoi:
             bool: True si le coup a été joué, False sinon.
         """
         if self.deplacement_valide(tour_depart, tour_arrivee):
-            disque = tour_depart.depiler()
-            tour_arrivee.empiler(disque)
+            self.deplacer_sommet(tour_depart, tour_arrivee)
             self.nbr_coups += 1
+            self.journal.enregistrer(tour_depart.numero - 1, tour_arrivee.numero - 1)
             return True
         return False
 
+    def deplacer_sommet(self, tour_depart, tour_arrivee):
+        """
+        Déplace le disque du sommet sans vérification ni enregistrement, en tenant
+        à jour le nombre de disques bien placés sur la tour cible.
+
+        Args:
+            tour_depart (Tour): La tour de départ.
+            tour_arrivee (Tour): La tour de destination.
+        """
+        tour_arrivee.tailles.append(tour_depart.tailles.pop())
+
+        # Suivi des disques bien placés sur la tour cible : seul le sommet change
+        tour_cible = self.tours[self.idx_tour_cible]
+        if tour_depart is tour_cible and self.disques_places > len(tour_cible.tailles):
+            self.disques_places -= 1
+        elif tour_arrivee is tour_cible and self.disques_places == len(tour_cible.tailles) - 1 \
+                and tour_cible.tailles[-1] == self.tailles_cibles[self.disques_places]:
+            self.disques_places += 1
+
+    def annuler_coup(self):
+        """
+        Annule le dernier coup du journal (le coup inverse est toujours valide).
+
+        Returns:
+            tuple[int, int] | None: Le coup annulé (tour départ, tour arrivée) en numéros
+            de tour, ou None s'il n'y a rien à annuler.
+        """
+        mouvement = self.journal.annuler()
+        if mouvement is None:
+            return None
+        idx_source, idx_dest = mouvement
+        self.deplacer_sommet(self.tours[idx_dest], self.tours[idx_source])
+        self.nbr_coups -= 1
+        return (self.tours[idx_source].numero, self.tours[idx_dest].numero)
+
+    def retablir_coup(self):
+        """
+        Rejoue le dernier coup annulé.
+
+        Returns:
+            tuple[int, int] | None: Le coup rejoué (tour départ, tour arrivée) en numéros
+            de tour, ou None s'il n'y a rien à rétablir.
+        """
+        mouvement = self.journal.retablir()
+        if mouvement is None:
+            return None
+        idx_source, idx_dest = mouvement
+        self.deplacer_sommet(self.tours[idx_source], self.tours[idx_dest])
+        self.nbr_coups += 1
+        return (self.tours[idx_source].numero, self.tours[idx_dest].numero)
+
+    def charger_journal(self, journal):
+        """
+        Reprend une partie enregistrée : rejoue (en vérifiant) les coups actifs du
+        journal depuis son état initial, puis le garde pour annuler/rétablir.
+
+        Args:
+            journal (JournalCoups): Le journal (par exemple lu par JournalCoups.charger).
+
+        Raises:
+            ValueError: Si un coup du journal est invalide.
+        """
+        nb_valides, etat_final = journal.rejouer()
+        if nb_valides != len(journal):
+            raise ValueError(f"Le coup {nb_valides + 1} du journal est invalide.")
+        self.charger_etat(etat_final)
+        self.nbr_coups = nb_valides
+        self.journal = journal
+
+    def jouer_coups(self, mouvements):
+        """
+        Joue une suite de coups d'affilée, en s'arrêtant au premier coup invalide.
+
+        Args:
+            mouvements (iterable): Mouvements (tour départ, tour arrivée) en numéros de tour.
+
+        Returns:
+            tuple[int, bool]: (nombre de coups joués, False si un coup invalide a arrêté la suite).
+        """
+        tours = self.tours
+        nb_joues = 0
+        for depart, arrivee in mouvements:
+            if not (1 <= depart <= len(tours) and 1 <= arrivee <= len(tours)) \
+                    or not self.jouer_coup(tours[depart - 1], tours[arrivee - 1]):
+                return nb_joues, False
+            nb_joues += 1
+        return nb_joues, True
+
     def ajouter_score(self, points):
         """
         Ajoute des points au score du joueur.
@@ -115,14 +240,13 @@ class JeuHanoi:
     def gagner(self):
         """
         Vérifie si tous les disques sont bien empilés sur la dernière tour.
+        En O(1) : le nombre de disques bien placés est tenu à jour à chaque coup.
 
         Returns:
             bool: True si le joueur a gagné, False sinon.
         """
-        # Vérifier si la dernière tour contient tous les disques
-        return len(self.tours[2].disques) == self.nombre_disques and \
-               all(self.tours[2].disques[i].taille > self.tours[2].disques[i+1].taille 
-                   for i in range(len(self.tours[2].disques)-1))
+        # Vérifier si la dernière tour contient tous les disques, dans l'ordre
+        return self.disques_places == len(self.tailles_cibles) > 0
 
     def demarrer_chrono(self):
         """
@@ -131,7 +255,7 @@ class JeuHanoi:
         Returns:
             None
         """
-        self.temps_debut = time.time()
+        self.temps_debut = self.horloge()
         self.chrono = 0
         self.etat_partie = True
 
@@ -144,7 +268,7 @@ class JeuHanoi:
             float: Le temps écoulé en secondes.
         """
         if self.etat_partie:
-            self.chrono = time.time() - self.temps_debut
+            self.chrono = self.horloge() - self.temps_debut
             self.etat_partie = False
         return self.chrono
 
@@ -159,203 +283,213 @@ class JeuHanoi:
         Returns:
             list[Disque]: Liste de disques dans un ordre aléatoire.
         """
-        disques = [Disque(i+1) for i in range(nb)]
+        disques = [Disque.partage(i+1) for i in range(nb)]
         random.shuffle(disques)
         return disques
     
     
 
-    def calculer_heuristique(self, etat_actuel_tuple, liste_tailles_disques_asc, idx_tour_cible):
+    def etat_tuple(self):
         """
-        Calcule l'heuristique h(n) pour l'état actuel.
-        Heuristique : Pour chaque disque i, si non sur la tour cible, +1.
-        Args:
-            etat_actuel_tuple (tuple): L'état courant sous forme de tuple de tuples.
-            liste_tailles_disques_asc (list): Liste des tailles de disques du plus petit au plus grand.
-            idx_tour_cible (int): Index de la tour cible.
+        Retourne l'état courant sous forme de tuple de tuples (pour chaque tour, du fond au sommet).
 
         Returns:
-            int: Valeur heuristique pour l'état courant.
-        """
-        h = 0
-        # Parcourt chaque disque du plus petit au plus grand
-        for taille_disque in liste_tailles_disques_asc:  # Itère du plus petit au plus grand
-            tour_trouvee = -1
-            index_disque_sur_tour = -1  # Index dans le tuple de la tour (0 = fond)
-
-            # Recherche sur quelle tour se trouve le disque
-            for idx_tour, contenu_tour_tuple in enumerate(etat_actuel_tuple):
-                try:
-                    # Trouve l'index du disque sur cette tour.
-                    # Rappel: le tuple de la tour est (fond, ..., sommet)
-                    index_disque_sur_tour = contenu_tour_tuple.index(taille_disque)
-                    tour_trouvee = idx_tour
-                    break
-                except ValueError:
-                    continue  # Disque non trouvé sur cette tour
-
-            if tour_trouvee == -1:
-                # Cela ne devrait pas arriver dans un état valide de Hanoï si tous les disques sont suivis
-                continue
-
-            if tour_trouvee != idx_tour_cible:
-                h += 1  # Le disque n'est pas sur la bonne tour 
-            
-        return h
+            tuple: ex. ((4, 2, 3), (), ())
+        """
+        return tuple(tuple(tour.tailles) for tour in self.tours)
 
-    def generer_voisins(self, etat_actuel_tuple, nb_tours):
+    def charger_etat(self, etat_tuple):
         """
-        Génère tous les états voisins valides à partir de l'état actuel.
-        Retourne une liste de (etat_voisin_tuple, mouvement_tuple).
-        mouvement_tuple est (index_tour_source, index_tour_destination).
+        Place les disques sur les tours selon un état donné (le journal repart de cet état).
+
         Args:
-            etat_actuel_tuple (tuple): L'état courant sous forme de tuple de tuples.
-            nb_tours (int): Nombre de tours.
+            etat_tuple (tuple): L'état sous forme de tuple de tuples (fond -> sommet).
+        """
+        for tour, contenu_tour in zip(self.tours, etat_tuple):
+            tour.tailles = array('B', contenu_tour)
+        self.recalculer_disques_places()
+        self.journal = JournalCoups(self.etat_tuple())
+
+    def a_solution_directe(self):
+        """
+        Indique si la configuration actuelle se résout sans recherche : n'importe
+        quelle configuration légale avec 3 tours ; avec plus de tours, tous les
+        disques empilés légalement sur une seule tour (Frame–Stewart) ou une
+        configuration légale dont la table des distances est déjà enregistrée.
+
         Returns:
-            list: Liste de tuples (état voisin, mouvement effectué).
+            bool: True si generer_mouvements_optimaux s'applique sans calcul préalable.
         """
-        voisins = []
-        # Convertit l'état en listes de listes pour modification facile
-        liste_tours = [list(t) for t in etat_actuel_tuple]
-        #ex. [[4,2,3],[],[]]
+        return SolveurConfigurations.solution_directe(self.etat_tuple(), self.idx_tour_cible,
+                                                      construire_table=False) is not None
 
-        # Parcourt chaque tour comme source potentielle
-        for idx_source in range(nb_tours):  # Index de la tour source
-            if not liste_tours[idx_source]:  # Tour source vide
-                continue
+    def generer_mouvements_optimaux(self, idx_tour_cible=None):
+        """
+        Génère paresseusement la solution à partir d'une configuration qui se résout
+        sans recherche (voir a_solution_directe), en O(1) amorti par mouvement avec
+        3 tours ou en suivant la table des distances. Une table absente est
+        d'abord construite (voir TableDistances).
 
-            # Le disque à déplacer est le dernier de la liste (sommet de la tour source)
-            disque_a_deplacer = liste_tours[idx_source][-1]
-            
+        Args:
+            idx_tour_cible (int | None): Index 0-basé de la tour cible (la tour cible du jeu si None).
 
-            # Parcourt chaque tour comme destination potentielle
-            for idx_dest in range(nb_tours):  # Index de la tour destination
-                if idx_source == idx_dest:  # Ne peut pas déplacer sur la même tour
-                    continue
+        Yields:
+            tuple[int, int]: Mouvement (tour départ, tour arrivée) en numéros de tour.
 
-                # Vérifie la validité du mouvement idx_source -> idx_dest
-                # Mouvement valide si la destination est vide ou si le disque au sommet de la destination est plus grand
-                if not liste_tours[idx_dest] or disque_a_deplacer < liste_tours[idx_dest][-1]:
-                    # Mouvement valide: destination vide ou disque au sommet plus grand
+        Raises:
+            ValueError: Si la configuration actuelle ne se résout pas sans recherche.
+        """
+        if idx_tour_cible is None:
+            idx_tour_cible = self.idx_tour_cible
+        numeros = [tour.numero for tour in self.tours]
+        directe = SolveurConfigurations.solution_directe(self.etat_tuple(), idx_tour_cible)
+        if directe is None:
+            raise ValueError("La configuration actuelle demande une recherche (voir resoudre_automatiquement).")
+        for idx_source, idx_dest in directe[1]:
+            yield (numeros[idx_source], numeros[idx_dest])
+
+    def etat_apres_mouvements(self, k, idx_tour_cible=None):
+        """
+        Donne le contenu des tours après k mouvements de la solution optimale depuis
+        la configuration actuelle (légale), calculé en O(n) sans rejouer les mouvements.
 
-                    # Crée une nouvelle copie de l'état pour ce voisin
-                    nouvelles_tours = [list(t) for t in liste_tours]
-                    val_deplacee = nouvelles_tours[idx_source].pop()  # Enlève de la source
-                    nouvelles_tours[idx_dest].append(val_deplacee)  # Ajoute à la destination
+        Args:
+            k (int): Nombre de mouvements joués.
+            idx_tour_cible (int | None): Index 0-basé de la tour cible (la tour cible du jeu si None).
 
-                    # Transforme la nouvelle configuration en tuple de tuples pour l'immuabilité
-                    voisin_tuple = tuple(tuple(t) for t in nouvelles_tours)
-                    # Ajoute le voisin et le mouvement effectué à la liste
-                    voisins.append((voisin_tuple, (idx_source, idx_dest)))
+        Returns:
+            tuple: L'état sous forme de tuple de tuples (fond -> sommet).
 
-        return voisins
+        Raises:
+            ValueError: Si la configuration n'est pas légale ou si k est hors de la solution.
+        """
+        if idx_tour_cible is None:
+            idx_tour_cible = self.idx_tour_cible
+        return SolveurOptimal(len(self.tours)).etat_apres_mouvements(self.etat_tuple(), k, idx_tour_cible)
 
+    def mouvement_numero(self, k, idx_tour_cible=None):
+        """
+        Donne le k-ième mouvement (1-indexé) de la solution optimale depuis la
+        configuration actuelle (légale), sans générer les précédents.
 
+        Args:
+            k (int): Numéro du mouvement.
+            idx_tour_cible (int | None): Index 0-basé de la tour cible (la tour cible du jeu si None).
+
+        Returns:
+            tuple[int, int]: Mouvement (tour départ, tour arrivée) en numéros de tour.
+
+        Raises:
+            ValueError: Si la configuration n'est pas légale ou si k est hors de la solution.
+        """
+        if idx_tour_cible is None:
+            idx_tour_cible = self.idx_tour_cible
+        idx_source, idx_dest = SolveurOptimal(len(self.tours)).mouvement_numero(
+            self.etat_tuple(), k, idx_tour_cible)
+        return (self.tours[idx_source].numero, self.tours[idx_dest].numero)
+
+    def positions_apres_mouvements_lot(self, liste_k, idx_tour_cible=None):
+        """
+        Variante par lots de etat_apres_mouvements (vectorisée si NumPy est installé).
+
+        Args:
+            liste_k (sequence[int]): Nombres de mouvements joués.
+            idx_tour_cible (int | None): Index 0-basé de la tour cible (la tour cible du jeu si None).
+
+        Returns:
+            numpy.ndarray | list[array]: Pour chaque k, l'index 0-basé de la tour de
+            chaque disque, du plus petit au plus grand (voir SolveurOptimal.positions_apres_lot).
+        """
+        if idx_tour_cible is None:
+            idx_tour_cible = self.idx_tour_cible
+        return SolveurOptimal(len(self.tours)).positions_apres_lot(self.etat_tuple(), liste_k, idx_tour_cible)
 
 
 ############################################################################################################
 
-    def resoudre_automatiquement(self):
+    def resoudre_automatiquement(self, rappel_progression=None, mode_solveur='astar', budget_memoire=None,
+                                 nb_processus=None, avec_statistiques=False, rappel_statistiques=None):
         """
         ####################### Utilisation d'outils IA - GEMINI #################################
         ### Adaptation de l'algorithme de recherche du meilleur chemin A* pour le cas de notre jeu. ###
 
         
-        La fonction résout le jeu automatiquement en utilisant l'algorithme l'algorithme de recherche
-        A* (pour l'ordre Normal et Aléatoire).
+        La fonction résout le jeu automatiquement : une configuration légale est résolue directement
+        par SolveurOptimal (sans recherche), sinon on utilise l'algorithme de recherche A* (ordre Aléatoire).
+
+        Args:
+            rappel_progression (callable | None): Appelée avec le nombre d'états développés,
+                régulièrement pendant la recherche A*.
+            mode_solveur (str): 'astar' (A*, le plus rapide), 'ida' (IDA*, mémoire bornée),
+                'parallele' (A* réparti sur plusieurs processus, expérimental) ou 'bidirectionnel' (A* raccordé
+                aux solutions directes des configurations légales).
+            budget_memoire (int | None): Pour 'ida', taille maximale en octets de la table
+                de transposition (SolveurConfigurations.BUDGET_MEMOIRE_DEFAUT si None).
+            nb_processus (int | None): Pour 'parallele', nombre de processus (un par cœur si None).
+            avec_statistiques (bool): Si True, renvoie aussi les statistiques de la résolution.
+            rappel_statistiques (callable | None): Reçoit les StatistiquesSolveur pendant la recherche
+                et à la fin (voir StatistiquesSolveur.vers_journal).
+
+        Returns:
+            list[tuple[int, int]]: Liste des mouvements (tour départ, tour arrivée),
+            ou (mouvements, StatistiquesSolveur) si avec_statistiques est True.
+        """
+        if mode_solveur not in self.MODES_SOLVEUR:
+            raise ValueError(f"Mode de solveur inconnu : {mode_solveur}")
+
+        statistiques = None
+        if avec_statistiques or rappel_statistiques:
+            statistiques = StatistiquesSolveur(rappel_statistiques)
+            statistiques.demarrer(mode_solveur)
+
+        mouvements = self.calculer_solution(rappel_progression, mode_solveur, budget_memoire,
+                                            nb_processus, statistiques)
+
+        if statistiques:
+            statistiques.terminer(mouvements)
+            if avec_statistiques:
+                return mouvements, statistiques
+        return mouvements
+
+    def calculer_solution(self, rappel_progression, mode_solveur, budget_memoire, nb_processus, statistiques):
+        """
+        Calcule la solution pour resoudre_automatiquement (mêmes paramètres), avec
+        SolveurConfigurations sur l'état actuel encodé.
+
+        Args:
+            rappel_progression (callable | None): Appelée avec le nombre d'états développés.
+            mode_solveur (str): Mode de recherche pour une configuration illégale.
+            budget_memoire (int | None): Budget mémoire du mode 'ida', en octets.
+            nb_processus (int | None): Nombre de processus du mode 'parallele'.
+            statistiques (StatistiquesSolveur | None): Statistiques à remplir.
 
         Returns:
             list[tuple[int, int]]: Liste des mouvements (tour départ, tour arrivée).
         """
-        mouvements = []
         self.mode_jeu = 'auto'
 
-        # --- Partie pour la résolution A* (mode_aleatoire = True) ---
         nb_tours = len(self.tours)
         if nb_tours == 0:  # Pas de tours définies
             return []
 
-        # L'index 0-basé de la tour cible pour la logique interne de A* (ici la 3ème tour)
-        idx_tour_cible = 2
-        # Vérification de sécurité :
-        if idx_tour_cible >= nb_tours:
-            return []  # Erreur d'index
-
         # Représente l'état initial sous forme de tuple de tuples (pour chaque tour, du fond au sommet)
-        etat_initial_tuple = tuple(tuple(d.taille for d in tour.disques) for tour in self.tours)
+        etat_initial_tuple = self.etat_tuple()
         # ex. ((4, 2, 3), (), ())
 
-        # Liste des tailles de disques du plus petit au plus grand (pour l'heuristique)
-        liste_tailles_disques_asc = list(range(2, self.nombre_disques + 2))
-
-        if not liste_tailles_disques_asc:  # Pas de disques
+        if not any(etat_initial_tuple):  # Pas de disques
             return []
 
-        # Pré-calcul des disques pour la tour cible (du plus grand au plus petit)
-        disques_tour_cible = tuple(reversed(liste_tailles_disques_asc))
-        # Construction de l'état objectif (goal) : tous les disques sur la tour cible
-        etat_objectif_tuple = tuple(disques_tour_cible if i == idx_tour_cible else () for i in range(nb_tours))
-        #ex. ((), (), (4, 3, 2))
-        
-
-        # Initialisation de la file de priorité (open_set) pour A*
-        file_priorite = []
-        # Calcul de l'heuristique initiale
-        h_initiale = self.calculer_heuristique(etat_initial_tuple, liste_tailles_disques_asc, idx_tour_cible)
-        
-        heapq.heappush(file_priorite, (h_initiale, etat_initial_tuple))
-        
-        # Dictionnaire pour retrouver le chemin (état précédent et mouvement)
-        provenance = {}
-        # Dictionnaire des coûts g(n) pour chaque état
-        cout_g = {etat_initial_tuple: 0}
-
-        # Liste pour stocker les mouvements (index 0-basé)
-        chemin_mouvements_0_index = []
-
-        # Boucle principale de l'algorithme A*
-        while file_priorite:
-            score_f_courant, etat_courant = heapq.heappop(file_priorite)
-            
-            # Vérifie que le score f(n) est cohérent (sécurité)
-            if score_f_courant > cout_g[etat_courant] + self.calculer_heuristique(etat_courant, liste_tailles_disques_asc, idx_tour_cible):
-                continue
-
-            # Si l'état objectif est atteint, on reconstitue le chemin
-            if etat_courant == etat_objectif_tuple:
-                etat_trace = etat_courant
-                while etat_trace in provenance:
-                    etat_precedent, mouvement_0_index = provenance[etat_trace]
-                    chemin_mouvements_0_index.append(mouvement_0_index)  # (source, destination)
-                    etat_trace = etat_precedent
-                break
-
-            # Génère tous les voisins valides de l'état courant
-            for voisin_tuple, mouvement_tuple in self.generer_voisins(etat_courant, nb_tours):
-                cout_tentatif = cout_g[etat_courant] + 1
-
-                # Si ce chemin vers le voisin est meilleur que tout chemin précédent
-                if cout_tentatif < cout_g.get(voisin_tuple, float('inf')):
-                    provenance[voisin_tuple] = (etat_courant, mouvement_tuple)
-                    cout_g[voisin_tuple] = cout_tentatif
-                    # Calcul de l'heuristique pour le voisin
-                    h_voisin = self.calculer_heuristique(voisin_tuple, liste_tailles_disques_asc, idx_tour_cible)
-                    f_voisin = cout_tentatif + h_voisin
-                    heapq.heappush(file_priorite, (f_voisin, voisin_tuple))
+        # Chaque état est encodé en un seul entier (tour de chaque disque + base illégale de chaque tour) :
+        # pas de copie de listes par voisin, et un hachage d'entier pour cout_g et provenance
+        codec = CodecEtat(etat_initial_tuple, nb_tours)
+        solveur = SolveurConfigurations(codec)
+        chemin_mouvements_0_index = solveur.resoudre(
+            codec.encoder(etat_initial_tuple), solveur.objectif_tour(self.idx_tour_cible),
+            mode_solveur, budget_memoire, nb_processus, rappel_progression, statistiques)
 
         # Convertit les mouvements 0-indexés en mouvements utilisant Tour.numero
-        if chemin_mouvements_0_index:  # Si une solution a été trouvée
-            for idx_source, idx_dest in reversed(chemin_mouvements_0_index):  # Inverser pour l'ordre correct
-                # Vérifie la validité des index avant d'accéder à self.tours
-                if 0 <= idx_source < len(self.tours) and 0 <= idx_dest < len(self.tours):
-                    numero_source = self.tours[idx_source].numero
-                    numero_dest = self.tours[idx_dest].numero
-                    mouvements.append((numero_source, numero_dest))
-                else:
-                    # Gérer l'erreur : index invalide pour self.tours
-                    return []  # Solution invalide ou incomplète
-
-        return mouvements
+        numeros = [tour.numero for tour in self.tours]
+        return [(numeros[idx_source], numeros[idx_dest]) for idx_source, idx_dest in chemin_mouvements_0_index or []]
 
 
 ############################################################################################################
\ No newline at end of file
@@ -0,0 +1,181 @@
+class JournalCoups:
+    """
+    Journal des coups d'une partie : un octet par coup (index de la tour de
+    départ sur les 4 bits de poids fort, tour d'arrivée sur les 4 bits de poids
+    faible), dans un bytearray. Un million de coups tiennent dans un mégaoctet.
+
+    Annuler et rétablir ne font que déplacer la position courante (O(1)) ; un
+    nouveau coup joué après une annulation efface les coups annulés.
+
+    Attributs:
+        etat_initial (tuple): L'état de départ (tuple de tuples, fond -> sommet).
+        donnees (bytearray): Les coups enregistrés, un octet chacun.
+        position (int): Nombre de coups actifs (les suivants ont été annulés).
+    """
+    # En-tête des fichiers de journal
+    ENTETE = b"HNJ1"
+    # Mouvement (index source, index destination) de chaque octet
+    DECODAGE = [(octet >> 4, octet & 0xF) for octet in range(256)]
+
+    def __init__(self, etat_initial):
+        self.etat_initial = etat_initial
+        self.donnees = bytearray()
+        self.position = 0
+
+    def __len__(self):
+        return self.position
+
+    @staticmethod
+    def coder(idx_source, idx_dest):
+        """
+        Code un mouvement sur un octet.
+
+        Args:
+            idx_source (int): Index 0-basé de la tour de départ (0 à 15).
+            idx_dest (int): Index 0-basé de la tour d'arrivée (0 à 15).
+
+        Returns:
+            int: L'octet du mouvement.
+        """
+        return (idx_source << 4) | idx_dest
+
+    def tronquer(self):
+        """
+        Efface les coups annulés (avant d'enregistrer un nouveau coup).
+        """
+        if self.position < len(self.donnees):
+            del self.donnees[self.position:]
+
+    def enregistrer(self, idx_source, idx_dest):
+        """
+        Ajoute un coup au journal.
+
+        Args:
+            idx_source (int): Index 0-basé de la tour de départ.
+            idx_dest (int): Index 0-basé de la tour d'arrivée.
+        """
+        self.tronquer()
+        self.donnees.append(self.coder(idx_source, idx_dest))
+        self.position += 1
+
+    def enregistrer_lot(self, octets):
+        """
+        Ajoute d'un bloc une suite de coups déjà codés (voir coder), comme autant
+        d'appels à enregistrer.
+
+        Args:
+            octets (bytes | bytearray): Les coups, un octet chacun.
+        """
+        self.tronquer()
+        self.donnees += octets
+        self.position = len(self.donnees)
+
+    def annuler(self):
+        """
+        Recule d'un coup.
+
+        Returns:
+            tuple[int, int] | None: Le coup annulé (index source, index destination),
+            à défaire en sens inverse, ou None s'il n'y a rien à annuler.
+        """
+        if self.position == 0:
+            return None
+        self.position -= 1
+        return self.DECODAGE[self.donnees[self.position]]
+
+    def retablir(self):
+        """
+        Avance d'un coup annulé.
+
+        Returns:
+            tuple[int, int] | None: Le coup à rejouer (index source, index destination),
+            ou None s'il n'y a rien à rétablir.
+        """
+        if self.position == len(self.donnees):
+            return None
+        self.position += 1
+        return self.DECODAGE[self.donnees[self.position - 1]]
+
+    def mouvements(self):
+        """
+        Parcourt les coups actifs.
+
+        Yields:
+            tuple[int, int]: (index source, index destination).
+        """
+        decodage = self.DECODAGE
+        for octet in self.donnees[:self.position]:
+            yield decodage[octet]
+
+    def rejouer(self):
+        """
+        Rejoue les coups actifs depuis l'état initial sur de simples listes de
+        tailles, en vérifiant chaque coup.
+
+        Returns:
+            tuple[int, tuple]: (nombre de coups valides avant le premier invalide,
+            état atteint après ces coups).
+        """
+        piles = [list(contenu_tour) for contenu_tour in self.etat_initial]
+        decodage = self.DECODAGE
+        nb_valides = 0
+        try:
+            for octet in self.donnees[:self.position]:
+                idx_source, idx_dest = decodage[octet]
+                pile_source = piles[idx_source]
+                pile_dest = piles[idx_dest]
+                if not pile_source or (pile_dest and pile_dest[-1] <= pile_source[-1]):
+                    break
+                pile_dest.append(pile_source.pop())
+                nb_valides += 1
+        except IndexError:
+            pass  # Tour inexistante : coup invalide
+        return nb_valides, tuple(tuple(pile) for pile in piles)
+
+    def sauvegarder(self, chemin):
+        """
+        Écrit l'état initial et les coups actifs dans un fichier binaire.
+
+        Args:
+            chemin (str): Chemin du fichier.
+        """
+        with open(chemin, "wb") as fichier:
+            fichier.write(self.ENTETE)
+            fichier.write(bytes([len(self.etat_initial)]))
+            for contenu_tour in self.etat_initial:
+                fichier.write(bytes([len(contenu_tour)]))
+                fichier.write(bytes(contenu_tour))
+            fichier.write(self.donnees[:self.position])
+
+    @classmethod
+    def charger(cls, chemin):
+        """
+        Lit un journal écrit par sauvegarder.
+
+        Args:
+            chemin (str): Chemin du fichier.
+
+        Returns:
+            JournalCoups: Le journal, positionné après son dernier coup.
+
+        Raises:
+            ValueError: Si le fichier n'est pas un journal de coups.
+        """
+        with open(chemin, "rb") as fichier:
+            contenu = fichier.read()
+        if contenu[:len(cls.ENTETE)] != cls.ENTETE:
+            raise ValueError(f"{chemin} n'est pas un journal de coups.")
+
+        curseur = len(cls.ENTETE)
+        nb_tours = contenu[curseur]
+        curseur += 1
+        etat_initial = []
+        for _ in range(nb_tours):
+            longueur = contenu[curseur]
+            etat_initial.append(tuple(contenu[curseur + 1:curseur + 1 + longueur]))
+            curseur += 1 + longueur
+
+        journal = cls(tuple(etat_initial))
+        journal.donnees = bytearray(contenu[curseur:])
+        journal.position = len(journal.donnees)
+        return journal
@@ -0,0 +1,131 @@
+import itertools
+import time
+
+
+class LecteurSolution:
+    """
+    Joue une suite de mouvements sur une partie, à vitesse réglable.
+
+    Les mouvements sont appliqués au modèle par lots, et l'affichage n'est
+    rafraîchi qu'une fois par image (IMAGES_PAR_SECONDE) : à grande vitesse,
+    des milliers de coups sont joués entre deux images sans être dessinés.
+    aller_a_la_fin joue tous les coups restants sans aucun affichage intermédiaire.
+
+    Attributs:
+        fenetre (tk.Tk): La fenêtre dont la boucle cadence la lecture.
+        vitesse (float): Nombre de coups joués par seconde.
+        jouer_coups (callable | None): Applique un lot de mouvements (voir JeuHanoi.jouer_coups).
+        mouvements (iterator | None): Les mouvements restants (tour départ, tour arrivée).
+        nb_joues (int): Nombre de coups joués depuis le lancement.
+    """
+    IMAGES_PAR_SECONDE = 30
+
+    def __init__(self, fenetre, vitesse=2.5):
+        self.fenetre = fenetre
+        self.vitesse = vitesse
+        self.jouer_coups = None
+        self.mouvements = None
+        self.nb_joues = 0
+        self.credit = 0.0
+        self.instant_precedent = None
+        self.id_image = None
+        self.rappel_rendu = None
+        self.rappel_fin = None
+
+    def en_cours(self):
+        """
+        Indique si une lecture est en cours.
+
+        Returns:
+            bool: True si des mouvements restent à jouer.
+        """
+        return self.mouvements is not None
+
+    def lancer(self, jouer_coups, mouvements, rappel_rendu, rappel_fin):
+        """
+        Lance la lecture (et arrête la précédente).
+
+        Args:
+            jouer_coups (callable): Applique un lot de mouvements à la partie et renvoie
+                (nombre de coups joués, False si un coup invalide a arrêté le lot),
+                comme JeuHanoi.jouer_coups ou MoteurPartie.jouer_coups.
+            mouvements (iterable): Les mouvements (tour départ, tour arrivée) ; une liste ou un générateur.
+            rappel_rendu (callable): Appelée à chaque image où des coups ont été joués.
+            rappel_fin (callable): Appelée avec un booléen (True si tous les mouvements ont été joués,
+                False si un mouvement n'était plus valide).
+        """
+        self.arreter()
+        self.jouer_coups = jouer_coups
+        self.mouvements = iter(mouvements)
+        self.rappel_rendu = rappel_rendu
+        self.rappel_fin = rappel_fin
+        self.nb_joues = 0
+        self.credit = 0.0
+        self.instant_precedent = time.perf_counter()
+        self.id_image = self.fenetre.after(1000 // self.IMAGES_PAR_SECONDE, self.afficher_image)
+
+    def changer_vitesse(self, vitesse):
+        """
+        Change la vitesse de lecture (prise en compte dès l'image suivante).
+
+        Args:
+            vitesse (float): Nombre de coups par seconde.
+        """
+        self.vitesse = vitesse
+
+    def arreter(self):
+        """
+        Arrête la lecture en cours sans appeler rappel_fin.
+        """
+        if self.id_image is not None:
+            self.fenetre.after_cancel(self.id_image)
+            self.id_image = None
+        self.mouvements = None
+
+    def afficher_image(self):
+        """
+        Joue les coups dus depuis l'image précédente, puis rafraîchit l'affichage une seule fois.
+        """
+        self.id_image = None
+        instant = time.perf_counter()
+        self.credit += (instant - self.instant_precedent) * self.vitesse
+        self.instant_precedent = instant
+
+        nb_dus = int(self.credit)
+        if nb_dus:
+            self.credit -= nb_dus
+            if self.jouer(nb_dus):
+                return
+            self.rappel_rendu()
+        self.id_image = self.fenetre.after(1000 // self.IMAGES_PAR_SECONDE, self.afficher_image)
+
+    def aller_a_la_fin(self):
+        """
+        Joue tous les coups restants sans les afficher, puis rafraîchit l'affichage une fois.
+        """
+        if self.id_image is not None:
+            self.fenetre.after_cancel(self.id_image)
+            self.id_image = None
+        if self.mouvements is not None:
+            self.jouer(None)
+
+    def jouer(self, nb_max):
+        """
+        Joue au plus nb_max coups (tous si None) ; termine la lecture s'il n'en reste plus.
+
+        Args:
+            nb_max (int | None): Nombre maximal de coups à jouer.
+
+        Returns:
+            bool: True si la lecture est terminée.
+        """
+        nb, valide = self.jouer_coups(itertools.islice(self.mouvements, nb_max))
+        self.nb_joues += nb
+        if not valide or nb_max is None or nb < nb_max:
+            # Plus de mouvements, ou un mouvement invalide (partie modifiée pendant la lecture)
+            rappel_rendu, rappel_fin = self.rappel_rendu, self.rappel_fin
+            self.arreter()
+            rappel_rendu()
+            rappel_fin(valide)
+            return True
+        return False
@@ -0,0 +1,211 @@
+import time
+
+from BaseMotifs import BaseMotifs
+from CodecEtat import CodecEtat
+from SolveurConfigurations import SolveurConfigurations
+from CacheDistances import CacheDistances
+
+
+class MoteurIndices:
+    """
+    Donne le prochain coup conseillé (« Aide-moi ») dans un délai borné, quelle
+    que soit la taille de la partie, en disant s'il est prouvé optimal.
+
+    Par ordre de coût : le cache des solutions déjà calculées et les solutions
+    directes (configuration légale) répondent sans recherche et sont optimaux.
+    Sinon, un A* pondéré trouve vite un chemin (ou, sur un plateau de
+    l'heuristique, une recherche gloutonne), puis A* (raccordé aux
+    configurations légales, voir SolveurConfigurations.distances_resolues) le
+    remplace par la solution optimale s'il termine avant l'échéance.
+
+    Le chemin rapide (complet, ou interrompu par l'échéance sur un état plus
+    proche de l'objectif que le départ) est gardé d'un indice à l'autre : tant
+    que le joueur le suit, les indices suivants le continuent au lieu de
+    repartir dans une autre direction, et chaque nouveau chemin partiel
+    rapproche strictement de l'objectif selon l'heuristique.
+
+    Le codec, le solveur et ses tables (bases de motifs, table des distances
+    déjà enregistrée) sont préparés une fois par partie (voir preparer), hors
+    du délai des indices. Un indice ne calcule jamais de table : tant que les
+    bases de motifs d'une partie mélangée ne sont pas enregistrées (voir
+    SolveurArrierePlan.preparer_bases_motifs), il n'y a pas d'indice.
+
+    Attributs:
+        delai (float): Temps accordé à chaque indice, en secondes.
+        cache (CacheDistances): Solutions optimales déjà connues (partagé avec le solveur
+            en arrière-plan) ; les solutions prouvées ici y sont ajoutées.
+        plan (dict): {etat_tuple: mouvement en numéros de tour} le long du chemin rapide en cours.
+    """
+    DELAI_DEFAUT = 0.05
+    # Part du délai gardée pour le travail hors des recherches (chemin, cache, coup de secours)
+    MARGE = 0.2
+    # Poids de l'heuristique de la première recherche (A* pondéré)
+    POIDS_RAPIDE = 4
+
+    def __init__(self, delai=DELAI_DEFAUT, cache=None):
+        self.delai = delai
+        self.cache = cache if cache is not None else CacheDistances()
+        self.oublier()
+
+    def oublier(self):
+        """
+        Oublie la partie préparée et son chemin rapide (nouvelle partie pas encore préparée).
+        """
+        self.plan = {}
+        self.solveur = self.objectif = self.distance_resolue = None
+        self.idx_tour_cible = None
+
+    def preparer(self, jeu, construire=True):
+        """
+        Prépare le solveur d'une nouvelle partie : codec construit sur son état de départ
+        (il encode tous les états atteignables, les bases ne faisant que raccourcir),
+        bases de motifs chargées (ou calculées) et table des distances si elle est déjà
+        enregistrée. Oublie le chemin rapide de la partie précédente.
+
+        Args:
+            jeu (JeuHanoi): La partie qui commence.
+            construire (bool): Si False, les bases de motifs ne sont utilisées que si elles
+                sont déjà enregistrées (voir BaseMotifs.disponible) ; sinon la partie reste
+                non préparée.
+
+        Returns:
+            bool: True si la partie est préparée.
+        """
+        self.oublier()
+        self.idx_tour_cible = jeu.idx_tour_cible
+        etat_initial = jeu.journal.etat_initial
+        if not any(etat_initial):
+            return False
+        codec = CodecEtat(etat_initial, len(etat_initial))
+        if codec.nb_tours == 3 and not construire and not BaseMotifs.disponible(codec.nb_disques):
+            return False
+        solveur = SolveurConfigurations(codec)
+        objectif = solveur.objectif_tour(jeu.idx_tour_cible)
+        solveur.heuristiques(codec.encoder(etat_initial), objectif)
+        self.distance_resolue = solveur.distances_resolues(jeu.idx_tour_cible, construire_table=False)
+        self.solveur, self.objectif = solveur, objectif
+        return True
+
+    def indice(self, jeu, delai=None):
+        """
+        Calcule le coup conseillé depuis l'état actuel de la partie.
+
+        Args:
+            jeu (JeuHanoi): La partie (préparée avec preparer ; sinon elle l'est ici, sans
+                calculer de table).
+            delai (float | None): Temps accordé en secondes (self.delai si None).
+
+        Returns:
+            tuple[tuple[int, int] | None, bool]: (mouvement (tour départ, tour arrivée) en
+            numéros de tour, ou None si la partie est déjà rangée ; True si ce mouvement
+            commence une solution optimale). (None, False) si la partie n'a pas encore pu
+            être préparée.
+        """
+        debut = time.perf_counter()
+        etat_tuple = jeu.etat_tuple()
+        entree = self.cache.consulter(etat_tuple, jeu.idx_tour_cible)
+        if entree is not None:
+            return entree[1], True
+
+        numeros = [tour.numero for tour in jeu.tours]
+        directe = SolveurConfigurations.solution_directe(etat_tuple, jeu.idx_tour_cible, construire_table=False)
+        if directe is not None:
+            mouvement = next(directe[1], None)
+            if mouvement is None:
+                return None, True
+            return (numeros[mouvement[0]], numeros[mouvement[1]]), True
+
+        try:
+            if self.idx_tour_cible != jeu.idx_tour_cible:
+                raise ValueError("Tour cible différente de celle de la partie préparée")
+            code_depart = self.solveur.codec.encoder(etat_tuple)
+        except (AttributeError, ValueError):
+            # Partie non préparée, ou état venu d'ailleurs (charger_etat)
+            if not self.preparer(jeu, construire=False):
+                return None, False
+            code_depart = self.solveur.codec.encoder(etat_tuple)
+        echeance = debut + (1 - self.MARGE) * (self.delai if delai is None else delai)
+        solveur, objectif, distance_resolue = self.solveur, self.objectif, self.distance_resolue
+        h_initiale, heuristique_voisin = solveur.heuristiques(code_depart, objectif)
+
+        # Réponse rapide, sans garantie : le chemin en cours s'il passe par cet état, sinon un nouveau
+        if etat_tuple not in self.plan:
+            maintenant = time.perf_counter()
+            chemin, _ = solveur.rechercher_a_etoile(
+                code_depart, objectif, h_initiale, heuristique_voisin, distance_resolue=distance_resolue,
+                poids=self.POIDS_RAPIDE, echeance=maintenant + (echeance - maintenant) / 2)
+            if not chemin:
+                chemin, _ = solveur.rechercher_a_etoile(
+                    code_depart, objectif, h_initiale, heuristique_voisin, distance_resolue=distance_resolue,
+                    poids=None, echeance=echeance)
+            mouvements_numeros = [(numeros[idx_source], numeros[idx_dest])
+                                  for idx_source, idx_dest in reversed(chemin)]
+            etats = self.etats_chemin(etat_tuple, mouvements_numeros)
+            self.plan = dict(zip(etats, mouvements_numeros))
+        mouvement = self.plan.get(etat_tuple)
+
+        # Raffinement : la solution optimale, si elle tient dans le temps restant
+        if time.perf_counter() < echeance:
+            chemin, trouve = solveur.rechercher_a_etoile(
+                code_depart, objectif, h_initiale, heuristique_voisin, distance_resolue=distance_resolue,
+                echeance=echeance)
+            if trouve and chemin:
+                self.enregistrer_debut(solveur.codec, code_depart, etat_tuple, list(reversed(chemin)),
+                                       distance_resolue, numeros,
+                                       limite=debut + (self.delai if delai is None else delai))
+                idx_source, idx_dest = chemin[-1]
+                return (numeros[idx_source], numeros[idx_dest]), True
+
+        if mouvement is None:
+            # Aucun état meilleur que le départ trouvé à temps : le voisin de plus petite heuristique
+            voisins = solveur.codec.generer_voisins(code_depart)
+            _, (idx_source, idx_dest) = min(
+                voisins, key=lambda voisin: heuristique_voisin(h_initiale, code_depart, voisin[0], voisin[1]))
+            mouvement = (numeros[idx_source], numeros[idx_dest])
+        return mouvement, False
+
+    def etats_chemin(self, etat_tuple, mouvements_numeros):
+        """
+        États d'où part chaque mouvement d'un chemin.
+
+        Args:
+            etat_tuple (tuple): L'état de départ du chemin.
+            mouvements_numeros (list[tuple[int, int]]): Les mouvements, en numéros de tour.
+
+        Returns:
+            list[tuple]: Un état par mouvement, le premier étant etat_tuple.
+        """
+        etats = [etat_tuple]
+        for mouvement in mouvements_numeros[:-1]:
+            etats.append(self.cache.appliquer(etats[-1], mouvement))
+        return etats[:len(mouvements_numeros)]
+
+    def enregistrer_debut(self, codec, code_depart, etat_tuple, mouvements, distance_resolue, numeros, limite=None):
+        """
+        Ajoute au cache le début d'une solution optimale, jusqu'à la configuration légale
+        où elle rejoint la solution directe : les indices suivants sont alors immédiats.
+
+        Args:
+            codec (CodecEtat): Le codec de la recherche.
+            code_depart (int): L'état de départ encodé.
+            etat_tuple (tuple): Le même état, sous forme de tuple de tuples.
+            mouvements (list[tuple[int, int]]): Mouvements 0-indexés du début de solution.
+            distance_resolue (callable | None): Distance exacte des configurations légales
+                (voir SolveurConfigurations.distances_resolues).
+            numeros (list[int]): Numéro de chaque tour.
+            limite (float | None): Instant (time.perf_counter) après lequel on n'enregistre plus
+                rien ; les états les plus proches du départ passent en premier.
+        """
+        code = code_depart
+        for idx_source, idx_dest in mouvements:
+            code = codec.deplacer(code, codec.sommets(code), idx_source, idx_dest)
+        distance_fin = distance_resolue(code) if distance_resolue else 0
+
+        mouvements_numeros = [(numeros[idx_source], numeros[idx_dest]) for idx_source, idx_dest in mouvements]
+        etats = self.etats_chemin(etat_tuple, mouvements_numeros)
+        distance = distance_fin + len(mouvements_numeros)
+        for etat, mouvement in zip(etats, mouvements_numeros):
+            if limite is not None and time.perf_counter() > limite:
+                break
+            self.cache.enregistrer(etat, distance, mouvement, self.idx_tour_cible)
+            distance -= 1
@@ -0,0 +1,233 @@
+import time
+
+from JeuHanoi import JeuHanoi
+from JournalCoups import JournalCoups
+from Quiz import Quiz
+
+
+class MoteurPartie:
+    """
+    Déroulement d'une partie sans interface graphique : coups, déclenchement du
+    quiz, bonus/malus de temps, détection de la victoire et score final.
+
+    Le Controleur s'en sert pour la partie affichée ; sans Tk, il permet de faire
+    jouer des robots, de rejouer des parties ou de faire des tests de charge
+    (jouer_coups applique une suite de coups dans une seule boucle).
+
+    Attributs:
+        jeu (JeuHanoi): La partie en cours.
+        quiz (Quiz): Le gestionnaire de quiz.
+        repondeur (callable | None): Si fourni, répond immédiatement à chaque question
+            (question -> réponse) ; sinon la question reste en attente de repondre_quiz.
+        question_en_attente (str | None): Question posée et pas encore répondue.
+        places_quiz (int): Nombre de disques bien placés sur la tour cible ayant déjà donné lieu à une question.
+        dernier_coup_correct (bool): True si le dernier coup demandé a été joué.
+        gagnee (bool): True une fois la victoire constatée (score final ajouté).
+    """
+    def __init__(self, quiz=None, horloge=time.time, repondeur=None):
+        self.quiz = quiz if quiz is not None else Quiz()
+        self.horloge = horloge
+        self.repondeur = repondeur
+        self.jeu = None
+        self.question_en_attente = None
+        self.places_quiz = 0
+        self.dernier_coup_correct = False
+        self.gagnee = False
+
+    def demarrer_partie(self, nb_disques, mode_aleatoire=False, nb_tours=3):
+        """
+        Initialise une nouvelle partie et lance le chronomètre.
+
+        Args:
+            nb_disques (int): Nombre de disques.
+            mode_aleatoire (bool): Active ou non le mode aléatoire.
+            nb_tours (int): Nombre de tours (la dernière est la tour d'arrivée).
+
+        Returns:
+            JeuHanoi: La nouvelle partie.
+        """
+        self.jeu = JeuHanoi(nb_disques, nb_tours=nb_tours)
+        self.jeu.horloge = self.horloge
+        self.jeu.initialiser_disques(mode_aleatoire)
+        self.jeu.demarrer_chrono()
+        self.places_quiz = 0
+        self.question_en_attente = None
+        self.dernier_coup_correct = False
+        self.gagnee = False
+        return self.jeu
+
+    def jouer_coup(self, depart, arrivee, resolution_auto=False):
+        """
+        Joue un coup, puis déclenche le quiz et vérifie la victoire.
+
+        Args:
+            depart (int): Numéro de la tour de départ (à partir de 1).
+            arrivee (int): Numéro de la tour d'arrivée (à partir de 1).
+            resolution_auto (bool): True pendant la résolution automatique (pas de quiz).
+
+        Returns:
+            bool: True si le coup a été joué.
+        """
+        tours = self.jeu.tours
+        if not (1 <= depart <= len(tours) and 1 <= arrivee <= len(tours)):
+            self.dernier_coup_correct = False
+            return False
+        self.dernier_coup_correct = self.jeu.jouer_coup(tours[depart - 1], tours[arrivee - 1])
+        if self.dernier_coup_correct and arrivee == self.jeu.idx_tour_cible + 1:
+            self.apres_coup_sur_cible(resolution_auto)
+        return self.dernier_coup_correct
+
+    def jouer_coups(self, mouvements, resolution_auto=False):
+        """
+        Joue une suite de coups dans une seule boucle, avec les mêmes règles que jouer_coup.
+
+        La suite s'arrête au premier coup invalide, ou après un coup qui pose une
+        question sans repondeur (la partie attend alors repondre_quiz).
+
+        Args:
+            mouvements (iterable): Mouvements (tour départ, tour arrivée) en numéros de tour.
+            resolution_auto (bool): True pendant la résolution automatique (pas de quiz).
+
+        Returns:
+            tuple[int, bool]: (nombre de coups joués, False si un coup invalide a arrêté la suite).
+        """
+        jeu = self.jeu
+        piles = [tour.tailles for tour in jeu.tours]
+        idx_cible = jeu.idx_tour_cible
+        pile_cible = piles[idx_cible]
+        tailles_cibles = jeu.tailles_cibles
+        # Chaque coup possible -> (pile départ, pile arrivée, octet du journal, part de la cible,
+        # arrive sur la cible) : un coup absent (tour inexistante ou identique) est invalide
+        coups = {(idx_depart + 1, idx_arrivee + 1): (piles[idx_depart], piles[idx_arrivee],
+                                                     JournalCoups.coder(idx_depart, idx_arrivee),
+                                                     idx_depart == idx_cible, idx_arrivee == idx_cible)
+                 for idx_depart in range(len(piles)) for idx_arrivee in range(len(piles))
+                 if idx_depart != idx_arrivee}
+        # Suivi des disques bien placés de JeuHanoi.deplacer_sommet, sans appel de méthode par
+        # coup ; disques_places et nbr_coups sont remis dans jeu avant chaque apres_coup_sur_cible
+        disques_places = jeu.disques_places
+        nbr_coups_depart = jeu.nbr_coups
+        # Coups codés comme dans le journal, ajoutés d'un bloc à la fin (voir JournalCoups.enregistrer_lot)
+        lot = bytearray()
+        try:
+            for mouvement in mouvements:
+                try:
+                    coup = coups.get(mouvement)
+                except TypeError:  # Mouvement donné en liste
+                    coup = coups.get(tuple(mouvement))
+                if coup is None:
+                    self.dernier_coup_correct = False
+                    return len(lot), False
+                pile_depart, pile_arrivee, octet, depuis_cible, vers_cible = coup
+                # Mêmes règles que JeuHanoi.deplacement_valide
+                if not pile_depart or (pile_arrivee and pile_arrivee[-1] <= pile_depart[-1]):
+                    self.dernier_coup_correct = False
+                    return len(lot), False
+                pile_arrivee.append(pile_depart.pop())
+                lot.append(octet)
+                if depuis_cible:
+                    if disques_places > len(pile_cible):
+                        disques_places -= 1
+                elif vers_cible:
+                    if disques_places == len(pile_cible) - 1 and pile_cible[-1] == tailles_cibles[disques_places]:
+                        disques_places += 1
+                    jeu.disques_places = disques_places
+                    jeu.nbr_coups = nbr_coups_depart + len(lot)
+                    self.apres_coup_sur_cible(resolution_auto)
+                    if self.question_en_attente is not None:
+                        break
+        finally:
+            jeu.disques_places = disques_places
+            jeu.nbr_coups = nbr_coups_depart + len(lot)
+            jeu.journal.enregistrer_lot(lot)
+        self.dernier_coup_correct = True
+        return len(lot), True
+
+    def annuler_coup(self):
+        """
+        Annule le dernier coup (voir JeuHanoi.annuler_coup). Une question déjà posée
+        pour un disque bien placé ne l'est pas une seconde fois.
+
+        Returns:
+            tuple[int, int] | None: Le coup annulé, ou None s'il n'y a rien à annuler.
+        """
+        if self.gagnee:
+            return None
+        return self.jeu.annuler_coup()
+
+    def retablir_coup(self):
+        """
+        Rejoue le dernier coup annulé, avec les mêmes règles qu'un coup joué.
+
+        Returns:
+            tuple[int, int] | None: Le coup rejoué, ou None s'il n'y a rien à rétablir.
+        """
+        if self.gagnee:
+            return None
+        mouvement = self.jeu.retablir_coup()
+        if mouvement is not None and mouvement[1] == self.jeu.idx_tour_cible + 1:
+            self.apres_coup_sur_cible(False)
+        return mouvement
+
+    def apres_coup_sur_cible(self, resolution_auto):
+        """
+        Après un disque posé sur la tour cible : pose une question si un nouveau disque
+        y est bien placé (hors résolution automatique), puis vérifie la victoire.
+        Les deux tests sont en O(1) grâce à JeuHanoi.disques_places.
+
+        Args:
+            resolution_auto (bool): True pendant la résolution automatique.
+        """
+        if not resolution_auto and self.jeu.disques_places > self.places_quiz:
+            self.places_quiz = self.jeu.disques_places
+            question, _ = self.quiz.poser_question()
+            self.question_en_attente = question
+            if self.repondeur is not None:
+                self.repondre_quiz(self.repondeur(question))
+                return
+        if self.question_en_attente is None:
+            self.verifier_victoire()
+
+    def repondre_quiz(self, reponse):
+        """
+        Répond à la question en attente : bonus de temps si la réponse est juste,
+        malus sinon, puis vérifie la victoire.
+
+        Args:
+            reponse (str | None): Réponse donnée par le joueur.
+
+        Returns:
+            tuple[bool, int] | None: (réponse correcte, secondes de bonus ou de malus),
+            ou None si la partie n'est pas en cours.
+        """
+        self.question_en_attente = None
+        if not self.jeu.etat_partie:
+            return None
+
+        if self.quiz.verifier_reponse(reponse):
+            # Bonne réponse: bonus de temps
+            secondes = self.quiz.attribuer_bonus_temps()
+            self.jeu.temps_debut = max(0, self.jeu.temps_debut + secondes)
+            correcte = True
+        else:
+            # Mauvaise réponse: malus de temps
+            secondes = self.quiz.attribuer_malus_temps()
+            self.jeu.temps_debut -= secondes
+            correcte = False
+        self.verifier_victoire()
+        return correcte, secondes
+
+    def verifier_victoire(self):
+        """
+        Si tous les disques sont sur la dernière tour, arrête le chrono et ajoute le score final.
+
+        Returns:
+            bool: True si la partie est gagnée.
+        """
+        if not self.jeu.gagner():
+            return False
+        self.jeu.arreter_chrono()
+        score_final = max(1000 - self.jeu.nbr_coups * 10 - int(self.jeu.chrono) * 5, 0)
+        self.jeu.ajouter_score(score_final)
+        self.gagnee = True
+        return True
@@ -0,0 +1,222 @@
+import multiprocessing
+import queue
+
+from JeuHanoi import JeuHanoi
+from CacheDistances import CacheDistances
+from BaseMotifs import BaseMotifs
+
+
+def resoudre_en_processus(nombre_disques, etat_tuple, file_messages, mode_solveur='astar', budget_memoire=None):
+    """
+    Point d'entrée du processus de résolution : résout l'état reçu et renvoie
+    la progression puis le résultat par la file de messages.
+
+    Args:
+        nombre_disques (int): Nombre de disques de la partie.
+        etat_tuple (tuple): L'état à résoudre (tuple de tuples, fond -> sommet).
+        file_messages (multiprocessing.Queue): File vers l'interface.
+        mode_solveur (str): Mode de recherche (voir JeuHanoi.MODES_SOLVEUR).
+        budget_memoire (int | None): Budget mémoire du mode 'ida', en octets.
+    """
+    jeu = JeuHanoi(nombre_disques, nb_tours=len(etat_tuple))
+    jeu.charger_etat(etat_tuple)
+    mouvements = jeu.resoudre_automatiquement(
+        rappel_progression=lambda nb: file_messages.put(("progression", nb)),
+        mode_solveur=mode_solveur, budget_memoire=budget_memoire)
+    file_messages.put(("resultat", mouvements))
+
+
+def construire_bases_en_processus(nb_disques):
+    """
+    Point d'entrée du processus de préparation : calcule et enregistre les bases
+    de motifs d'une partie (voir BaseMotifs.construire_tables).
+
+    Args:
+        nb_disques (int): Nombre de disques de la partie.
+    """
+    BaseMotifs.construire_tables(nb_disques)
+
+
+class SolveurArrierePlan:
+    """
+    Lance la résolution dans un processus séparé pour ne jamais bloquer la boucle Tk.
+
+    Le résultat revient dans la boucle Tk par une file de messages, lue toutes
+    les INTERVALLE_SONDAGE millisecondes avec fenetre.after.
+
+    Les bases de motifs manquantes sont aussi calculées dans un processus à part
+    (preparer_bases_motifs), indépendant des résolutions : annuler ne l'arrête pas.
+
+    Attributs:
+        fenetre (tk.Tk): La fenêtre dont la boucle lit les messages.
+        processus (multiprocessing.Process | None): Le processus de résolution en cours.
+        etat_resolu (tuple | None): L'état en cours de résolution.
+        idx_tour_cible (int | None): Index 0-basé de la tour cible de cet état.
+        cache (CacheDistances): Distances et prochains mouvements des solutions déjà calculées.
+        processus_bases (multiprocessing.Process | None): Le processus qui calcule les bases de motifs.
+        nb_disques_bases (int | None): Nombre de disques des bases calculées par ce processus.
+        mode_solveur (str): Mode de recherche transmis à resoudre_automatiquement (voir JeuHanoi.MODES_SOLVEUR).
+        budget_memoire (int | None): Budget mémoire du mode 'ida', en octets.
+    """
+    INTERVALLE_SONDAGE = 50
+
+    def __init__(self, fenetre, mode_solveur='astar', budget_memoire=None):
+        self.fenetre = fenetre
+        self.mode_solveur = mode_solveur
+        self.budget_memoire = budget_memoire
+        self.processus = None
+        self.file_messages = None
+        self.id_sondage = None
+        self.etat_resolu = None
+        self.idx_tour_cible = None
+        self.rappel_resultat = None
+        self.rappel_progression = None
+        self.cache = CacheDistances()
+        self.processus_bases = None
+        self.nb_disques_bases = None
+        self.id_sondage_bases = None
+        self.rappel_bases = None
+
+    def en_cours(self):
+        """
+        Indique si une résolution est en cours.
+
+        Returns:
+            bool: True si un processus de résolution tourne.
+        """
+        return self.processus is not None
+
+    def lancer(self, jeu, rappel_resultat, rappel_progression=None):
+        """
+        Lance la résolution de l'état actuel du jeu (et annule la précédente).
+        Un état déjà présent dans le cache est servi sans lancer de recherche.
+
+        Args:
+            jeu (JeuHanoi): La partie dont on résout l'état actuel.
+            rappel_resultat (callable): Appelée dans la boucle Tk avec (etat_tuple, mouvements).
+            rappel_progression (callable | None): Appelée dans la boucle Tk avec le nombre d'états développés.
+        """
+        self.annuler()
+        self.etat_resolu = jeu.etat_tuple()
+        self.idx_tour_cible = jeu.idx_tour_cible
+        self.rappel_resultat = rappel_resultat
+        self.rappel_progression = rappel_progression
+
+        mouvements = self.cache.mouvements_depuis(self.etat_resolu, self.idx_tour_cible)
+        if mouvements is not None:
+            self.id_sondage = self.fenetre.after(0, lambda: self.livrer(mouvements))
+            return
+
+        self.file_messages = multiprocessing.Queue()
+        self.processus = multiprocessing.Process(
+            target=resoudre_en_processus,
+            args=(jeu.nombre_disques, self.etat_resolu, self.file_messages,
+                  self.mode_solveur, self.budget_memoire),
+            daemon=True)
+        self.processus.start()
+        self.id_sondage = self.fenetre.after(self.INTERVALLE_SONDAGE, self.sonder)
+
+    def preparer_bases_motifs(self, nb_disques, rappel_pret):
+        """
+        S'assure que les bases de motifs d'une partie sont enregistrées, en les calculant
+        hors de la boucle Tk s'il le faut, puis appelle rappel_pret dans la boucle Tk.
+        Une préparation demandée pendant une autre remplace seulement son rappel : le
+        calcul en cours se poursuit, puis celui des tables encore manquantes.
+
+        Args:
+            nb_disques (int): Nombre de disques de la partie.
+            rappel_pret (callable): Appelée sans argument une fois les tables disponibles.
+        """
+        if self.id_sondage_bases is not None:
+            self.fenetre.after_cancel(self.id_sondage_bases)
+        self.rappel_bases = rappel_pret
+        if self.processus_bases is None and BaseMotifs.disponible(nb_disques):
+            self.id_sondage_bases = self.fenetre.after(0, self.livrer_bases)
+            return
+        self.id_sondage_bases = self.fenetre.after(0, lambda: self.sonder_bases(nb_disques))
+
+    def sonder_bases(self, nb_disques):
+        """
+        Attend la fin du calcul des bases de motifs, en le lançant s'il le faut.
+
+        Args:
+            nb_disques (int): Nombre de disques de la partie.
+        """
+        self.id_sondage_bases = None
+        deja_tente = False
+        if self.processus_bases is not None:
+            if self.processus_bases.is_alive():
+                self.id_sondage_bases = self.fenetre.after(self.INTERVALLE_SONDAGE,
+                                                           lambda: self.sonder_bases(nb_disques))
+                return
+            self.processus_bases.join()
+            deja_tente = self.nb_disques_bases == nb_disques
+            self.processus_bases = None
+        if deja_tente or BaseMotifs.disponible(nb_disques):
+            # Après un échec du calcul, le rappel est appelé quand même (une seule tentative)
+            self.livrer_bases()
+            return
+        self.processus_bases = multiprocessing.Process(
+            target=construire_bases_en_processus, args=(nb_disques,), daemon=True)
+        self.nb_disques_bases = nb_disques
+        self.processus_bases.start()
+        self.id_sondage_bases = self.fenetre.after(self.INTERVALLE_SONDAGE, lambda: self.sonder_bases(nb_disques))
+
+    def livrer_bases(self):
+        """
+        Transmet au rappel que les bases de motifs sont prêtes.
+        """
+        self.id_sondage_bases = None
+        rappel_bases, self.rappel_bases = self.rappel_bases, None
+        if rappel_bases:
+            rappel_bases()
+
+    def annuler(self):
+        """
+        Arrête la résolution en cours, s'il y en a une ; son résultat ne sera jamais livré.
+        """
+        if self.id_sondage is not None:
+            self.fenetre.after_cancel(self.id_sondage)
+            self.id_sondage = None
+        if self.processus is not None:
+            if self.processus.is_alive():
+                self.processus.terminate()
+            self.processus.join()
+            self.processus = None
+        self.file_messages = None
+
+    def sonder(self):
+        """
+        Lit les messages du processus sans bloquer et les transmet aux rappels.
+        """
+        self.id_sondage = None
+        try:
+            while True:
+                type_message, contenu = self.file_messages.get_nowait()
+                if type_message == "progression":
+                    if self.rappel_progression:
+                        self.rappel_progression(contenu)
+                elif type_message == "resultat":
+                    self.cache.enregistrer_solution(self.etat_resolu, contenu, self.idx_tour_cible)
+                    self.livrer(contenu)
+                    return
+        except queue.Empty:
+            pass
+
+        if not self.processus.is_alive() and self.file_messages.empty():
+            # Le processus s'est arrêté sans résultat
+            self.livrer([])
+            return
+        self.id_sondage = self.fenetre.after(self.INTERVALLE_SONDAGE, self.sonder)
+
+    def livrer(self, mouvements):
+        """
+        Termine la résolution en cours et transmet les mouvements au rappel.
+
+        Args:
+            mouvements (list[tuple[int, int]]): Les mouvements (tour départ, tour arrivée).
+        """
+        self.id_sondage = None
+        rappel_resultat, etat_resolu = self.rappel_resultat, self.etat_resolu
+        self.annuler()
+        rappel_resultat(etat_resolu, mouvements)
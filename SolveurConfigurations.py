@@ -0,0 +1,599 @@
+import time
+
+from SolveurOptimal import SolveurOptimal
+from SolveurFrameStewart import SolveurFrameStewart
+from TableDistances import TableDistances
+from BaseMotifs import BaseMotifs
+from FileSeaux import FileSeaux
+from SolveurParallele import SolveurParallele
+
+
+class SolveurConfigurations:
+    """
+    Résout le passage d'une configuration à une autre sur des états encodés
+    (voir CodecEtat), sans partie ni objets Tour : rien n'est modifié, et un
+    même solveur sert à autant de requêtes qu'on veut.
+
+    Le départ peut être légal ou non (mode aléatoire). Un objectif est un tuple
+    (masque, valeur, idx_tour_cible) : un état encodé code l'atteint si
+    code & masque == valeur. Il se construit avec objectif_tour (tous les
+    disques sur une tour), objectif_configuration (une configuration entière)
+    ou objectif_partiel (la tour de quelques disques seulement) ; idx_tour_cible
+    ne vaut pas None que pour objectif_tour, qui profite des solutions sans
+    recherche et des heuristiques les plus fortes.
+
+    Attributs:
+        codec (CodecEtat): Le codec des états (un codec construit sur un état légal
+            encode tous les états légaux des mêmes disques).
+    """
+    # Nombre d'états développés entre deux appels de rappel_progression
+    INTERVALLE_PROGRESSION = 2000
+    # Modes de recherche disponibles pour les configurations illégales
+    MODES_SOLVEUR = ('astar', 'ida', 'parallele', 'bidirectionnel')
+    # Budget par défaut de la table de transposition d'IDA*, et coût estimé d'une entrée (dict d'entiers)
+    BUDGET_MEMOIRE_DEFAUT = 64 * 1024 * 1024
+    OCTETS_PAR_ENTREE_TRANSPOSITION = 120
+
+    def __init__(self, codec):
+        self.codec = codec
+        # Tous les bits d'un état encodé (tours des disques et longueurs des bases)
+        self.masque_complet = (1 << (codec.decalage_bases + codec.nb_tours * codec.bits_base)) - 1
+        # Bases de motifs déjà préparées pour ce codec : {idx_tour_cible: BaseMotifs}
+        self.motifs = {}
+
+    def objectif_tour(self, idx_tour_cible):
+        """
+        Objectif « tous les disques empilés dans l'ordre sur une tour ».
+
+        Args:
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            tuple[int, int, int]: L'objectif (masque, valeur, idx_tour_cible).
+        """
+        return self.masque_complet, self.codec.code_objectif(idx_tour_cible), idx_tour_cible
+
+    def objectif_configuration(self, etat_tuple):
+        """
+        Objectif « exactement cette configuration ».
+
+        Args:
+            etat_tuple (tuple): La configuration visée (tuple de tuples, fond -> sommet).
+
+        Returns:
+            tuple[int, int, None]: L'objectif (masque, valeur, None).
+
+        Raises:
+            ValueError: Si la configuration n'est pas représentable par le codec (partie illégale
+                qui ne provient pas de l'état de départ du codec).
+        """
+        return self.masque_complet, self.codec.encoder(etat_tuple), None
+
+    def objectif_partiel(self, positions):
+        """
+        Objectif « ces disques sur ces tours », les autres disques étant n'importe où.
+
+        Args:
+            positions (dict[int, int]): {taille du disque: index 0-basé de sa tour}.
+
+        Returns:
+            tuple[int, int, None]: L'objectif (masque, valeur, None).
+        """
+        codec = self.codec
+        masque = valeur = 0
+        for taille, idx_tour in positions.items():
+            decalage = codec.rang[taille] * codec.bits_tour
+            masque |= codec.masque_tour << decalage
+            valeur |= idx_tour << decalage
+        return masque, valeur, None
+
+    def disques_hors_objectif(self, code, masque, valeur):
+        """
+        Heuristique admissible et cohérente pour un objectif quelconque : chaque disque
+        qui n'est pas sur sa tour visée doit bouger au moins une fois, et un déplacement
+        ne bouge qu'un disque.
+
+        Args:
+            code (int): L'état encodé.
+            masque (int): Masque de l'objectif.
+            valeur (int): Valeur de l'objectif.
+
+        Returns:
+            int: Nombre de disques visés qui ne sont pas sur leur tour.
+        """
+        codec = self.codec
+        x = (code ^ valeur) & masque & codec.masque_disques
+        reduit = x
+        for decalage in range(1, codec.bits_tour):
+            reduit |= x >> decalage
+        return bin(reduit & codec.masque_unites).count("1")
+
+    def tours_interchangeables(self, objectif):
+        """
+        Trouve les tours que l'objectif ne distingue pas : aucun disque visé n'y est
+        attendu et aucune base n'y est demandée. Échanger leurs contenus donne un
+        état à la même distance de l'objectif (voir CodecEtat.canoniser).
+
+        Args:
+            objectif (tuple): L'objectif (masque, valeur, idx_tour_cible).
+
+        Returns:
+            list[int]: Index 0-basés de ces tours.
+        """
+        codec = self.codec
+        masque, valeur, idx_tour_cible = objectif
+        if idx_tour_cible is not None:
+            return [idx_tour for idx_tour in range(codec.nb_tours) if idx_tour != idx_tour_cible]
+        distinguees = set()
+        for rang in range(codec.nb_disques):
+            decalage = rang * codec.bits_tour
+            if (masque >> decalage) & codec.masque_tour:
+                distinguees.add((valeur >> decalage) & codec.masque_tour)
+        for idx_tour in range(codec.nb_tours):
+            decalage = codec.decalage_bases + idx_tour * codec.bits_base
+            if (masque & valeur) >> decalage & codec.masque_base:
+                distinguees.add(idx_tour)
+        return [idx_tour for idx_tour in range(codec.nb_tours) if idx_tour not in distinguees]
+
+    @staticmethod
+    def solution_directe(etat_tuple, idx_tour_cible, construire_table=True):
+        """
+        Cherche une solution sans recherche vers une tour complète : n'importe quelle
+        configuration légale avec 3 tours (SolveurOptimal) ; avec plus de tours, tous
+        les disques sur une seule tour (SolveurFrameStewart) ou une configuration légale
+        lue dans la table des distances (TableDistances).
+
+        Args:
+            etat_tuple (tuple): L'état de départ (tuple de tuples, fond -> sommet).
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+            construire_table (bool): Si False, la table n'est utilisée que si elle est déjà
+                enregistrée (voir TableDistances.disponible).
+
+        Returns:
+            tuple[str, iterator] | None: ('direct' ou 'table', générateur paresseux des
+            mouvements 0-indexés dans l'ordre), ou None s'il faut une recherche.
+        """
+        nb_tours = len(etat_tuple)
+        if nb_tours == 3:
+            if not SolveurOptimal.est_legal(etat_tuple):
+                return None
+            return 'direct', SolveurOptimal(nb_tours).generer_mouvements(etat_tuple, idx_tour_cible)
+        if SolveurFrameStewart.tour_complete(etat_tuple) is not None:
+            return 'direct', SolveurFrameStewart(nb_tours).generer_mouvements(etat_tuple, idx_tour_cible)
+        nb_disques = sum(len(contenu_tour) for contenu_tour in etat_tuple)
+        if construire_table:
+            table_utilisable = TableDistances.realisable(nb_disques, nb_tours)
+        else:
+            table_utilisable = TableDistances.disponible(nb_disques, nb_tours)
+        if table_utilisable and SolveurOptimal.est_legal(etat_tuple):
+            return 'table', TableDistances(nb_disques, nb_tours, idx_tour_cible).generer_mouvements(etat_tuple)
+        return None
+
+    def heuristiques(self, code_depart, objectif):
+        """
+        Choisit l'heuristique de la recherche selon l'objectif : bases de motifs avec
+        3 tours et disques mal placés au-delà pour une tour complète, disques hors de
+        leur tour sinon. Toutes donnent la même valeur aux états qui ne diffèrent que
+        par l'échange de tours interchangeables.
+
+        Args:
+            code_depart (int): L'état de départ encodé.
+            objectif (tuple): L'objectif (masque, valeur, idx_tour_cible).
+
+        Returns:
+            tuple[int, callable]: (heuristique du départ,
+            (h_parent, code_parent, code_voisin, mouvement) -> h_voisin).
+        """
+        codec = self.codec
+        masque, valeur, idx_tour_cible = objectif
+        if idx_tour_cible is None:
+            def heuristique_voisin(h_parent, code_parent, code_voisin, mouvement_tuple):
+                return self.disques_hors_objectif(code_voisin, masque, valeur)
+            return self.disques_hors_objectif(code_depart, masque, valeur), heuristique_voisin
+
+        if codec.nb_tours == 3:
+            # Heuristique par bases de motifs (distances exactes de groupes de disques, additionnées),
+            # mise à jour incrémentale (un seul disque bouge)
+            if idx_tour_cible not in self.motifs:
+                self.motifs[idx_tour_cible] = BaseMotifs(codec, idx_tour_cible)
+            motifs = self.motifs[idx_tour_cible]
+            def heuristique_voisin(h_parent, code_parent, code_voisin, mouvement_tuple):
+                return motifs.heuristique_voisin(h_parent, code_parent, code_voisin)
+            return motifs.heuristique(code_depart), heuristique_voisin
+
+        # Plus de 3 tours : disques hors cible, plus deux coups par disque mal placé sur la cible
+        def heuristique_voisin(h_parent, code_parent, code_voisin, mouvement_tuple):
+            return codec.disques_mal_places(code_voisin, idx_tour_cible)
+        return codec.disques_mal_places(code_depart, idx_tour_cible), heuristique_voisin
+
+    def distances_resolues(self, idx_tour_cible, construire_table=True):
+        """
+        Distance exacte sans recherche des configurations légales vers une tour complète :
+        formule de SolveurOptimal avec 3 tours, table des distances au-delà. Une configuration
+        légale n'a que des voisins légaux : toutes les solutions d'un départ mélangé finissent
+        dans cette région, qui sert de recherche arrière déjà faite (mode 'bidirectionnel').
+
+        Args:
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+            construire_table (bool): Si False, la table n'est utilisée que si elle est déjà
+                enregistrée (voir TableDistances.disponible).
+
+        Returns:
+            callable | None: code -> distance exacte, ou None si le code a encore une base ;
+            None si ces distances ne sont pas connues (table irréalisable ou absente).
+        """
+        codec = self.codec
+        decalage_bases = codec.decalage_bases
+        if codec.nb_tours == 3:
+            if idx_tour_cible not in self.motifs:
+                self.motifs[idx_tour_cible] = BaseMotifs(codec, idx_tour_cible)
+            distance_legale = self.motifs[idx_tour_cible].distance_legale
+            def distance_resolue(code):
+                return None if code >> decalage_bases else distance_legale(code)
+            return distance_resolue
+
+        if construire_table:
+            table_utilisable = TableDistances.realisable(codec.nb_disques, codec.nb_tours)
+        else:
+            table_utilisable = TableDistances.disponible(codec.nb_disques, codec.nb_tours)
+        if not table_utilisable:
+            return None
+        table = TableDistances(codec.nb_disques, codec.nb_tours, idx_tour_cible)
+        def distance_resolue(code):
+            if code >> decalage_bases:
+                return None
+            return table.distance_rang(table.rang_positions([codec.lire_tour(code, rang)
+                                                             for rang in range(codec.nb_disques)]))
+        return distance_resolue
+
+    def resoudre(self, code_depart, objectif, mode_solveur='astar', budget_memoire=None, nb_processus=None,
+                 rappel_progression=None, statistiques=None, symetries=None):
+        """
+        Calcule une solution optimale de code_depart vers l'objectif.
+
+        Args:
+            code_depart (int): L'état de départ encodé.
+            objectif (tuple): L'objectif (voir objectif_tour, objectif_configuration, objectif_partiel).
+            mode_solveur (str): 'astar' (A*), 'ida' (IDA*, mémoire bornée), 'parallele' (A*
+                réparti sur plusieurs processus, expérimental) ou 'bidirectionnel' (A* qui s'arrête dès qu'il
+                rejoint les configurations légales, voir distances_resolues) ; ces deux derniers
+                ne visent qu'une tour complète.
+            budget_memoire (int | None): Pour 'ida', taille maximale en octets de la table
+                de transposition (BUDGET_MEMOIRE_DEFAUT si None).
+            nb_processus (int | None): Pour 'parallele', nombre de processus (un par cœur si None).
+            rappel_progression (callable | None): Appelée avec le nombre d'états développés.
+            statistiques (StatistiquesSolveur | None): Statistiques à remplir.
+            symetries (bool | None): Pour 'astar', explore un seul état par classe de symétrie
+                (voir tours_interchangeables). Si None : seulement pour une tour complète ; avec
+                un autre objectif, le coût de la canonisation de chaque voisin dépasse en
+                général le gain.
+
+        Returns:
+            list[tuple[int, int]] | None: Mouvements 0-indexés (index_tour_source,
+            index_tour_destination) dans l'ordre, ou None si l'objectif est inaccessible.
+
+        Raises:
+            ValueError: Si le mode est inconnu, ou 'parallele' ou 'bidirectionnel' sans tour
+                complète pour objectif.
+        """
+        if mode_solveur not in self.MODES_SOLVEUR:
+            raise ValueError(f"Mode de solveur inconnu : {mode_solveur}")
+        codec = self.codec
+        masque, valeur, idx_tour_cible = objectif
+        if mode_solveur in ('parallele', 'bidirectionnel') and idx_tour_cible is None:
+            raise ValueError(f"Le mode '{mode_solveur}' ne vise qu'une tour complète.")
+
+        # --- Configuration légale (ordre normal ou partie en cours ; avec plus de 3 tours,
+        # tous les disques sur une tour ou table des distances) : solution directe, sans recherche ---
+        if idx_tour_cible is not None:
+            directe = self.solution_directe(codec.decoder(code_depart), idx_tour_cible)
+            if directe is not None:
+                if statistiques:
+                    statistiques.mode_solveur = directe[0]
+                return list(directe[1])
+
+        # --- Recherche (configuration illégale, ou objectif quelconque) ---
+        h_initiale, heuristique_voisin = self.heuristiques(code_depart, objectif)
+        if statistiques:
+            heuristique_voisin = statistiques.chronometrer('temps_heuristique', heuristique_voisin)
+
+        if mode_solveur == 'parallele':
+            rappel_parallele = rappel_progression
+            if statistiques:
+                def rappel_parallele(nb_developpes):
+                    statistiques.etats_developpes = nb_developpes
+                    statistiques.publier()
+                    if rappel_progression:
+                        rappel_progression(nb_developpes)
+            chemin = SolveurParallele(nb_processus).resoudre(
+                codec.decoder(code_depart), idx_tour_cible, rappel_parallele)
+            trouve = bool(chemin) or (code_depart & masque) == valeur
+        elif mode_solveur == 'ida':
+            if budget_memoire is None:
+                budget_memoire = self.BUDGET_MEMOIRE_DEFAUT
+            chemin, trouve = self.rechercher_ida_etoile(
+                code_depart, objectif, h_initiale, heuristique_voisin,
+                budget_memoire, rappel_progression, statistiques)
+        else:
+            # Les états symétriques (tours interchangeables échangées) ne sont explorés qu'une fois.
+            # Une base ne disparaît qu'une fois tous ses disques partis, souvent en fin de recherche :
+            # sans deux tours interchangeables sans base au départ, la symétrie ne servirait presque
+            # jamais et ne ferait que ralentir chaque voisin (départ mélangé avec 3 tours)
+            canoniser = None
+            if symetries is None:
+                symetries = idx_tour_cible is not None
+            tours_interchangeables = self.tours_interchangeables(objectif) if symetries else []
+            if sum(1 for idx_tour in tours_interchangeables if not code_depart & codec.champs_bases[idx_tour]) > 1:
+                def canoniser(code):
+                    return codec.canoniser(code, tours_interchangeables)
+            # Recherche bidirectionnelle : la recherche arrière depuis la tour complète est déjà
+            # faite (distances exactes des configurations légales) ; A* n'explore que la région
+            # des bases et les deux demi-chemins sont raccordés là où elle rejoint les états légaux
+            distance_resolue = None
+            if mode_solveur == 'bidirectionnel':
+                distance_resolue = self.distances_resolues(idx_tour_cible)
+            chemin, trouve = self.rechercher_a_etoile(
+                code_depart, objectif, h_initiale, heuristique_voisin,
+                rappel_progression, statistiques, canoniser, distance_resolue)
+            if trouve and distance_resolue is not None:
+                code_jonction = code_depart
+                for idx_source, idx_dest in reversed(chemin):
+                    code_jonction = codec.deplacer(code_jonction, codec.sommets(code_jonction), idx_source, idx_dest)
+                _, suite = self.solution_directe(codec.decoder(code_jonction), idx_tour_cible)
+                return list(reversed(chemin)) + list(suite)
+
+        if not trouve:
+            return None
+        return list(reversed(chemin))
+
+    def rechercher_a_etoile(self, code_initial, objectif, h_initiale, heuristique_voisin,
+                            rappel_progression=None, statistiques=None, canoniser=None, distance_resolue=None,
+                            poids=1, echeance=None):
+        """
+        Boucle principale de l'algorithme A* sur les états encodés.
+
+        Avec canoniser, seuls les représentants canoniques des états sont gardés
+        (cout_g, provenance, file) : les mouvements mémorisés sont exprimés dans la
+        numérotation de l'état canonique d'où ils partent, et sont ramenés aux vraies
+        tours à la reconstruction du chemin (voir CodecEtat.chemin_reel).
+
+        Args:
+            code_initial (int): L'état de départ encodé.
+            objectif (tuple): L'objectif (masque, valeur, idx_tour_cible) ; avec canoniser, tout
+                état qui l'atteint doit avoir un représentant canonique qui l'atteint aussi.
+            h_initiale (int): Heuristique de l'état de départ.
+            heuristique_voisin (callable): (h_parent, code_parent, code_voisin, mouvement) -> h_voisin.
+            rappel_progression (callable | None): Appelée avec le nombre d'états développés.
+            statistiques (StatistiquesSolveur | None): Statistiques à remplir.
+            canoniser (callable | None): code -> (code canonique, permutation ou None), l'heuristique
+                devant donner la même valeur à tous les états d'une même classe.
+            distance_resolue (callable | None): code -> distance exacte à l'objectif, ou None.
+                Les états résolus ne sont pas développés : chacun propose une solution complète,
+                et la recherche s'arrête quand aucun état de la file ne peut faire mieux.
+            poids (int | None): Poids de l'heuristique (f = g + poids * h). Au-delà de 1, A* pondéré :
+                beaucoup moins d'états développés, mais une solution jusqu'à poids fois trop longue.
+                None : recherche gloutonne, classée sur h seul (le plus grand g d'abord à h égal,
+                ce qui traverse vite les plateaux de l'heuristique) ; elle rend la première
+                solution trouvée.
+            echeance (float | None): Instant (time.perf_counter) où la recherche abandonne.
+
+        Returns:
+            tuple[list[tuple[int, int]], bool]: (mouvements 0-indexés, de l'objectif vers le
+            départ ; True si l'objectif a été atteint). Avec distance_resolue, le chemin part
+            de l'état résolu où la meilleure solution quitte la recherche. Une fois l'échéance
+            passée : (chemin vers cet état résolu s'il y en a un, sinon vers l'état rencontré
+            de plus petite heuristique, vide si aucun ne fait mieux que le départ ; False).
+        """
+        codec = self.codec
+        masque_objectif, code_objectif, _ = objectif
+        generer_voisins = codec.generer_voisins
+        if statistiques:
+            generer_voisins = statistiques.chronometrer('temps_voisins', generer_voisins)
+        code_depart = code_initial
+        if canoniser:
+            code_initial = canoniser(code_initial)[0]
+
+        # Initialisation de la file de priorité (open_set) pour A* : un seau par valeur de f,
+        # le plus grand g d'abord à f égal ; h se déduit de f - g au dépilement
+        file_priorite = FileSeaux()
+        file_priorite.ajouter(h_initiale if poids is None else poids * h_initiale, 0, code_initial)
+
+        # Dictionnaire pour retrouver le chemin (état précédent et mouvement)
+        provenance = {}
+        # Dictionnaire des coûts g(n) pour chaque état
+        cout_g = {code_initial: 0}
+
+        nb_developpes = 0
+        # Meilleure solution passant par un état résolu : longueur et (état d'où on y entre, mouvement)
+        meilleure_longueur = float('inf')
+        jonction = None
+        # État le plus prometteur rencontré, rendu si l'échéance passe avant la fin : son
+        # heuristique est strictement plus petite que celle du départ (ou c'est le départ)
+        h_plus_proche = h_initiale
+        code_plus_proche = code_initial
+
+        while file_priorite:
+            # L'horloge est lue à chaque tour : un seul développement ne dure que quelques microsecondes
+            if echeance is not None and time.perf_counter() >= echeance:
+                if jonction is None:
+                    return self.reconstruire_chemin(provenance, code_plus_proche, None, canoniser, code_depart), False
+                return self.reconstruire_chemin(provenance, jonction[0], jonction[1], canoniser, code_depart), False
+
+            if poids is None and jonction is not None:
+                break
+            score_f_courant, g_courant, code_courant = file_priorite.extraire()
+            if poids is None:
+                h_courant = score_f_courant
+            else:
+                h_courant = (score_f_courant - g_courant) // poids
+                if score_f_courant >= meilleure_longueur:
+                    break
+
+            nb_developpes += 1
+            if statistiques:
+                statistiques.etats_developpes = nb_developpes
+                statistiques.observer_tailles(len(file_priorite) + 1, len(cout_g))
+            if nb_developpes % self.INTERVALLE_PROGRESSION == 0:
+                if rappel_progression:
+                    rappel_progression(nb_developpes)
+                if statistiques:
+                    statistiques.publier()
+            # Si l'état objectif est atteint, on reconstitue le chemin
+            if (code_courant & masque_objectif) == code_objectif:
+                return self.reconstruire_chemin(provenance, code_courant, None, canoniser, code_depart), True
+
+            # Génère tous les voisins valides de l'état courant
+            voisins = generer_voisins(code_courant)
+            if statistiques:
+                statistiques.etats_generes += len(voisins)
+            for code_voisin, mouvement_tuple in voisins:
+                cout_tentatif = g_courant + 1
+                code_reel = code_voisin
+                if canoniser:
+                    code_voisin = canoniser(code_voisin)[0]
+
+                if distance_resolue is not None:
+                    distance = distance_resolue(code_voisin)
+                    if distance is not None:
+                        if cout_tentatif + distance < meilleure_longueur:
+                            meilleure_longueur = cout_tentatif + distance
+                            jonction = (code_courant, mouvement_tuple)
+                        continue
+
+                # Si ce chemin vers le voisin est meilleur que tout chemin précédent
+                if cout_tentatif < cout_g.get(code_voisin, float('inf')):
+                    if statistiques and code_voisin in file_priorite:
+                        # L'entrée déjà dans la file devient périmée (FileSeaux la retire plus tard)
+                        statistiques.doublons_ignores += 1
+                    provenance[code_voisin] = (code_courant, mouvement_tuple)
+                    cout_g[code_voisin] = cout_tentatif
+                    h_voisin = heuristique_voisin(h_courant, code_courant, code_reel, mouvement_tuple)
+                    f_voisin = h_voisin if poids is None else cout_tentatif + poids * h_voisin
+                    file_priorite.ajouter(f_voisin, cout_tentatif, code_voisin)
+                    if h_voisin < h_plus_proche:
+                        h_plus_proche, code_plus_proche = h_voisin, code_voisin
+                elif statistiques:
+                    statistiques.doublons_ignores += 1
+
+        if jonction is None:
+            return [], False
+        return self.reconstruire_chemin(provenance, jonction[0], jonction[1], canoniser, code_depart), True
+
+    def reconstruire_chemin(self, provenance, code_arrivee, dernier_mouvement, canoniser, code_depart):
+        """
+        Remonte les provenances d'A* depuis un état jusqu'au départ.
+
+        Args:
+            provenance (dict): {code: (code précédent, mouvement)} de la recherche.
+            code_arrivee (int): L'état (canonique avec canoniser) où le chemin s'arrête.
+            dernier_mouvement (tuple[int, int] | None): Mouvement qui suit code_arrivee (vers un
+                état résolu, jamais mis dans provenance), ou None.
+            canoniser (callable | None): Comme pour rechercher_a_etoile.
+            code_depart (int): L'état de départ réel encodé.
+
+        Returns:
+            list[tuple[int, int]]: Mouvements 0-indexés réels, du bout du chemin vers le départ.
+        """
+        chemin_mouvements_0_index = [] if dernier_mouvement is None else [dernier_mouvement]
+        code_trace = code_arrivee
+        while code_trace in provenance:
+            code_precedent, mouvement_0_index = provenance[code_trace]
+            chemin_mouvements_0_index.append(mouvement_0_index)  # (source, destination)
+            code_trace = code_precedent
+        if canoniser:
+            chemin_mouvements_0_index = self.codec.chemin_reel(canoniser, code_depart, chemin_mouvements_0_index)
+        return chemin_mouvements_0_index
+
+    def rechercher_ida_etoile(self, code_initial, objectif, h_initiale, heuristique_voisin,
+                              budget_memoire, rappel_progression=None, statistiques=None):
+        """
+        Recherche IDA* (A* par approfondissement itératif) à mémoire bornée.
+
+        Chaque itération est un parcours en profondeur limité à f <= seuil ; le seuil
+        suivant est le plus petit f ayant dépassé le seuil. Seul le chemin courant est
+        gardé en mémoire, plus une table de transposition dont la taille ne dépasse
+        pas budget_memoire octets (une fois pleine, elle n'accepte plus d'états).
+
+        La table garde, d'une itération à l'autre, le plus petit g connu de chaque état :
+        un chemin plus long vers un état connu est coupé, ce qui évite de réexplorer
+        le même état par tous les détours du parcours en profondeur.
+
+        Args:
+            code_initial (int): L'état de départ encodé.
+            objectif (tuple): L'objectif (masque, valeur, idx_tour_cible).
+            h_initiale (int): Heuristique de l'état de départ.
+            heuristique_voisin (callable): (h_parent, code_parent, code_voisin, mouvement) -> h_voisin.
+            budget_memoire (int): Taille maximale de la table de transposition, en octets.
+            rappel_progression (callable | None): Appelée avec le nombre d'états développés.
+            statistiques (StatistiquesSolveur | None): Statistiques à remplir.
+
+        Returns:
+            tuple[list[tuple[int, int]], bool]: (mouvements 0-indexés, de l'objectif vers le
+            départ ; True si l'objectif a été atteint).
+        """
+        masque_objectif, code_objectif, _ = objectif
+        generer_voisins = self.codec.generer_voisins
+        if statistiques:
+            generer_voisins = statistiques.chronometrer('temps_voisins', generer_voisins)
+
+        nb_entrees_max = budget_memoire // self.OCTETS_PAR_ENTREE_TRANSPOSITION
+        # Table de transposition : {code: (plus petit g connu << 16) | numéro de l'itération de la visite}
+        transposition = {}
+        seuil = h_initiale
+        iteration = 0
+        nb_developpes = 0
+
+        while True:
+            iteration += 1
+            transposition[code_initial] = iteration
+            seuil_suivant = float('inf')
+            # Pile du parcours : (code, g, h, voisins restants) ; mouvements du chemin courant
+            pile = [(code_initial, 0, h_initiale, iter(generer_voisins(code_initial)))]
+            chemin = []
+
+            while pile:
+                code_courant, g_courant, h_courant, voisins = pile[-1]
+                if (code_courant & masque_objectif) == code_objectif:
+                    return list(reversed(chemin)), True
+
+                suivant = next(voisins, None)
+                if suivant is None:
+                    pile.pop()
+                    if chemin:
+                        chemin.pop()
+                    continue
+
+                code_voisin, mouvement_tuple = suivant
+                g_voisin = g_courant + 1
+                if statistiques:
+                    statistiques.etats_generes += 1
+                entree = transposition.get(code_voisin)
+                if entree is not None:
+                    g_connu = entree >> 16
+                    # Un chemin plus court est connu, ou ce chemin a déjà été exploré dans cette itération
+                    if g_voisin > g_connu or (g_voisin == g_connu and entree & 0xFFFF == iteration):
+                        if statistiques:
+                            statistiques.doublons_ignores += 1
+                        continue
+                h_voisin = heuristique_voisin(h_courant, code_courant, code_voisin, mouvement_tuple)
+                if g_voisin + h_voisin > seuil:
+                    seuil_suivant = min(seuil_suivant, g_voisin + h_voisin)
+                    continue
+
+                if entree is not None or len(transposition) < nb_entrees_max:
+                    transposition[code_voisin] = (g_voisin << 16) | iteration
+                nb_developpes += 1
+                if statistiques:
+                    statistiques.etats_developpes = nb_developpes
+                    statistiques.observer_tailles(len(pile) + 1, len(transposition))
+                if nb_developpes % self.INTERVALLE_PROGRESSION == 0:
+                    if rappel_progression:
+                        rappel_progression(nb_developpes)
+                    if statistiques:
+                        statistiques.publier()
+                pile.append((code_voisin, g_voisin, h_voisin, iter(generer_voisins(code_voisin))))
+                chemin.append(mouvement_tuple)
+
+            if seuil_suivant == float('inf'):
+                return [], False  # Aucune solution
+            seuil = seuil_suivant
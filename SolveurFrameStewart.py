@@ -0,0 +1,155 @@
+from SolveurOptimal import SolveurOptimal
+
+
+class SolveurFrameStewart:
+    """
+    Résout sans recherche le départ standard (tous les disques empilés légalement
+    sur une seule tour) avec 4 tours ou plus, par l'algorithme de Frame–Stewart :
+    les n - t plus petits disques sont rangés sur une tour intermédiaire avec
+    toutes les tours, les t plus grands rejoignent la cible avec une tour de
+    moins, puis les petits les recouvrent. Avec 3 tours, il n'y a qu'une façon
+    de faire (voir SolveurOptimal.mouvements_tour_complete).
+
+    Le meilleur découpage t de chaque (nombre de disques, nombre de tours) est
+    calculé une fois et mémorisé pour toutes les parties. Le nombre de coups
+    obtenu est optimal pour 4 tours (démontré) et conjecturé optimal au-delà.
+
+    Attributs:
+        nb_tours (int): Nombre de tours (3 ou plus).
+    """
+    # Mémoïsation partagée : {(nb_disques, nb_tours): nombre de coups} et {(nb_disques, nb_tours): t}
+    couts = {}
+    separations = {}
+
+    def __init__(self, nb_tours=4):
+        if nb_tours < 3:
+            raise ValueError("Il faut au moins 3 tours.")
+        self.nb_tours = nb_tours
+
+    @classmethod
+    def cout(cls, nb_disques, nb_tours):
+        """
+        Nombre de coups de Frame–Stewart pour déplacer une tour complète.
+
+        Args:
+            nb_disques (int): Nombre de disques de la tour.
+            nb_tours (int): Nombre de tours utilisables (3 ou plus).
+
+        Returns:
+            int: Le nombre de coups.
+        """
+        if nb_disques <= 0:
+            return 0
+        if nb_tours == 3:
+            return (1 << nb_disques) - 1
+        cle = (nb_disques, nb_tours)
+        if cle not in cls.couts:
+            meilleur, meilleure_separation = None, nb_disques
+            for t in range(1, nb_disques + 1):
+                cout = 2 * cls.cout(nb_disques - t, nb_tours) + cls.cout(t, nb_tours - 1)
+                if meilleur is None or cout < meilleur:
+                    meilleur, meilleure_separation = cout, t
+            cls.couts[cle] = meilleur
+            cls.separations[cle] = meilleure_separation
+        return cls.couts[cle]
+
+    @classmethod
+    def separation(cls, nb_disques, nb_tours):
+        """
+        Meilleur nombre t de grands disques déplacés avec une tour de moins.
+
+        Args:
+            nb_disques (int): Nombre de disques de la tour (1 ou plus).
+            nb_tours (int): Nombre de tours utilisables (4 ou plus).
+
+        Returns:
+            int: Le découpage t, entre 1 et nb_disques.
+        """
+        cls.cout(nb_disques, nb_tours)
+        return cls.separations[(nb_disques, nb_tours)]
+
+    @staticmethod
+    def tour_complete(etat_tuple):
+        """
+        Cherche la tour qui porte tous les disques, empilés légalement.
+
+        Args:
+            etat_tuple (tuple): L'état sous forme de tuple de tuples (fond -> sommet).
+
+        Returns:
+            int | None: Index 0-basé de cette tour, ou None si l'état n'est pas de cette forme.
+        """
+        occupees = [idx_tour for idx_tour, contenu_tour in enumerate(etat_tuple) if contenu_tour]
+        if len(occupees) != 1 or not SolveurOptimal.est_legal(etat_tuple):
+            return None
+        return occupees[0]
+
+    def nombre_mouvements(self, etat_tuple, idx_tour_cible):
+        """
+        Nombre de coups de la solution directe, sans la générer.
+
+        Args:
+            etat_tuple (tuple): Tous les disques empilés légalement sur une seule tour.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            int: Le nombre de coups.
+
+        Raises:
+            ValueError: Si l'état n'est pas une tour complète légale.
+        """
+        idx_depart = self.tour_complete(etat_tuple)
+        if idx_depart is None:
+            raise ValueError("La résolution directe demande tous les disques empilés sur une seule tour.")
+        if idx_depart == idx_tour_cible:
+            return 0
+        return self.cout(len(etat_tuple[idx_depart]), self.nb_tours)
+
+    def generer_mouvements(self, etat_tuple, idx_tour_cible):
+        """
+        Génère paresseusement la solution de Frame–Stewart.
+
+        Args:
+            etat_tuple (tuple): Tous les disques empilés légalement sur une seule tour.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Yields:
+            tuple[int, int]: (index_tour_source, index_tour_destination).
+
+        Raises:
+            ValueError: Si l'état n'est pas une tour complète légale ou n'a pas nb_tours tours.
+        """
+        if len(etat_tuple) != self.nb_tours:
+            raise ValueError(f"L'état doit avoir {self.nb_tours} tours.")
+        idx_depart = self.tour_complete(etat_tuple)
+        if idx_depart is None:
+            raise ValueError("La résolution directe demande tous les disques empilés sur une seule tour.")
+        if idx_depart == idx_tour_cible:
+            return
+        libres = [idx_tour for idx_tour in range(self.nb_tours) if idx_tour not in (idx_depart, idx_tour_cible)]
+        yield from self.deplacer_tour(len(etat_tuple[idx_depart]), idx_depart, idx_tour_cible, libres)
+
+    def deplacer_tour(self, hauteur, idx_depart, idx_arrivee, libres):
+        """
+        Déplace les hauteur disques du sommet de idx_depart vers idx_arrivee, toutes
+        les tours de libres étant vides ou couvertes de disques plus grands.
+
+        Args:
+            hauteur (int): Nombre de disques à déplacer.
+            idx_depart (int): Index 0-basé de la tour de départ.
+            idx_arrivee (int): Index 0-basé de la tour d'arrivée.
+            libres (list[int]): Index des autres tours utilisables.
+
+        Yields:
+            tuple[int, int]: (index_tour_source, index_tour_destination).
+        """
+        if hauteur <= 0:
+            return
+        if len(libres) == 1:
+            yield from SolveurOptimal().mouvements_tour_complete(hauteur, idx_depart, idx_arrivee, libres[0])
+            return
+        t = self.separation(hauteur, len(libres) + 2)
+        intermediaire, autres = libres[0], libres[1:]
+        yield from self.deplacer_tour(hauteur - t, idx_depart, intermediaire, [idx_arrivee] + autres)
+        yield from self.deplacer_tour(t, idx_depart, idx_arrivee, autres)
+        yield from self.deplacer_tour(hauteur - t, intermediaire, idx_arrivee, [idx_depart] + autres)
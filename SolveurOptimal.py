@@ -0,0 +1,416 @@
+from array import array
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est facultatif : les variantes par lots se replient sur array
+    np = None
+
+
+class SolveurOptimal:
+    """
+    Génère sans recherche la suite optimale de mouvements pour une
+    configuration légale (chaque tour empilée du plus grand au plus petit).
+
+    Les mouvements sont produits à la demande (générateur), en temps O(1)
+    amorti par mouvement et sans mémoire proportionnelle au nombre de coups.
+
+    Attributs:
+        nb_tours (int): Nombre de tours (3 pour cette méthode).
+    """
+    def __init__(self, nb_tours=3):
+        self.nb_tours = nb_tours
+
+    @staticmethod
+    def est_legal(etat_tuple):
+        """
+        Vérifie que chaque tour est empilée du plus grand (fond) au plus petit (sommet).
+
+        Args:
+            etat_tuple (tuple): L'état sous forme de tuple de tuples (fond -> sommet).
+
+        Returns:
+            bool: True si la configuration respecte les règles du jeu.
+        """
+        for contenu_tour in etat_tuple:
+            for i in range(len(contenu_tour) - 1):
+                if contenu_tour[i] <= contenu_tour[i + 1]:
+                    return False
+        return True
+
+    def mouvements_tour_complete(self, hauteur, idx_depart, idx_arrivee, idx_auxiliaire=None):
+        """
+        Génère les 2^hauteur - 1 mouvements déplaçant une tour légale complète.
+
+        Le mouvement m (1-indexé) est calculé directement à partir des bits de m,
+        sans pile de récursion.
+
+        Args:
+            hauteur (int): Nombre de disques de la tour à déplacer.
+            idx_depart (int): Index 0-basé de la tour de départ.
+            idx_arrivee (int): Index 0-basé de la tour d'arrivée.
+            idx_auxiliaire (int | None): Index 0-basé de la tour intermédiaire
+                (par défaut la troisième des tours 0, 1 et 2).
+
+        Yields:
+            tuple[int, int]: (index_tour_source, index_tour_destination).
+        """
+        if hauteur <= 0:
+            return
+        if idx_auxiliaire is None:
+            idx_auxiliaire = 3 - idx_depart - idx_arrivee
+        # La formule fait aller la tour de 0 vers 2 si la hauteur est impaire, de 0 vers 1 sinon
+        if hauteur % 2 == 1:
+            correspondance = (idx_depart, idx_auxiliaire, idx_arrivee)
+        else:
+            correspondance = (idx_depart, idx_arrivee, idx_auxiliaire)
+
+        for m in range(1, 1 << hauteur):
+            yield (correspondance[(m & (m - 1)) % 3],
+                   correspondance[((m | (m - 1)) + 1) % 3])
+
+    def etapes(self, etat_tuple, idx_tour_cible):
+        """
+        Décompose la résolution en étapes (disque, départ, arrivée, auxiliaire).
+
+        Parcourt les disques du plus grand au plus petit : un disque déjà sur sa
+        cible est ignoré, sinon il doit y être déplacé après avoir rassemblé tous
+        les plus petits sur la tour auxiliaire, qui devient leur nouvelle cible.
+
+        Args:
+            etat_tuple (tuple): L'état légal sous forme de tuple de tuples.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            list[tuple[int, int, int, int]]: Étapes (rang du disque, départ, arrivée,
+            auxiliaire), du plus grand au plus petit disque. Le rang 0 est le plus petit.
+        """
+        # Tour de chaque disque, du plus petit au plus grand
+        position = {}
+        for idx_tour, contenu_tour in enumerate(etat_tuple):
+            for taille in contenu_tour:
+                position[taille] = idx_tour
+        tailles_asc = sorted(position)
+
+        etapes = []
+        cible = idx_tour_cible
+        for rang in range(len(tailles_asc) - 1, -1, -1):
+            depart = position[tailles_asc[rang]]
+            if depart == cible:
+                continue
+            auxiliaire = 3 - depart - cible
+            etapes.append((rang, depart, cible, auxiliaire))
+            cible = auxiliaire
+        return etapes
+
+    def generer_mouvements(self, etat_tuple, idx_tour_cible=2):
+        """
+        Génère paresseusement la suite optimale de mouvements vers la tour cible.
+
+        Args:
+            etat_tuple (tuple): L'état légal sous forme de tuple de tuples.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Yields:
+            tuple[int, int]: (index_tour_source, index_tour_destination).
+
+        Raises:
+            ValueError: Si la configuration n'est pas légale ou n'a pas 3 tours.
+        """
+        if self.nb_tours != 3 or len(etat_tuple) != 3:
+            raise ValueError("La résolution directe ne gère que 3 tours.")
+        if not self.est_legal(etat_tuple):
+            raise ValueError("La configuration n'est pas légale.")
+
+        # Les étapes sont exécutées du plus petit disque concerné au plus grand :
+        # on déplace le disque, puis on ramène par-dessus la tour des plus petits
+        for rang, depart, arrivee, auxiliaire in reversed(self.etapes(etat_tuple, idx_tour_cible)):
+            yield (depart, arrivee)
+            yield from self.mouvements_tour_complete(rang, auxiliaire, arrivee)
+
+    def nombre_mouvements(self, etat_tuple, idx_tour_cible=2):
+        """
+        Calcule le nombre minimal de mouvements sans les générer.
+
+        Args:
+            etat_tuple (tuple): L'état légal sous forme de tuple de tuples.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            int: Nombre de mouvements de la solution optimale.
+        """
+        return sum(1 << rang for rang, _, _, _ in self.etapes(etat_tuple, idx_tour_cible))
+
+    def plan(self, etat_tuple, idx_tour_cible=2):
+        """
+        Prépare l'accès direct à la solution : tailles, tours de départ et étapes
+        dans l'ordre d'exécution, avec le numéro de leur premier mouvement.
+
+        Pendant l'étape (rang, départ, arrivée, auxiliaire), tous les disques plus
+        petits sont sur l'auxiliaire avant le premier mouvement ; les plus grands
+        sont encore sur leur tour de départ.
+
+        Args:
+            etat_tuple (tuple): L'état légal sous forme de tuple de tuples.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            tuple: (tailles du plus petit au plus grand, tour de départ de chaque rang,
+            étapes (rang, départ, arrivée, auxiliaire) dans l'ordre d'exécution,
+            décalages (nombre de mouvements avant chaque étape), nombre total de mouvements).
+
+        Raises:
+            ValueError: Si la configuration n'est pas légale ou n'a pas 3 tours.
+        """
+        if self.nb_tours != 3 or len(etat_tuple) != 3:
+            raise ValueError("La résolution directe ne gère que 3 tours.")
+        if not self.est_legal(etat_tuple):
+            raise ValueError("La configuration n'est pas légale.")
+
+        position = {}
+        for idx_tour, contenu_tour in enumerate(etat_tuple):
+            for taille in contenu_tour:
+                position[taille] = idx_tour
+        tailles_asc = sorted(position)
+        positions_depart = [position[taille] for taille in tailles_asc]
+
+        etapes = list(reversed(self.etapes(etat_tuple, idx_tour_cible)))
+        decalages = []
+        total = 0
+        for rang, _, _, _ in etapes:
+            decalages.append(total)
+            total += 1 << rang
+        return tailles_asc, positions_depart, etapes, decalages, total
+
+    @staticmethod
+    def etat_depuis_positions(tailles_asc, positions):
+        """
+        Reconstruit un état légal à partir de la tour de chaque disque.
+
+        Args:
+            tailles_asc (list[int]): Tailles des disques, du plus petit au plus grand.
+            positions (sequence[int]): Index de tour de chaque rang (0 = le plus petit).
+
+        Returns:
+            tuple: L'état sous forme de tuple de tuples (fond -> sommet).
+        """
+        tours = ([], [], [])
+        for rang in range(len(tailles_asc) - 1, -1, -1):
+            tours[positions[rang]].append(tailles_asc[rang])
+        return tuple(tuple(contenu_tour) for contenu_tour in tours)
+
+    def positions_apres(self, plan, k):
+        """
+        Calcule la tour de chaque disque après k mouvements de la solution, en O(n),
+        à partir des bits de k et sans rejouer les mouvements précédents.
+
+        Dans un déplacement de tour complète de hauteur h, le disque de rang r a
+        bougé (m + 2^r) >> (r + 1) fois après m mouvements, toujours dans le même
+        sens de rotation (qui dépend de la parité de h - r).
+
+        Args:
+            plan (tuple): Résultat de plan().
+            k (int): Nombre de mouvements joués (0 <= k <= total).
+
+        Returns:
+            list[int]: Index de tour de chaque rang.
+
+        Raises:
+            ValueError: Si k est hors de la solution.
+        """
+        _, positions_depart, etapes, decalages, total = plan
+        if not 0 <= k <= total:
+            raise ValueError(f"Le mouvement {k} est hors de la solution ({total} mouvements).")
+        positions = list(positions_depart)
+        if not etapes:
+            return positions
+
+        i = bisect_right(decalages, k) - 1
+        if k == total:
+            i = len(etapes) - 1
+        rang_etape, depart, arrivee, auxiliaire = etapes[i]
+        m = k - decalages[i] - 1  # Mouvements déjà faits par la tour des plus petits (-1 : pas encore commencé)
+        if m >= 0:
+            positions[rang_etape] = arrivee
+        # Tours réelles de la tour des plus petits : départ, intermédiaire, arrivée
+        correspondance = (auxiliaire, depart, arrivee)
+        for rang in range(rang_etape):
+            nb_deplacements = (m + (1 << rang)) >> (rang + 1)
+            sens = 1 if (rang_etape - rang) % 2 == 0 else -1
+            positions[rang] = correspondance[(sens * nb_deplacements) % 3]
+        return positions
+
+    def etat_apres_mouvements(self, etat_tuple, k, idx_tour_cible=2):
+        """
+        Donne la configuration après les k premiers mouvements de la solution optimale,
+        sans générer ces mouvements.
+
+        Args:
+            etat_tuple (tuple): L'état légal de départ.
+            k (int): Nombre de mouvements joués.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            tuple: L'état sous forme de tuple de tuples (fond -> sommet).
+        """
+        plan = self.plan(etat_tuple, idx_tour_cible)
+        return self.etat_depuis_positions(plan[0], self.positions_apres(plan, k))
+
+    def mouvement_numero(self, etat_tuple, k, idx_tour_cible=2):
+        """
+        Donne le k-ième mouvement (1-indexé) de la solution optimale, sans générer les précédents.
+
+        Args:
+            etat_tuple (tuple): L'état légal de départ.
+            k (int): Numéro du mouvement (1 <= k <= nombre de mouvements).
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            tuple[int, int]: (index_tour_source, index_tour_destination).
+
+        Raises:
+            ValueError: Si k est hors de la solution.
+        """
+        _, _, etapes, decalages, total = self.plan(etat_tuple, idx_tour_cible)
+        if not 1 <= k <= total:
+            raise ValueError(f"Le mouvement {k} est hors de la solution ({total} mouvements).")
+        i = bisect_right(decalages, k - 1) - 1
+        rang_etape, depart, arrivee, auxiliaire = etapes[i]
+        m = k - decalages[i] - 1
+        if m == 0:
+            return (depart, arrivee)
+        # Même formule que mouvements_tour_complete, pour la tour des plus petits (auxiliaire -> arrivée)
+        if rang_etape % 2 == 1:
+            correspondance = (auxiliaire, depart, arrivee)
+        else:
+            correspondance = (auxiliaire, arrivee, depart)
+        return (correspondance[(m & (m - 1)) % 3], correspondance[((m | (m - 1)) + 1) % 3])
+
+    def mouvements_tableau(self, etat_tuple, idx_tour_cible=2, limite=None):
+        """
+        Les premiers mouvements de la solution optimale en deux tableaux NumPy,
+        calculés étape par étape avec la formule de mouvement_numero (quelques
+        opérations vectorielles par étape, sans recherche du numéro d'étape de
+        chaque mouvement comme mouvements_numeros_lot).
+
+        Args:
+            etat_tuple (tuple): L'état légal de départ.
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+            limite (int | None): Nombre maximal de mouvements (toute la solution si None).
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: (sources, destinations), index de tour en uint8.
+
+        Raises:
+            ValueError: Si NumPy n'est pas installé, ou si la configuration n'est pas légale.
+        """
+        if np is None:
+            raise ValueError("mouvements_tableau demande NumPy (voir generer_mouvements).")
+        _, _, etapes, decalages, total = self.plan(etat_tuple, idx_tour_cible)
+        if limite is None or limite > total:
+            limite = total
+        sources = np.empty(limite, dtype=np.uint8)
+        destinations = np.empty(limite, dtype=np.uint8)
+        for (rang_etape, depart, arrivee, auxiliaire), decalage in zip(etapes, decalages):
+            if decalage >= limite:
+                break
+            sources[decalage], destinations[decalage] = depart, arrivee
+            fin = min(decalage + (1 << rang_etape), limite)
+            if fin == decalage + 1:
+                continue
+            if rang_etape % 2 == 1:
+                correspondance = np.array([auxiliaire, depart, arrivee], dtype=np.uint8)
+            else:
+                correspondance = np.array([auxiliaire, arrivee, depart], dtype=np.uint8)
+            m = np.arange(1, fin - decalage, dtype=np.int32 if rang_etape < 30 else np.int64)
+            sources[decalage + 1:fin] = correspondance[(m & (m - 1)) % 3]
+            destinations[decalage + 1:fin] = correspondance[((m | (m - 1)) + 1) % 3]
+        return sources, destinations
+
+    def positions_apres_lot(self, etat_tuple, liste_k, idx_tour_cible=2):
+        """
+        Variante par lots de etat_apres_mouvements : la tour de chaque disque après
+        chacun des k demandés. Avec NumPy, chaque rang est calculé pour tous les k
+        à la fois (O(n) opérations vectorielles).
+
+        Args:
+            etat_tuple (tuple): L'état légal de départ.
+            liste_k (sequence[int]): Nombres de mouvements joués (chacun entre 0 et le total).
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            numpy.ndarray | list[array]: Tableau (len(liste_k), n) d'index de tour (uint8)
+            par rang, ou sans NumPy une array('B') par k.
+
+        Raises:
+            ValueError: Si un k est hors de la solution.
+        """
+        plan = self.plan(etat_tuple, idx_tour_cible)
+        if np is None:
+            return [array('B', self.positions_apres(plan, k)) for k in liste_k]
+
+        _, positions_depart, etapes, decalages, total = plan
+        ks = np.asarray(liste_k, dtype=np.int64)
+        if ks.size and (ks.min() < 0 or ks.max() > total):
+            raise ValueError(f"Un mouvement demandé est hors de la solution ({total} mouvements).")
+        positions = np.tile(np.asarray(positions_depart, dtype=np.uint8), (ks.size, 1))
+        if not etapes:
+            return positions
+
+        tableau_etapes = np.asarray(etapes, dtype=np.int64)
+        i = np.minimum(np.searchsorted(np.asarray(decalages, dtype=np.int64), ks, side='right') - 1,
+                       len(etapes) - 1)
+        rang_etape, depart, arrivee, auxiliaire = tableau_etapes[i].T
+        m = ks - np.asarray(decalages, dtype=np.int64)[i] - 1
+        correspondance = np.stack([auxiliaire, depart, arrivee], axis=1)
+        lignes = np.arange(ks.size)
+        for rang in range(len(positions_depart)):
+            nb_deplacements = (m + (1 << rang)) >> (rang + 1)
+            sens = np.where((rang_etape - rang) % 2 == 0, 1, -1)
+            petit = rang < rang_etape
+            positions[petit, rang] = correspondance[lignes, (sens * nb_deplacements) % 3][petit]
+            commence = (rang == rang_etape) & (m >= 0)
+            positions[commence, rang] = arrivee[commence]
+        return positions
+
+    def mouvements_numeros_lot(self, etat_tuple, liste_k, idx_tour_cible=2):
+        """
+        Variante par lots de mouvement_numero.
+
+        Args:
+            etat_tuple (tuple): L'état légal de départ.
+            liste_k (sequence[int]): Numéros de mouvement (1-indexés).
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+
+        Returns:
+            numpy.ndarray | list[tuple[int, int]]: Tableau (len(liste_k), 2) de
+            (source, destination), ou sans NumPy une liste de tuples.
+
+        Raises:
+            ValueError: Si un k est hors de la solution.
+        """
+        if np is None:
+            return [self.mouvement_numero(etat_tuple, k, idx_tour_cible) for k in liste_k]
+
+        _, _, etapes, decalages, total = self.plan(etat_tuple, idx_tour_cible)
+        ks = np.asarray(liste_k, dtype=np.int64)
+        if ks.size and (ks.min() < 1 or ks.max() > total):
+            raise ValueError(f"Un mouvement demandé est hors de la solution ({total} mouvements).")
+        if not ks.size:
+            return np.zeros((0, 2), dtype=np.uint8)
+
+        tableau_etapes = np.asarray(etapes, dtype=np.int64)
+        tableau_decalages = np.asarray(decalages, dtype=np.int64)
+        i = np.searchsorted(tableau_decalages, ks - 1, side='right') - 1
+        rang_etape, depart, arrivee, auxiliaire = tableau_etapes[i].T
+        m = ks - tableau_decalages[i] - 1
+        correspondance = np.where((rang_etape % 2 == 1)[:, None],
+                                  np.stack([auxiliaire, depart, arrivee], axis=1),
+                                  np.stack([auxiliaire, arrivee, depart], axis=1))
+        lignes = np.arange(ks.size)
+        source = correspondance[lignes, (m & (m - 1)) % 3]
+        destination = correspondance[lignes, ((m | (m - 1)) + 1) % 3]
+        premier = m == 0
+        source[premier] = depart[premier]
+        destination[premier] = arrivee[premier]
+        return np.stack([source, destination], axis=1).astype(np.uint8)
@@ -0,0 +1,330 @@
+import multiprocessing
+import os
+import queue
+import time
+from array import array
+
+from CodecEtat import CodecEtat
+from BaseMotifs import BaseMotifs
+from FileSeaux import FileSeaux
+
+
+# Constante multiplicative pour répartir les états encodés entre les processus
+MELANGE = 0x9E3779B97F4A7C15
+# Entiers par voisin dans un lot : code, g, h, code parent (-1 au départ), mouvement (source * nb_tours + destination)
+CHAMPS_LOT = 5
+# États développés entre deux lectures de la boîte de réception (les lots partent à la fin de chaque tranche)
+TAILLE_TRANCHE = 256
+# Écart de f toléré au-dessus du plus petit f de l'ensemble des processus
+FENETRE_F = 0
+# Attente maximale (en secondes) d'un processus en avance sur les autres avant de relire les f minimaux
+ATTENTE_FENETRE = 0.001
+# Attente (en secondes) du coordinateur entre deux vérifications de la terminaison
+INTERVALLE_TERMINAISON = 0.002
+# Coût « pas encore de solution »
+INFINI = 1 << 62
+
+
+def proprietaire(code, nb_processus):
+    """
+    Indique quel processus possède un état (répartition par hachage).
+
+    Args:
+        code (int): L'état encodé.
+        nb_processus (int): Nombre de processus.
+
+    Returns:
+        int: Index du processus propriétaire.
+    """
+    return ((code * MELANGE) >> 32) % nb_processus
+
+
+def lot_vide(codec):
+    """
+    Crée un lot vide : un tableau d'entiers 64 bits (sérialisé d'un bloc) si les
+    états encodés y tiennent, une liste d'entiers sinon.
+
+    Args:
+        codec (CodecEtat): Le codec de la recherche.
+
+    Returns:
+        array | list: Le lot, à remplir par CHAMPS_LOT entiers par voisin.
+    """
+    if codec.decalage_bases + codec.nb_tours * codec.bits_base < 63:
+        return array('q')
+    return []
+
+
+def travailleur(idx, boites, reponses, partage, etat_initial_tuple, nb_tours, idx_tour_cible, tours_interchangeables):
+    """
+    Boucle d'un processus de recherche : il possède une partie des états
+    (file, cout_g, provenance), développe les siens par tranches et envoie les
+    voisins directement à leurs propriétaires, par lots d'entiers. Comme dans
+    SolveurConfigurations.rechercher_a_etoile, les voisins sont d'abord ramenés à
+    leur forme canonique (CodecEtat.canoniser) : le propriétaire d'un état est celui
+    de son représentant, le même pour tous les processus.
+
+    Il ne développe que les états dont le f ne dépasse pas de plus de FENETRE_F le
+    plus petit f publié par les processus (f_locaux) ; sinon il attend brièvement.
+    Il s'arrête quand plus aucun de ses états n'a un f inférieur au coût de la
+    meilleure solution connue (borne) ; il se déclare alors inactif et attend un
+    lot ou une commande.
+
+    Messages reçus dans boites[idx] :
+        ('lot', lot)              : voisins à insérer (voir CHAMPS_LOT).
+        ('remonter', code, rang)  : suit la provenance depuis code, envoie à reponses
+                                    (rang, mouvements, départ atteint) et passe la suite
+                                    au propriétaire du prochain état.
+        ('fin',)                  : termine le processus.
+
+    Args:
+        idx (int): Index de ce processus.
+        boites (list[multiprocessing.Queue]): Boîte de réception de chaque processus.
+        reponses (multiprocessing.Queue): Boîte de réception du coordinateur.
+        partage (tuple): (borne, f_locaux, inactifs, envoyes, recus, developpes), voir SolveurParallele.resoudre.
+        etat_initial_tuple (tuple): L'état de départ (pour construire le codec).
+        nb_tours (int): Nombre de tours.
+        idx_tour_cible (int): Index 0-basé de la tour cible.
+        tours_interchangeables (list[int]): Tours dont les contenus peuvent être échangés
+            (vide : pas de canonisation).
+    """
+    codec = CodecEtat(etat_initial_tuple, nb_tours)
+    motifs = BaseMotifs(codec, idx_tour_cible) if nb_tours == 3 else None
+    code_objectif = codec.code_objectif(idx_tour_cible)
+    borne, f_locaux, inactifs, envoyes, recus, developpes = partage
+    nb_processus = len(boites)
+    boite = boites[idx]
+    file_priorite = FileSeaux()
+    cout_g = {}
+    provenance = {}
+    lots = [lot_vide(codec) for _ in range(nb_processus)]
+
+    while True:
+        f_min = file_priorite.f_minimal()
+        f_locaux[idx] = INFINI if f_min is None else f_min
+        f_fenetre = min(f_locaux) + FENETRE_F
+        if f_min is None or f_min >= borne.value:
+            # Plus rien d'utile à développer : les lots sont déjà partis (fin de tranche)
+            inactifs[idx] = 1
+            message = boite.get()
+        elif f_min > f_fenetre:
+            # D'autres processus ont encore des états de f plus petit : les développer d'abord
+            # évite d'explorer des états que la solution rendra inutiles
+            try:
+                message = boite.get(timeout=ATTENTE_FENETRE)
+            except queue.Empty:
+                continue
+        else:
+            try:
+                message = boite.get_nowait()
+            except queue.Empty:
+                message = None
+
+        if message is not None:
+            if message[0] == 'lot':
+                # Actif avant d'être compté comme reçu (voir la terminaison dans SolveurParallele.resoudre)
+                inactifs[idx] = 0
+                for code, g, h, code_parent, mouvement in zip(*[iter(message[1])] * CHAMPS_LOT):
+                    if g < cout_g.get(code, INFINI):
+                        cout_g[code] = g
+                        if code_parent >= 0:
+                            provenance[code] = (code_parent, mouvement)
+                        file_priorite.ajouter(g + h, g, code)
+                recus[idx] += 1
+            elif message[0] == 'remonter':
+                _, code_trace, rang = message
+                mouvements = []
+                while code_trace in provenance and proprietaire(code_trace, nb_processus) == idx:
+                    code_trace, mouvement = provenance[code_trace]
+                    mouvements.append(divmod(mouvement, nb_tours))
+                # Un état possédé ici et sans provenance ne peut être que le départ
+                depart_atteint = proprietaire(code_trace, nb_processus) == idx
+                reponses.put((rang, mouvements, depart_atteint))
+                if not depart_atteint:
+                    boites[proprietaire(code_trace, nb_processus)].put(
+                        ('remonter', code_trace, rang + len(mouvements)))
+            else:
+                return
+            continue
+
+        # Développe une tranche de ses états de plus petit f
+        limite = borne.value
+        nb_developpes = 0
+        while (nb_developpes < TAILLE_TRANCHE and len(file_priorite)
+               and file_priorite.f_minimal() <= f_fenetre and file_priorite.f_minimal() < limite):
+            f, g_courant, code_courant = file_priorite.extraire()
+            nb_developpes += 1
+            if code_courant == code_objectif:
+                with borne.get_lock():
+                    if g_courant < borne.value:
+                        borne.value = g_courant
+                limite = borne.value
+                continue
+            h_courant = f - g_courant
+            g_voisin = g_courant + 1
+            for code_voisin, (idx_source, idx_dest) in codec.generer_voisins(code_courant):
+                if motifs:
+                    h_voisin = motifs.heuristique_voisin(h_courant, code_courant, code_voisin)
+                else:
+                    h_voisin = codec.disques_mal_places(code_voisin, idx_tour_cible)
+                if g_voisin + h_voisin >= limite:
+                    continue
+                if tours_interchangeables:
+                    # Le mouvement reste dans la numérotation de code_courant (voir CodecEtat.chemin_reel)
+                    code_voisin = codec.canoniser(code_voisin, tours_interchangeables)[0]
+                destinataire = proprietaire(code_voisin, nb_processus)
+                if destinataire == idx:
+                    if g_voisin < cout_g.get(code_voisin, INFINI):
+                        cout_g[code_voisin] = g_voisin
+                        provenance[code_voisin] = (code_courant, idx_source * nb_tours + idx_dest)
+                        file_priorite.ajouter(g_voisin + h_voisin, g_voisin, code_voisin)
+                else:
+                    lots[destinataire].extend(
+                        (code_voisin, g_voisin, h_voisin, code_courant, idx_source * nb_tours + idx_dest))
+        developpes[idx] += nb_developpes
+
+        for destinataire, lot in enumerate(lots):
+            if lot:
+                # Compté comme envoyé avant de partir : un lot en route empêche la terminaison
+                envoyes[idx] += 1
+                boites[destinataire].put(('lot', lot))
+                lots[destinataire] = lot_vide(codec)
+
+
+class SolveurParallele:
+    """
+    Recherche A* répartie sur plusieurs processus (hash-distributed A*). Mode
+    expérimental : son accélération sur plusieurs cœurs n'a pas encore été mesurée
+    (la référence du benchmark vient d'une machine à un seul cœur, où chaque
+    processus de plus ne fait qu'ajouter du coût).
+
+    Chaque processus possède les états dont le hachage lui revient et développe
+    les siens par f croissant : les voisins produits partent directement chez leur
+    propriétaire, par lots d'entiers (voir CHAMPS_LOT). Il n'y a pas de barrière
+    entre deux valeurs de f : chaque processus publie son plus petit f en mémoire
+    partagée et ne prend pas plus d'avance que FENETRE_F sur les autres, ce qui
+    évite de développer des états au-delà du coût de la solution. Un état atteint
+    plus tard par un chemin plus court est simplement redéveloppé. Les états
+    symétriques ne sont gardés qu'une fois, comme dans la recherche série : avec
+    un seul processus, les états développés sont les mêmes qu'avec le mode 'astar'.
+
+    Le coordinateur ne voit passer aucun état : il détecte la fin de la recherche,
+    quand tous les processus sont inactifs (plus aucun état de f inférieur au coût
+    de la meilleure solution) et qu'aucun lot n'est en route. Tous les états de f
+    plus petit que ce coût ont alors été développés : la solution est optimale.
+
+    Attributs:
+        nb_processus (int): Nombre de processus de recherche.
+    """
+    # Attente maximale (en secondes) de l'arrêt d'un processus avant de le forcer
+    DELAI_ARRET = 1.0
+
+    def __init__(self, nb_processus=None):
+        self.nb_processus = nb_processus or os.cpu_count() or 1
+
+    def resoudre(self, etat_initial_tuple, idx_tour_cible=2, rappel_progression=None):
+        """
+        Résout un état (légal ou non) vers la tour cible.
+
+        Args:
+            etat_initial_tuple (tuple): L'état de départ (tuple de tuples, fond -> sommet).
+            idx_tour_cible (int): Index 0-basé de la tour cible.
+            rappel_progression (callable | None): Appelée avec le nombre d'états développés,
+                à chaque vérification de la terminaison où il a changé.
+
+        Returns:
+            list[tuple[int, int]]: Mouvements 0-indexés, de l'objectif vers le départ.
+
+        Raises:
+            RuntimeError: Si un processus de recherche s'est arrêté de lui-même.
+        """
+        nb_tours = len(etat_initial_tuple)
+        codec = CodecEtat(etat_initial_tuple, nb_tours)
+        code_depart = codec.encoder(etat_initial_tuple)
+        code_objectif = codec.code_objectif(idx_tour_cible)
+        if code_depart == code_objectif:
+            return []
+        if nb_tours == 3:
+            h_initiale = BaseMotifs(codec, idx_tour_cible).heuristique(code_depart)
+        else:
+            h_initiale = codec.disques_mal_places(code_depart, idx_tour_cible)
+
+        # Symétries : mêmes conditions que SolveurConfigurations.resoudre (au moins deux tours
+        # interchangeables sans base au départ)
+        tours_interchangeables = [idx_tour for idx_tour in range(nb_tours) if idx_tour != idx_tour_cible]
+        if sum(1 for idx_tour in tours_interchangeables if not code_depart & codec.champs_bases[idx_tour]) < 2:
+            tours_interchangeables = []
+
+        def canoniser(code):
+            return codec.canoniser(code, tours_interchangeables)
+        code_initial = canoniser(code_depart)[0]
+
+        nb_processus = self.nb_processus
+        boites = [multiprocessing.Queue() for _ in range(nb_processus)]
+        reponses = multiprocessing.Queue()
+        # Coût de la meilleure solution connue ; plus petit f de chaque processus ; processus
+        # inactifs ; lots envoyés (le dernier compteur est celui du coordinateur) et reçus ;
+        # états développés par chaque processus
+        borne = multiprocessing.Value('q', INFINI)
+        f_locaux = multiprocessing.RawArray('q', [INFINI] * nb_processus)
+        inactifs = multiprocessing.RawArray('b', nb_processus)
+        envoyes = multiprocessing.RawArray('q', nb_processus + 1)
+        recus = multiprocessing.RawArray('q', nb_processus)
+        developpes = multiprocessing.RawArray('q', nb_processus)
+        partage = (borne, f_locaux, inactifs, envoyes, recus, developpes)
+
+        processus = []
+        for idx in range(nb_processus):
+            p = multiprocessing.Process(
+                target=travailleur,
+                args=(idx, boites, reponses, partage, etat_initial_tuple, nb_tours, idx_tour_cible,
+                      tours_interchangeables),
+                daemon=True)
+            p.start()
+            processus.append(p)
+
+        try:
+            lot = lot_vide(codec)
+            lot.extend((code_initial, 0, h_initiale, -1, 0))
+            envoyes[nb_processus] = 1
+            boites[proprietaire(code_initial, nb_processus)].put(('lot', lot))
+
+            # Terminaison : deux relevés successifs identiques, tous les processus inactifs et
+            # autant de lots reçus qu'envoyés. Un processus ne redevient actif qu'en recevant
+            # un lot, ce qui change les compteurs entre les deux relevés.
+            releve_precedent = None
+            nb_developpes = 0
+            termine = False
+            while not termine:
+                time.sleep(INTERVALLE_TERMINAISON)
+                if any(p.exitcode is not None for p in processus):
+                    raise RuntimeError("Un processus de recherche s'est arrêté")
+                releve = (all(inactifs), sum(envoyes), sum(recus))
+                termine = releve[0] and releve[1] == releve[2] and releve == releve_precedent
+                releve_precedent = releve
+                if rappel_progression and sum(developpes) != nb_developpes:
+                    nb_developpes = sum(developpes)
+                    rappel_progression(nb_developpes)
+            if borne.value == INFINI:
+                return []  # Aucune solution
+
+            # Reconstitue le chemin : chaque propriétaire suit la provenance tant qu'il possède
+            # les états, puis passe la main au suivant ; les morceaux reviennent avec leur rang
+            boites[proprietaire(code_objectif, nb_processus)].put(('remonter', code_objectif, 0))
+            morceaux = {}
+            longueur = None
+            while longueur is None or sum(len(mouvements) for mouvements in morceaux.values()) < longueur:
+                rang, mouvements, depart_atteint = reponses.get()
+                morceaux[rang] = mouvements
+                if depart_atteint:
+                    longueur = rang + len(mouvements)
+            chemin = [mouvement for rang in sorted(morceaux) for mouvement in morceaux[rang]]
+            return codec.chemin_reel(canoniser, code_depart, chemin) if tours_interchangeables else chemin
+        finally:
+            for boite in boites:
+                boite.put(('fin',))
+            for p in processus:
+                p.join(self.DELAI_ARRET)
+                if p.is_alive():
+                    # Interrompu en pleine recherche : des lots restent peut-être en route
+                    p.terminate()
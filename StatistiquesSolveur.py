@@ -0,0 +1,136 @@
+import time
+
+
+class StatistiquesSolveur:
+    """
+    Compteurs et temps mesurés pendant une résolution.
+
+    Attributs:
+        mode_solveur (str): Mode utilisé ('direct' pour une configuration légale, 'table' si elle est lue
+            dans TableDistances, sinon voir JeuHanoi.MODES_SOLVEUR).
+        etats_generes (int): Nombre d'états voisins produits.
+        etats_developpes (int): Nombre d'états développés.
+        doublons_ignores (int): Voisins sans meilleur chemin et entrées périmées écartées.
+        taille_max_ouverte (int): Taille maximale de la liste ouverte (file ou pile).
+        taille_max_fermee (int): Taille maximale de l'ensemble des états connus (cout_g ou table de transposition).
+        temps_voisins (float): Temps passé à générer les voisins, en secondes.
+        temps_heuristique (float): Temps passé à calculer l'heuristique, en secondes.
+        temps_total (float): Durée totale de la résolution, en secondes.
+        longueur_solution (int): Nombre de mouvements de la solution.
+        rappel (callable | None): Reçoit ces statistiques pendant la recherche et à la fin.
+    """
+    def __init__(self, rappel=None):
+        self.mode_solveur = None
+        self.etats_generes = 0
+        self.etats_developpes = 0
+        self.doublons_ignores = 0
+        self.taille_max_ouverte = 0
+        self.taille_max_fermee = 0
+        self.temps_voisins = 0.0
+        self.temps_heuristique = 0.0
+        self.temps_total = 0.0
+        self.longueur_solution = 0
+        self.rappel = rappel
+        self.debut = None
+        self.termine = False
+
+    def demarrer(self, mode_solveur):
+        """
+        Note le mode et l'heure de début de la résolution.
+
+        Args:
+            mode_solveur (str): Mode de résolution utilisé.
+        """
+        self.mode_solveur = mode_solveur
+        self.debut = time.perf_counter()
+
+    def terminer(self, mouvements):
+        """
+        Fixe la durée totale et la longueur de la solution, puis publie les statistiques.
+
+        Args:
+            mouvements (list): La solution trouvée.
+        """
+        self.temps_total = time.perf_counter() - self.debut
+        self.longueur_solution = len(mouvements)
+        self.termine = True
+        self.publier()
+
+    def publier(self):
+        """
+        Transmet les statistiques au rappel, s'il y en a un.
+        """
+        if self.rappel:
+            if self.debut is not None and not self.termine:
+                self.temps_total = time.perf_counter() - self.debut
+            self.rappel(self)
+
+    def observer_tailles(self, taille_ouverte, taille_fermee):
+        """
+        Met à jour les tailles maximales observées.
+
+        Args:
+            taille_ouverte (int): Taille actuelle de la liste ouverte.
+            taille_fermee (int): Taille actuelle de l'ensemble des états connus.
+        """
+        if taille_ouverte > self.taille_max_ouverte:
+            self.taille_max_ouverte = taille_ouverte
+        if taille_fermee > self.taille_max_fermee:
+            self.taille_max_fermee = taille_fermee
+
+    def chronometrer(self, attribut, fonction):
+        """
+        Enveloppe une fonction pour cumuler son temps d'exécution dans un attribut.
+
+        Args:
+            attribut (str): 'temps_voisins' ou 'temps_heuristique'.
+            fonction (callable): La fonction à mesurer.
+
+        Returns:
+            callable: La fonction mesurée.
+        """
+        def fonction_mesuree(*args):
+            debut = time.perf_counter()
+            resultat = fonction(*args)
+            setattr(self, attribut, getattr(self, attribut) + time.perf_counter() - debut)
+            return resultat
+        return fonction_mesuree
+
+    def en_dict(self):
+        """
+        Renvoie les statistiques sous forme de dictionnaire (pour un fichier ou un journal).
+
+        Returns:
+            dict: Les compteurs et les temps.
+        """
+        return {
+            "mode_solveur": self.mode_solveur,
+            "etats_generes": self.etats_generes,
+            "etats_developpes": self.etats_developpes,
+            "doublons_ignores": self.doublons_ignores,
+            "taille_max_ouverte": self.taille_max_ouverte,
+            "taille_max_fermee": self.taille_max_fermee,
+            "temps_voisins": self.temps_voisins,
+            "temps_heuristique": self.temps_heuristique,
+            "temps_total": self.temps_total,
+            "longueur_solution": self.longueur_solution,
+        }
+
+    def __str__(self):
+        return (f"[{self.mode_solveur}] {self.etats_developpes} développés, {self.etats_generes} générés, "
+                f"{self.doublons_ignores} doublons, ouverte max {self.taille_max_ouverte}, "
+                f"fermée max {self.taille_max_fermee}, voisins {self.temps_voisins:.3f}s, "
+                f"heuristique {self.temps_heuristique:.3f}s, total {self.temps_total:.3f}s")
+
+    @staticmethod
+    def vers_journal(journal):
+        """
+        Crée un rappel qui écrit les statistiques dans un journal (module logging).
+
+        Args:
+            journal (logging.Logger): Le journal de destination.
+
+        Returns:
+            callable: Rappel à passer comme `rappel`.
+        """
+        return lambda statistiques: journal.info("%s", statistiques)
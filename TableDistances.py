@@ -0,0 +1,432 @@
+import argparse
+import mmap
+import os
+import sys
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est facultatif : la table se construit alors en Python pur
+    np = None
+
+from JournalCoups import JournalCoups
+
+
+class TableDistances:
+    """
+    Table exhaustive du meilleur mouvement et de la distance depuis chaque
+    configuration légale, pour un nombre de disques et de tours donné.
+
+    Une configuration légale est entièrement décrite par la tour de chaque
+    disque : son rang en base nb_tours (chiffre d du disque d, du plus petit au
+    plus grand) indexe deux plans du fichier. Le premier a un octet par
+    configuration : le premier mouvement d'une solution optimale (tour source
+    sur les 4 bits de poids fort, tour destination sur les 4 bits de poids
+    faible, comme JournalCoups). Suivre la table donne la solution complète
+    sans aucune recherche. Le second donne la distance exacte, sur un ou deux
+    octets (petit-boutiste) selon la plus grande distance de la table.
+
+    La table est calculée une fois (parcours en largeur depuis l'objectif),
+    enregistrée puis projetée en mémoire avec mmap : les processus qui la
+    chargent partagent les mêmes pages du cache système.
+
+    Avec 3 tours, SolveurOptimal résout déjà toute configuration légale sans
+    table ; elle sert surtout avec plus de tours, où il n'y a pas de formule.
+
+    Attributs:
+        nb_disques (int): Nombre de disques.
+        nb_tours (int): Nombre de tours.
+        idx_tour_cible (int): Index 0-basé de la tour cible.
+        table (mmap.mmap): La table (en-tête compris, voir ENTETE).
+        largeur (int): Nombre d'octets de chaque distance (1 ou 2).
+    """
+    DOSSIER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables_distances")
+    # En-tête suivi du nombre de disques, du nombre de tours et de la largeur des distances
+    ENTETE = b"TD2"
+    # Octet de la configuration objectif (aucun mouvement) et d'une configuration non atteinte :
+    # source et destination égales, ce qui n'est jamais un mouvement, même avec 16 tours
+    OBJECTIF = 0x00
+    INCONNU = 0xFF
+    # Nombre maximal de configurations d'une table (3^16 : 43 Mo)
+    TAILLE_MAX = 3 ** 16
+    # Configurations traitées par lot lors de la construction avec NumPy
+    TAILLE_LOT = 1 << 18
+
+    # Tables déjà chargées, partagées par toutes les parties : {(nb_disques, nb_tours): mmap}
+    tables = {}
+
+    def __init__(self, nb_disques, nb_tours, idx_tour_cible=None):
+        self.nb_disques = nb_disques
+        self.nb_tours = nb_tours
+        self.idx_tour_cible = nb_tours - 1 if idx_tour_cible is None else idx_tour_cible
+        # La table est calculée pour la dernière tour : on échange les tours au besoin
+        self.renumerotation = list(range(nb_tours))
+        self.renumerotation[self.idx_tour_cible], self.renumerotation[nb_tours - 1] = (
+            nb_tours - 1, self.idx_tour_cible)
+        self.puissances = [nb_tours ** d for d in range(nb_disques)]
+        self.table = self.charger_table(nb_disques, nb_tours)
+        self.largeur = self.table[len(self.ENTETE) + 2]
+        self.debut = len(self.ENTETE) + 3
+        self.debut_distances = self.debut + nb_tours ** nb_disques
+
+    @classmethod
+    def chemin(cls, nb_disques, nb_tours):
+        """
+        Chemin du fichier de la table.
+
+        Args:
+            nb_disques (int): Nombre de disques.
+            nb_tours (int): Nombre de tours.
+
+        Returns:
+            str: Le chemin.
+        """
+        return os.path.join(cls.DOSSIER, f"distances_{nb_disques}_{nb_tours}.bin")
+
+    @classmethod
+    def realisable(cls, nb_disques, nb_tours):
+        """
+        Indique si la table est de taille raisonnable (TAILLE_MAX configurations au plus).
+
+        Args:
+            nb_disques (int): Nombre de disques.
+            nb_tours (int): Nombre de tours (16 au plus, un mouvement tenant sur un octet).
+
+        Returns:
+            bool: True si la table peut être construite.
+        """
+        return nb_disques > 0 and 3 <= nb_tours <= 16 and nb_tours ** nb_disques <= cls.TAILLE_MAX
+
+    @classmethod
+    def disponible(cls, nb_disques, nb_tours):
+        """
+        Indique si la table est déjà chargée ou enregistrée (utilisable sans la construire).
+
+        Args:
+            nb_disques (int): Nombre de disques.
+            nb_tours (int): Nombre de tours.
+
+        Returns:
+            bool: True si la table peut être chargée immédiatement.
+        """
+        return ((nb_disques, nb_tours) in cls.tables
+                or (cls.realisable(nb_disques, nb_tours) and cls.fichier_a_jour(nb_disques, nb_tours)))
+
+    @classmethod
+    def fichier_a_jour(cls, nb_disques, nb_tours):
+        """
+        Indique si le fichier de la table existe et est au format actuel (en-tête,
+        largeur des distances et taille), sans le charger.
+
+        Args:
+            nb_disques (int): Nombre de disques.
+            nb_tours (int): Nombre de tours.
+
+        Returns:
+            bool: True si le fichier peut être projeté tel quel.
+        """
+        chemin = cls.chemin(nb_disques, nb_tours)
+        entete = cls.ENTETE + bytes([nb_disques, nb_tours])
+        try:
+            with open(chemin, "rb") as fichier:
+                debut = fichier.read(len(entete) + 1)
+                taille = os.fstat(fichier.fileno()).st_size
+        except OSError:
+            return False
+        if len(debut) != len(entete) + 1 or debut[:len(entete)] != entete:
+            return False
+        largeur = debut[len(entete)]
+        return largeur in (1, 2) and taille == len(entete) + 1 + (1 + largeur) * nb_tours ** nb_disques
+
+    @classmethod
+    def construire_table(cls, nb_disques, nb_tours):
+        """
+        Calcule le meilleur mouvement de toutes les configurations légales, la cible
+        étant la dernière tour.
+
+        Parcours en largeur depuis l'objectif : un mouvement est réversible entre
+        configurations légales, donc une configuration découverte depuis son parent
+        par le mouvement a -> b y retourne par b -> a, en un coup de moins que
+        n'importe quel autre chemin.
+
+        Args:
+            nb_disques (int): Nombre de disques.
+            nb_tours (int): Nombre de tours.
+
+        Returns:
+            tuple[bytearray, bytes, int]: (mouvement de chaque configuration, indexé par rang ;
+            plan des distances ; largeur d'une distance en octets).
+        """
+        if np is not None:
+            return cls.construire_table_numpy(nb_disques, nb_tours)
+
+        puissances = [nb_tours ** d for d in range(nb_disques)]
+        table = bytearray([cls.INCONNU]) * (nb_tours ** nb_disques)
+        distances = array('H', bytes(2 * nb_tours ** nb_disques))
+        objectif = nb_tours ** nb_disques - 1  # Tous les chiffres valent nb_tours - 1
+        table[objectif] = cls.OBJECTIF
+        file_attente = deque([objectif])
+        while file_attente:
+            rang = file_attente.popleft()
+            # Plus petit disque de chaque tour (None si elle est vide)
+            sommets = [None] * nb_tours
+            reste = rang
+            for d in range(nb_disques):
+                reste, idx_tour = divmod(reste, nb_tours)
+                if sommets[idx_tour] is None:
+                    sommets[idx_tour] = d
+            for a, disque in enumerate(sommets):
+                if disque is None:
+                    continue
+                for b, sommet_b in enumerate(sommets):
+                    if b == a or (sommet_b is not None and sommet_b < disque):
+                        continue
+                    voisin = rang + (b - a) * puissances[disque]
+                    if table[voisin] == cls.INCONNU:
+                        table[voisin] = JournalCoups.coder(b, a)
+                        distances[voisin] = distances[rang] + 1
+                        file_attente.append(voisin)
+        if max(distances) < 256:
+            return table, array('B', distances).tobytes(), 1
+        if sys.byteorder == 'big':
+            distances.byteswap()
+        return table, distances.tobytes(), 2
+
+    @classmethod
+    def construire_table_numpy(cls, nb_disques, nb_tours):
+        """
+        Variante de construire_table vectorisée avec NumPy, niveau par niveau.
+
+        Args:
+            nb_disques (int): Nombre de disques.
+            nb_tours (int): Nombre de tours.
+
+        Returns:
+            tuple[bytearray, bytes, int]: Comme construire_table.
+        """
+        puissances = nb_tours ** np.arange(nb_disques, dtype=np.int64)
+        table = np.full(nb_tours ** nb_disques, cls.INCONNU, dtype=np.uint8)
+        objectif = nb_tours ** nb_disques - 1
+        table[objectif] = cls.OBJECTIF
+        distances = np.zeros(nb_tours ** nb_disques, dtype=np.uint16)
+        niveau = np.array([objectif], dtype=np.int64)
+        distance = 0
+        while niveau.size:
+            distance += 1
+            suivants = []
+            for debut in range(0, niveau.size, cls.TAILLE_LOT):
+                rangs = niveau[debut:debut + cls.TAILLE_LOT]
+                chiffres = (rangs[:, None] // puissances) % nb_tours
+                # Plus petit disque de chaque tour ; nb_disques pour une tour vide
+                sommets = []
+                for idx_tour in range(nb_tours):
+                    presents = chiffres == idx_tour
+                    sommets.append(np.where(presents.any(axis=1), presents.argmax(axis=1), nb_disques))
+                for a in range(nb_tours):
+                    for b in range(nb_tours):
+                        if a == b:
+                            continue
+                        valides = sommets[a] < sommets[b]
+                        voisins = rangs[valides] + (b - a) * puissances[sommets[a][valides]]
+                        voisins = voisins[table[voisins] == cls.INCONNU]
+                        table[voisins] = JournalCoups.coder(b, a)
+                        distances[voisins] = distance
+                        suivants.append(voisins)
+            niveau = np.unique(np.concatenate(suivants))
+        largeur = 1 if distance - 1 < 256 else 2
+        return bytearray(table.tobytes()), distances.astype(f"<u{largeur}").tobytes(), largeur
+
+    @classmethod
+    def charger_table(cls, nb_disques, nb_tours):
+        """
+        Charge une table en la projetant en mémoire, après l'avoir calculée et
+        enregistrée si le fichier n'existe pas encore (ou date d'un ancien format).
+
+        Args:
+            nb_disques (int): Nombre de disques.
+            nb_tours (int): Nombre de tours.
+
+        Returns:
+            mmap.mmap: La table (en-tête compris, voir ENTETE).
+
+        Raises:
+            ValueError: Si la table est trop grande ou si le fichier est invalide.
+        """
+        cle = (nb_disques, nb_tours)
+        if cle in cls.tables:
+            return cls.tables[cle]
+        if not cls.realisable(nb_disques, nb_tours):
+            raise ValueError(f"Table trop grande : {nb_tours}^{nb_disques} configurations.")
+
+        chemin = cls.chemin(nb_disques, nb_tours)
+        entete = cls.ENTETE + bytes([nb_disques, nb_tours])
+        if not cls.fichier_a_jour(nb_disques, nb_tours):
+            table, distances, largeur = cls.construire_table(nb_disques, nb_tours)
+            os.makedirs(cls.DOSSIER, exist_ok=True)
+            temporaire = f"{chemin}.{os.getpid()}.tmp"
+            with open(temporaire, "wb") as fichier:
+                fichier.write(entete + bytes([largeur]))
+                fichier.write(table)
+                fichier.write(distances)
+            os.replace(temporaire, chemin)
+
+        with open(chemin, "rb") as fichier:
+            table = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        largeur = table[len(entete)] if len(table) > len(entete) else 0
+        if (table[:len(entete)] != entete or largeur not in (1, 2)
+                or len(table) != len(entete) + 1 + (1 + largeur) * nb_tours ** nb_disques):
+            raise ValueError(f"Fichier de table des distances invalide : {chemin}")
+        cls.tables[cle] = table
+        return table
+
+    def piles(self, etat_tuple):
+        """
+        Convertit un état en piles de rangs de disques (0 = le plus petit), dans la
+        numérotation de la table.
+
+        Args:
+            etat_tuple (tuple): L'état sous forme de tuple de tuples (fond -> sommet).
+
+        Returns:
+            list[list[int]] | None: Les piles, ou None si l'état n'est pas légal.
+        """
+        rang_taille = {taille: d for d, taille in enumerate(sorted(taille for contenu in etat_tuple
+                                                                   for taille in contenu))}
+        if len(rang_taille) != self.nb_disques or len(etat_tuple) != self.nb_tours:
+            return None
+        piles = [None] * self.nb_tours
+        for idx_tour, contenu_tour in enumerate(etat_tuple):
+            pile = [rang_taille[taille] for taille in contenu_tour]
+            if any(dessous < dessus for dessous, dessus in zip(pile, pile[1:])):
+                return None
+            piles[self.renumerotation[idx_tour]] = pile
+        return piles
+
+    def rang(self, piles):
+        """
+        Rang d'une configuration dans la table.
+
+        Args:
+            piles (list[list[int]]): Les piles (voir piles).
+
+        Returns:
+            int: Le rang.
+        """
+        puissances = self.puissances
+        return sum(idx_tour * puissances[d] for idx_tour, pile in enumerate(piles) for d in pile)
+
+    def rang_positions(self, positions):
+        """
+        Rang d'une configuration légale donnée par la tour de chaque disque.
+
+        Args:
+            positions (list[int]): Index 0-basé de la tour de chaque disque, du plus petit au plus grand.
+
+        Returns:
+            int: Le rang.
+        """
+        puissances, renumerotation = self.puissances, self.renumerotation
+        return sum(renumerotation[idx_tour] * puissances[d] for d, idx_tour in enumerate(positions))
+
+    def distance_rang(self, rang):
+        """
+        Distance lue dans la table, en O(1).
+
+        Args:
+            rang (int): Rang de la configuration (voir rang, rang_positions).
+
+        Returns:
+            int: Nombre minimal de mouvements jusqu'à l'objectif.
+        """
+        if self.largeur == 1:
+            return self.table[self.debut_distances + rang]
+        position = self.debut_distances + 2 * rang
+        return int.from_bytes(self.table[position:position + 2], 'little')
+
+    def prochain_mouvement(self, etat_tuple):
+        """
+        Premier mouvement d'une solution optimale, lu dans la table.
+
+        Args:
+            etat_tuple (tuple): Une configuration légale.
+
+        Returns:
+            tuple[int, int] | None: (index_tour_source, index_tour_destination), ou None
+            si la configuration est déjà résolue.
+
+        Raises:
+            ValueError: Si la configuration n'est pas légale.
+        """
+        piles = self.piles(etat_tuple)
+        if piles is None:
+            raise ValueError("La table ne contient que les configurations légales.")
+        octet = self.table[self.debut + self.rang(piles)]
+        if octet == self.OBJECTIF:
+            return None
+        idx_source, idx_dest = JournalCoups.DECODAGE[octet]
+        return self.renumerotation[idx_source], self.renumerotation[idx_dest]
+
+    def generer_mouvements(self, etat_tuple):
+        """
+        Génère paresseusement une solution optimale en suivant la table, en O(1)
+        par mouvement.
+
+        Args:
+            etat_tuple (tuple): Une configuration légale.
+
+        Yields:
+            tuple[int, int]: (index_tour_source, index_tour_destination).
+
+        Raises:
+            ValueError: Si la configuration n'est pas légale.
+        """
+        piles = self.piles(etat_tuple)
+        if piles is None:
+            raise ValueError("La table ne contient que les configurations légales.")
+        table, debut, puissances, renumerotation = self.table, self.debut, self.puissances, self.renumerotation
+        decodage = JournalCoups.DECODAGE
+        rang = self.rang(piles)
+        octet = table[debut + rang]
+        while octet != self.OBJECTIF:
+            a, b = decodage[octet]
+            disque = piles[a].pop()
+            piles[b].append(disque)
+            rang += (b - a) * puissances[disque]
+            yield renumerotation[a], renumerotation[b]
+            octet = table[debut + rang]
+
+    def distance(self, etat_tuple):
+        """
+        Nombre minimal de mouvements jusqu'à l'objectif, lu dans la table.
+
+        Args:
+            etat_tuple (tuple): Une configuration légale.
+
+        Returns:
+            int: La distance.
+
+        Raises:
+            ValueError: Si la configuration n'est pas légale.
+        """
+        piles = self.piles(etat_tuple)
+        if piles is None:
+            raise ValueError("La table ne contient que les configurations légales.")
+        return self.distance_rang(self.rang(piles))
+
+
+def main(arguments=None):
+    analyseur = argparse.ArgumentParser(description="Construit une table des distances des tours de Hanoï.")
+    analyseur.add_argument("disques", type=int, help="nombre de disques")
+    analyseur.add_argument("tours", type=int, help="nombre de tours")
+    args = analyseur.parse_args(arguments)
+    if not TableDistances.realisable(args.disques, args.tours):
+        print(f"Table trop grande : {args.tours}^{args.disques} configurations")
+        return 1
+    TableDistances.charger_table(args.disques, args.tours)
+    print(f"Table enregistrée dans {TableDistances.chemin(args.disques, args.tours)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,40 @@
+from array import array
+
+from Disque import Disque
+
+
 class Tour:
     """
     Représente une tour sur laquelle les disques sont empilés.
 
+    Le contenu est stocké de façon compacte : un octet par disque (sa taille),
+    du fond au sommet. Seule la taille d'un disque empilé est conservée : les
+    objets Disque renvoyés sont les instances partagées de Disque.partage.
+
     Attributs:
         numero (int): Le numéro de la tour (1, 2 ou 3).
-        disques (list[Disque]): Liste de disques empilés dans l'ordre.
+        tailles (array): Tailles des disques empilés (array('B')), du fond au sommet.
+        disques (list[Disque]): Liste de disques empilés dans l'ordre (calculée depuis tailles).
     """
+    __slots__ = ('numero', 'tailles')
+
     def __init__(self, numero):
         self.numero = numero
-        self.disques = []
+        self.tailles = array('B')
+
+    @property
+    def disques(self):
+        """
+        Liste des disques empilés, du fond au sommet (nouvelle liste à chaque appel).
+
+        Returns:
+            list[Disque]: Les disques partagés correspondant aux tailles.
+        """
+        return [Disque.partage(taille) for taille in self.tailles]
+
+    @disques.setter
+    def disques(self, disques):
+        self.tailles = array('B', [disque.taille for disque in disques])
 
     def est_vide(self):
         """
@@ -17,7 +43,7 @@ class Tour:
         Returns:
             bool: True si la tour ne contient aucun disque, sinon False.
         """
-        return len(self.disques) == 0
+        return len(self.tailles) == 0
 
 
 
@@ -28,7 +54,7 @@ class Tour:
         Args:
             disque (Disque): Le disque à ajouter.
         """
-        self.disques.append(disque)
+        self.tailles.append(disque.taille)
 
 
 
@@ -40,7 +66,7 @@ class Tour:
             Disque: Le disque retiré du sommet.
         """
         if not self.est_vide():
-            return self.disques.pop()
+            return Disque.partage(self.tailles.pop())
         return None
 
 
@@ -53,6 +79,6 @@ class Tour:
             Disque | None: Le disque au sommet, ou None si la tour est vide.
         """
         if not self.est_vide():
-            return self.disques[-1]
+            return Disque.partage(self.tailles[-1])
         return None
 
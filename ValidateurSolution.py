@@ -0,0 +1,163 @@
+from array import array
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est facultatif : la validation se replie sur une boucle simple
+    np = None
+
+from SolveurOptimal import SolveurOptimal
+
+
+class ValidateurSolution:
+    """
+    Vérifie d'un bloc une suite de mouvements proposée (par exemple une solution
+    produite hors du jeu) à partir d'une configuration de départ, sans passer par
+    JeuHanoi.jouer_coup coup par coup.
+
+    Les mouvements sont soit des paires (index source, index destination) 0-basées
+    (liste de paires ou tableau NumPy de forme (n, 2)), soit des octets codés comme
+    dans JournalCoups (source sur les 4 bits de poids fort), dans un bytes, un
+    bytearray, un array('B') ou un tableau NumPy à une dimension.
+
+    Une solution proposée est le plus souvent la solution optimale, au moins au
+    début. Avec NumPy, 3 tours et un départ légal, la suite est donc d'abord
+    comparée d'un bloc à la solution optimale (SolveurOptimal.mouvements_tableau) :
+    la partie identique est légale sans rien rejouer, et son état final se calcule
+    directement. Seule la suite qui s'en écarte est rejouée par valider_boucle.
+    """
+    # Nombre de mouvements comparés pour reconnaître la tour visée par la solution proposée
+    TAILLE_ECHANTILLON = 64
+
+    def valider(self, etat_initial, mouvements):
+        """
+        Vérifie une suite de mouvements.
+
+        Args:
+            etat_initial (tuple): L'état de départ (tuple de tuples, fond -> sommet), légal ou non.
+            mouvements: Les mouvements, en paires ou en octets codés (voir la classe).
+
+        Returns:
+            tuple[int | None, tuple]: (index 0-basé du premier mouvement illégal, ou None
+            si tous sont légaux ; état atteint après les mouvements légaux qui le précèdent).
+        """
+        if np is None or len(etat_initial) != 3 or not SolveurOptimal.est_legal(etat_initial):
+            return self.valider_boucle(etat_initial, self.en_liste(mouvements))
+
+        sources, destinations = self.decoder(mouvements)
+        solveur = SolveurOptimal()
+
+        # Tour visée : celle dont la solution optimale coïncide le plus longtemps avec le début proposé
+        meilleur_prefixe, idx_tour_cible = -1, 0
+        for idx_cible in range(3):
+            prefixe = self.prefixe_commun(solveur, etat_initial, idx_cible, sources, destinations,
+                                          self.TAILLE_ECHANTILLON)
+            if prefixe > meilleur_prefixe:
+                meilleur_prefixe, idx_tour_cible = prefixe, idx_cible
+        if meilleur_prefixe == min(self.TAILLE_ECHANTILLON, sources.size):
+            meilleur_prefixe = self.prefixe_commun(solveur, etat_initial, idx_tour_cible, sources, destinations)
+
+        etat = solveur.etat_apres_mouvements(etat_initial, meilleur_prefixe, idx_tour_cible)
+        if meilleur_prefixe == sources.size:
+            return None, etat
+        index_invalide, etat = self.valider_boucle(etat, self.en_liste(mouvements[meilleur_prefixe:]))
+        if index_invalide is not None:
+            index_invalide += meilleur_prefixe
+        return index_invalide, etat
+
+    @staticmethod
+    def prefixe_commun(solveur, etat_initial, idx_tour_cible, sources, destinations, limite=None):
+        """
+        Longueur du début commun aux mouvements proposés et à la solution optimale.
+
+        Args:
+            solveur (SolveurOptimal): Le solveur des configurations légales.
+            etat_initial (tuple): L'état légal de départ.
+            idx_tour_cible (int): Index 0-basé de la tour cible de la solution optimale.
+            sources (np.ndarray): Index des tours de départ proposés.
+            destinations (np.ndarray): Index des tours d'arrivée proposés.
+            limite (int | None): Nombre maximal de mouvements comparés (tous si None).
+
+        Returns:
+            int: Nombre de mouvements identiques avant le premier écart.
+        """
+        taille = sources.size if limite is None else min(limite, sources.size)
+        sources_optimales, destinations_optimales = solveur.mouvements_tableau(etat_initial, idx_tour_cible, taille)
+        taille = sources_optimales.size
+        ecarts = np.flatnonzero((sources[:taille] != sources_optimales)
+                                | (destinations[:taille] != destinations_optimales))
+        return int(ecarts[0]) if ecarts.size else taille
+
+    @staticmethod
+    def decoder(mouvements):
+        """
+        Convertit les mouvements en deux tableaux NumPy d'index (sources, destinations).
+
+        Args:
+            mouvements: Les mouvements, en paires ou en octets codés.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Les index des tours de départ et d'arrivée (int32).
+        """
+        if isinstance(mouvements, (bytes, bytearray, memoryview, array)):
+            tableau = np.frombuffer(mouvements, dtype=np.uint8)
+        elif isinstance(mouvements, (list, tuple)) and mouvements and not isinstance(mouvements[0], int):
+            # Liste de paires : aplatie sans créer de tableau d'objets (bien plus rapide que np.asarray)
+            tableau = np.fromiter(chain.from_iterable(mouvements), dtype=np.int64,
+                                  count=2 * len(mouvements)).reshape(-1, 2)
+        else:
+            tableau = np.asarray(mouvements)
+        if tableau.size == 0:
+            vide = np.zeros(0, dtype=np.int32)
+            return vide, vide
+        tableau = tableau.astype(np.int32)
+        if tableau.ndim == 1:
+            return tableau >> 4, tableau & 0xF
+        return tableau[:, 0], tableau[:, 1]
+
+    @staticmethod
+    def en_liste(mouvements):
+        """
+        Prépare les mouvements pour valider_boucle : un tableau NumPy devient une liste
+        d'entiers Python (octets) ou de paires ; les autres formes sont déjà itérables.
+
+        Args:
+            mouvements: Les mouvements, en paires ou en octets codés.
+
+        Returns:
+            Les mouvements, itérables en entiers ou en paires.
+        """
+        if np is not None and isinstance(mouvements, np.ndarray):
+            return mouvements.tolist()
+        return mouvements
+
+    @staticmethod
+    def valider_boucle(etat_initial, mouvements):
+        """
+        Variante sans NumPy : rejoue les mouvements sur de simples listes.
+
+        Args:
+            etat_initial (tuple): L'état de départ.
+            mouvements: Les mouvements, en paires ou en octets codés.
+
+        Returns:
+            tuple[int | None, tuple]: Comme valider.
+        """
+        piles = [list(contenu) for contenu in etat_initial]
+        nb_tours = len(piles)
+        index_invalide = None
+        for index, mouvement in enumerate(mouvements):
+            if isinstance(mouvement, int):
+                idx_source, idx_dest = mouvement >> 4, mouvement & 0xF
+            else:
+                idx_source, idx_dest = mouvement
+            if not (0 <= idx_source < nb_tours and 0 <= idx_dest < nb_tours) or idx_source == idx_dest:
+                index_invalide = index
+                break
+            pile_source = piles[idx_source]
+            pile_dest = piles[idx_dest]
+            if not pile_source or (pile_dest and pile_dest[-1] <= pile_source[-1]):
+                index_invalide = index
+                break
+            pile_dest.append(pile_source.pop())
+        return index_invalide, tuple(tuple(pile) for pile in piles)
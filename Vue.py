@@ -15,7 +15,20 @@ class Vue:
         champs_texte (dict): Champs de saisie de texte.
         champs_chrono (widget): Affichage du chronomètre.
         champs_quiz (widget): Zone d'affichage des questions.
+        items_disques (dict): Élément du canvas de chaque disque affiché.
+        positions_disques (dict): (index de tour, hauteur) de chaque disque affiché.
+        espacement, x_depart, largeur_base (float): Géométrie des tours de la partie affichée
+            (resserrée quand il y a plus de 3 tours).
     """
+    # Géométrie du plateau (pour 3 tours)
+    LARGEUR_CANVAS = 1000
+    LARGEUR_BASE = 250
+    HAUTEUR_BASE = 30
+    ESPACEMENT = 320
+    X_DEPART = 180
+    Y_BASE = 550
+    Y_HAUT_TIGE = 240
+
     def __init__(self, controleur):
         self.controleur = controleur
         self.fenetre = tk.Tk()
@@ -30,8 +43,20 @@ class Vue:
         self.champs_chrono = None
         self.champs_quiz = None
         self.tour_selectionnee = None
+
+        # Éléments du canvas conservés d'un affichage à l'autre
+        self.jeu_dessine = None
+        self.items_disques = {}
+        self.positions_disques = {}
+        self.item_selection = None
+        self.epaisseur_disque = 24
+        self.largeur_unite = 25
         
-        self.canvas = tk.Canvas(self.fenetre, width=1000, height=600, bg="lightgray")
+        self.espacement = self.ESPACEMENT
+        self.x_depart = self.X_DEPART
+        self.largeur_base = self.LARGEUR_BASE
+        
+        self.canvas = tk.Canvas(self.fenetre, width=self.LARGEUR_CANVAS, height=600, bg="lightgray")
         self.canvas.pack(pady=20)
         
         self.canvas.bind("<Button-1>", self.gerer_clic)
@@ -71,6 +96,14 @@ class Vue:
                                                     command=self.controleur.demander_aide)
         self.boutons["aide_moi"].pack(side=tk.LEFT, padx=5)
 
+        self.boutons["annuler"] = tk.Button(frame_controles, text="Annuler",
+                                            command=self.controleur.annuler_coup)
+        self.boutons["annuler"].pack(side=tk.LEFT, padx=5)
+
+        self.boutons["retablir"] = tk.Button(frame_controles, text="Rétablir",
+                                             command=self.controleur.retablir_coup)
+        self.boutons["retablir"].pack(side=tk.LEFT, padx=5)
+
         # Bouton Quitter
         self.boutons["quitter"] = tk.Button(frame_controles, text="Quitter", command=self.fenetre.destroy)
         self.boutons["quitter"].pack(side=tk.RIGHT, padx=20)
@@ -82,10 +115,20 @@ class Vue:
         
         self.var_nb_disques = tk.IntVar(value=3)
         
-        disques_spinbox = tk.Spinbox(frame_controles, from_=3, to=8, width=2, 
+        disques_spinbox = tk.Spinbox(frame_controles, from_=3, to=self.controleur.NB_DISQUES_MAX, width=2, 
                                      textvariable=self.var_nb_disques,
                                      command=lambda: self.controleur.config_nbr_disque(self.var_nb_disques.get()))
         disques_spinbox.pack(side=tk.LEFT)
+
+        # Nombre de tours (la dernière est la tour d'arrivée)
+        tk.Label(frame_controles, text="Tours:").pack(side=tk.LEFT, padx=5)
+
+        self.var_nb_tours = tk.IntVar(value=3)
+
+        tours_spinbox = tk.Spinbox(frame_controles, from_=3, to=self.controleur.NB_TOURS_MAX, width=2,
+                                   textvariable=self.var_nb_tours,
+                                   command=lambda: self.controleur.config_nbr_tours(self.var_nb_tours.get()))
+        tours_spinbox.pack(side=tk.LEFT)
         
         # Frame pour les informations
         frame_info = tk.Frame(self.fenetre)
@@ -102,6 +145,21 @@ class Vue:
         
         self.etiquettes["coups"] = tk.Label(frame_info, text="Coups: 0")
         self.etiquettes["coups"].pack(side=tk.LEFT, padx=10)
+
+        # Avancement du solveur (résolution auto / aide)
+        self.etiquettes["solveur"] = tk.Label(frame_info, text="")
+        self.etiquettes["solveur"].pack(side=tk.LEFT, padx=10)
+
+        # Vitesse de la résolution automatique (chaque niveau multiplie la vitesse par 10)
+        self.boutons["aller_a_la_fin"] = tk.Button(frame_info, text="Aller à la fin",
+                                                   command=self.controleur.aller_a_la_fin)
+        self.boutons["aller_a_la_fin"].pack(side=tk.RIGHT, padx=10)
+
+        self.var_vitesse = tk.IntVar(value=0)
+        tk.Scale(frame_info, from_=0, to=5, orient=tk.HORIZONTAL, showvalue=False, length=120,
+                 variable=self.var_vitesse,
+                 command=lambda niveau: self.controleur.changer_vitesse(int(niveau))).pack(side=tk.RIGHT)
+        tk.Label(frame_info, text="Vitesse:").pack(side=tk.RIGHT, padx=5)
         
        
     def afficher_tout(self, jeu):
@@ -110,50 +168,135 @@ class Vue:
         - Affiche les disques empilés sur chaque tour
         - Met à jour le chrono, score, quiz et autres infos
 
+        Le plateau n'est dessiné qu'une fois par partie ; ensuite seuls les disques
+        dont la position a changé sont déplacés sur le canvas.
+
         Args:
             jeu (JeuHanoi): L'état actuel du jeu (tours, disques, chrono...).
         """
+        if jeu is not self.jeu_dessine:
+            self.dessiner_plateau(jeu)
+
+        # Placer les disques (seuls ceux qui ont bougé sont modifiés)
+        disques_presents = set()
+        for i, tour in enumerate(jeu.tours):
+            for j, disque in enumerate(tour.disques):
+                disques_presents.add(disque)
+                self.placer_disque(disque, i, j)
+
+        # Effacer les disques qui ne sont plus dans la partie (état rechargé)
+        for disque in [d for d in self.items_disques if d not in disques_presents]:
+            self.canvas.delete(self.items_disques.pop(disque))
+            del self.positions_disques[disque]
+
+        self.afficher_selection()
+        self.afficher_informations(jeu)
+
+    def dessiner_plateau(self, jeu):
+        """
+        Crée les éléments fixes du canvas pour une nouvelle partie (bases, tiges,
+        numéros, contour de sélection) ; l'écart entre les tours et la taille des
+        disques s'adaptent à leur nombre.
+
+        Args:
+            jeu (JeuHanoi): La partie à afficher.
+        """
         self.canvas.delete("all")
-        
-        # Centrage et dimensions adaptés
-        largeur_base = 250
-        hauteur_base = 30
-        espacement = 320
-        x_depart = 180
-        y_base = 550
-        y_haut_tige = 240
-        for i in range(3):
-            x_base = x_depart + i * espacement
+        self.jeu_dessine = jeu
+        self.items_disques = {}
+        self.positions_disques = {}
+
+        # Les tours sont centrées et resserrées pour tenir dans la largeur du canvas
+        nb_tours = len(jeu.tours)
+        self.espacement = min(self.ESPACEMENT, (self.LARGEUR_CANVAS - 40) / nb_tours)
+        self.x_depart = self.LARGEUR_CANVAS / 2 - (nb_tours - 1) * self.espacement / 2
+        self.largeur_base = self.LARGEUR_BASE * self.espacement / self.ESPACEMENT
+
+        # Les disques doivent tenir sur la tige et entre deux tours
+        nb_disques = max(jeu.nombre_disques, 1)
+        self.epaisseur_disque = min(24, (self.Y_BASE - self.Y_HAUT_TIGE) // nb_disques - 2)
+        self.largeur_unite = min(25, (self.espacement - 48) / (nb_disques + 1))
+
+        for i in range(nb_tours):
+            x_base = self.x_depart + i * self.espacement
             # Base horizontale
-            self.canvas.create_rectangle(x_base - largeur_base/2, y_base, 
-                                        x_base + largeur_base/2, y_base + hauteur_base, 
+            self.canvas.create_rectangle(x_base - self.largeur_base/2, self.Y_BASE,
+                                        x_base + self.largeur_base/2, self.Y_BASE + self.HAUTEUR_BASE,
                                         fill="brown")
             # Tige verticale
-            self.canvas.create_rectangle(x_base - 7, y_haut_tige, x_base + 7, y_base, fill="brown")
+            self.canvas.create_rectangle(x_base - 7, self.Y_HAUT_TIGE, x_base + 7, self.Y_BASE, fill="brown")
             # Numéro de la tour
-            self.canvas.create_text(x_base, y_base + 40, text=f"Tour {i+1}", font=("Arial", 16))
-            # Ajouter un contour si la tour est sélectionnée
-            if self.tour_selectionnee == i:
-                self.canvas.create_rectangle(
-                    x_base - largeur_base/2 - 7, y_haut_tige - 7,
-                    x_base + largeur_base/2 + 7, y_base + hauteur_base + 7,
-                    outline="black", width=4
-                )
-        
-        # Dessiner les disques
-        for i, tour in enumerate(jeu.tours):
-            x_centre = x_depart + i * espacement
-            for j, disque in enumerate(tour.disques):
-                largeur_disque = 28 + disque.taille * 25
-                epaisseur_disque = 24  # plus épais
-                y_pos = y_base - (j + 1) * (epaisseur_disque + 2)
-                self.canvas.create_rectangle(
-                    x_centre - largeur_disque/2, y_pos,
-                    x_centre + largeur_disque/2, y_pos + epaisseur_disque,
-                    fill=disque.couleur, outline="black"
-                )
-        
-        # Mettre à jour les informations
+            self.canvas.create_text(x_base, self.Y_BASE + 40, text=f"Tour {i+1}", font=("Arial", 16))
+
+        # Contour de la tour sélectionnée, caché tant qu'aucune tour n'est sélectionnée
+        self.item_selection = self.canvas.create_rectangle(0, 0, 0, 0, outline="black", width=4,
+                                                           state="hidden")
+
+    def placer_disque(self, disque, idx_tour, hauteur):
+        """
+        Place un disque sur le canvas ; il est créé à sa première apparition,
+        puis seulement déplacé.
+
+        Args:
+            disque (Disque): Le disque à placer.
+            idx_tour (int): Index 0-basé de sa tour.
+            hauteur (int): Sa position dans la tour (0 = au fond).
+        """
+        position = (idx_tour, hauteur)
+        if self.positions_disques.get(disque) == position:
+            return
+        self.positions_disques[disque] = position
+
+        x_centre = self.x_depart + idx_tour * self.espacement
+        largeur_disque = 28 + disque.taille * self.largeur_unite
+        y_pos = self.Y_BASE - (hauteur + 1) * (self.epaisseur_disque + 2)
+        coordonnees = (x_centre - largeur_disque/2, y_pos,
+                       x_centre + largeur_disque/2, y_pos + self.epaisseur_disque)
+        item = self.items_disques.get(disque)
+        if item is None:
+            self.items_disques[disque] = self.canvas.create_rectangle(
+                *coordonnees, fill=disque.couleur, outline="black")
+        else:
+            self.canvas.coords(item, *coordonnees)
+
+    def afficher_deplacement(self, jeu, tour_arrivee):
+        """
+        Met à jour l'affichage après un coup : seul le disque déplacé (au sommet
+        de la tour d'arrivée) est repositionné, quel que soit le nombre de disques.
+
+        Args:
+            jeu (JeuHanoi): La partie en cours.
+            tour_arrivee (Tour): La tour où le disque vient d'être posé.
+        """
+        disque = tour_arrivee.top_disque()
+        if jeu is not self.jeu_dessine or disque not in self.items_disques:
+            self.afficher_tout(jeu)
+            return
+        self.placer_disque(disque, tour_arrivee.numero - 1, len(tour_arrivee.tailles) - 1)
+        self.afficher_informations(jeu)
+
+    def afficher_selection(self):
+        """
+        Affiche le contour de la tour sélectionnée, ou le cache.
+        """
+        if self.item_selection is None:
+            return
+        if self.tour_selectionnee is None:
+            self.canvas.itemconfigure(self.item_selection, state="hidden")
+            return
+        x_base = self.x_depart + self.tour_selectionnee * self.espacement
+        self.canvas.coords(self.item_selection,
+                           x_base - self.largeur_base/2 - 7, self.Y_HAUT_TIGE - 7,
+                           x_base + self.largeur_base/2 + 7, self.Y_BASE + self.HAUTEUR_BASE + 7)
+        self.canvas.itemconfigure(self.item_selection, state="normal")
+
+    def afficher_informations(self, jeu):
+        """
+        Met à jour le chrono, le score et le nombre de coups.
+
+        Args:
+            jeu (JeuHanoi): La partie en cours.
+        """
         self.etiquettes["chrono"].config(text=f"Temps: {int(jeu.chrono)}s")
         self.etiquettes["score"].config(text=f"Score: {jeu.score}")
         self.etiquettes["coups"].config(text=f"Coups: {jeu.nbr_coups}")
@@ -174,6 +317,15 @@ class Vue:
         self.boutons['valider_quiz']= self.controleur.gerer_reponse_quiz(self.champs_texte["reponse_quiz"])
 
 
+    def afficher_progression(self, texte):
+        """
+        Affiche l'état du solveur en arrière-plan.
+
+        Args:
+            texte (str): Texte à afficher (vide pour effacer).
+        """
+        self.etiquettes["solveur"].config(text=texte)
+
     def mettre_a_jour_interface(self, jeu):
         """
         Met à jour l'ensemble de l'affichage en fonction de l'état du jeu.
@@ -191,14 +343,12 @@ class Vue:
             event (tkinter.Event): Objet événement contenant les coordonnées du clic.
         """
         x, y = event.x, event.y
-        espacement = 320
-        x_depart = 180
-        for i in range(3):
-            x_centre = x_depart + i * espacement
-            if x_centre - 125 <= x <= x_centre + 125 and y <= 550:
+        for i in range(len(self.controleur.jeuhanoi.tours)):
+            x_centre = self.x_depart + i * self.espacement
+            if x_centre - self.largeur_base/2 <= x <= x_centre + self.largeur_base/2 and y <= self.Y_BASE:
                 self.tour_selectionnee = i
                 self.controleur.traiter_clic_tour(i)
-                self.afficher_tout(self.controleur.jeuhanoi)
+                self.afficher_selection()
                 break
 
     def update_chrono(self):
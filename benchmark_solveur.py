@@ -0,0 +1,305 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from JeuHanoi import JeuHanoi
+from SolveurOptimal import SolveurOptimal
+
+
+# Matrice mesurée par défaut
+NB_DISQUES_DEFAUT = (4, 6, 8, 10)
+DEPARTS_DEFAUT = ('standard', 'aleatoire', 'milieu')
+GRAINES_DEFAUT = (0, 1, 2)
+SOLVEURS_DEFAUT = ('astar', 'ida', 'bidirectionnel', 'parallele', 'parallele-1', 'parallele-2', 'parallele-4')
+# Nombres de processus mesurés pour le mode 'parallele' (expérimental), en plus d'un par cœur ('parallele')
+NB_PROCESSUS_PARALLELE = (1, 2, 4)
+REPETITIONS_DEFAUT = 5
+# Hausse de latence médiane tolérée par rapport à la référence (0.5 = +50 %), avec --latence :
+# les latences de la référence n'ont de sens que sur la machine qui l'a enregistrée
+TOLERANCE_DEFAUT = 0.5
+# En dessous de ce temps (en secondes), les écarts de latence sont du bruit et ne sont pas comparés
+LATENCE_MINIMALE_COMPAREE = 0.005
+
+
+def resoudre_par_mode(mode_solveur, nb_processus=None):
+    """
+    Crée une fonction de résolution qui passe par JeuHanoi.resoudre_automatiquement.
+
+    Args:
+        mode_solveur (str): Mode de recherche (voir JeuHanoi.MODES_SOLVEUR).
+        nb_processus (int | None): Pour 'parallele', nombre de processus (un par cœur si None).
+
+    Returns:
+        callable: (jeu) -> (mouvements, StatistiquesSolveur).
+    """
+    def resoudre(jeu):
+        return jeu.resoudre_automatiquement(mode_solveur=mode_solveur, nb_processus=nb_processus,
+                                            avec_statistiques=True)
+    return resoudre
+
+
+# Solveurs mesurables : nom -> fonction (jeu) -> (mouvements, StatistiquesSolveur)
+SOLVEURS = {mode_solveur: resoudre_par_mode(mode_solveur) for mode_solveur in JeuHanoi.MODES_SOLVEUR}
+SOLVEURS.update({f"parallele-{nb_processus}": resoudre_par_mode('parallele', nb_processus)
+                 for nb_processus in NB_PROCESSUS_PARALLELE})
+# Solveurs dont le nombre d'états développés dépend de l'ordonnancement des processus : il n'est pas comparé
+SOLVEURS_COMPTE_VARIABLE = {'parallele'} | {f"parallele-{nb_processus}" for nb_processus in NB_PROCESSUS_PARALLELE
+                                            if nb_processus > 1}
+
+
+def etat_depart(nb_disques, depart, graine):
+    """
+    Construit l'état de départ d'un cas de mesure, de façon reproductible.
+
+    Args:
+        nb_disques (int): Nombre de disques.
+        depart (str): 'standard' (ordre normal), 'aleatoire' (ordre mélangé sur la première tour)
+            ou 'milieu' (état légal atteint après un nombre aléatoire de coups optimaux).
+        graine (int): Graine du générateur aléatoire.
+
+    Returns:
+        tuple: L'état sous forme de tuple de tuples (fond -> sommet).
+    """
+    jeu = JeuHanoi(nb_disques)
+    if depart == 'aleatoire':
+        # Générateur propre au cas : l'état ne dépend pas des autres tirages (couleurs des disques...)
+        tailles = list(jeu.etat_tuple()[0])
+        random.Random(graine).shuffle(tailles)
+        return (tuple(tailles),) + ((),) * (len(jeu.tours) - 1)
+    elif depart == 'milieu':
+        nb_coups = random.Random(graine).randrange(2 ** nb_disques - 1)
+        tours = [list(contenu) for contenu in jeu.etat_tuple()]
+        mouvements = SolveurOptimal().generer_mouvements(jeu.etat_tuple())
+        for _ in range(nb_coups):
+            idx_source, idx_dest = next(mouvements)
+            tours[idx_dest].append(tours[idx_source].pop())
+        return tuple(tuple(contenu) for contenu in tours)
+    elif depart != 'standard':
+        raise ValueError(f"Départ inconnu : {depart}")
+    return jeu.etat_tuple()
+
+
+def percentile(valeurs, p):
+    """
+    Percentile par rang le plus proche.
+
+    Args:
+        valeurs (list[float]): Valeurs mesurées (non vide).
+        p (float): Percentile voulu, entre 0 et 100.
+
+    Returns:
+        float: La valeur du percentile.
+    """
+    triees = sorted(valeurs)
+    rang = max(0, -(-len(triees) * p // 100) - 1)
+    return triees[int(rang)]
+
+
+def mesurer_cas(nom_solveur, nb_disques, depart, graine, repetitions):
+    """
+    Mesure un cas : latences sur plusieurs répétitions, puis mémoire de pointe
+    (tracemalloc, sur une exécution séparée pour ne pas fausser les latences).
+    tracemalloc ne voit que ce processus : quand la recherche a lieu dans les
+    processus du mode 'parallele', la mémoire n'est pas mesurée (None).
+
+    Un premier appel non mesuré charge les bases de motifs (voir BaseMotifs).
+
+    Args:
+        nom_solveur (str): Clé de SOLVEURS.
+        nb_disques (int): Nombre de disques.
+        depart (str): Type de départ (voir etat_depart).
+        graine (int): Graine du départ.
+        repetitions (int): Nombre d'exécutions chronométrées.
+
+    Returns:
+        dict: Résultats du cas.
+    """
+    resoudre = SOLVEURS[nom_solveur]
+    etat = etat_depart(nb_disques, depart, graine)
+    jeu = JeuHanoi(nb_disques)
+
+    def executer():
+        jeu.charger_etat(etat)
+        return resoudre(jeu)
+
+    executer()  # Échauffement
+    latences = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        mouvements, statistiques = executer()
+        latences.append(time.perf_counter() - debut)
+
+    memoire_pointe = None
+    if statistiques.mode_solveur != 'parallele':
+        tracemalloc.start()
+        try:
+            executer()
+            memoire_pointe = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "nom": f"{nom_solveur}/{depart}/n={nb_disques}/graine={graine}",
+        "solveur": nom_solveur,
+        "nb_disques": nb_disques,
+        "depart": depart,
+        "graine": graine,
+        "etat_depart": repr(etat),
+        "longueur_solution": len(mouvements),
+        "mode_effectif": statistiques.mode_solveur,
+        "etats_developpes": statistiques.etats_developpes,
+        "etats_generes": statistiques.etats_generes,
+        "latence_min": min(latences),
+        "latence_p50": percentile(latences, 50),
+        "latence_p90": percentile(latences, 90),
+        "latence_p99": percentile(latences, 99),
+        "latence_max": max(latences),
+        "memoire_pointe": memoire_pointe,
+    }
+
+
+def executer_benchmark(nb_disques, departs, graines, solveurs, repetitions, rappel=None):
+    """
+    Mesure toute la matrice (solveurs x nombres de disques x départs x graines).
+
+    Le départ standard ne dépend pas de la graine : il n'est mesuré qu'une fois.
+
+    Args:
+        nb_disques (list[int]): Nombres de disques.
+        departs (list[str]): Types de départ.
+        graines (list[int]): Graines.
+        solveurs (list[str]): Clés de SOLVEURS.
+        repetitions (int): Exécutions chronométrées par cas.
+        rappel (callable | None): Appelée avec le résultat de chaque cas.
+
+    Returns:
+        dict: {"meta": ..., "cas": [résultats]}.
+    """
+    cas = []
+    for nom_solveur in solveurs:
+        for n in nb_disques:
+            for depart in departs:
+                for graine in (graines[:1] if depart == 'standard' else graines):
+                    resultat = mesurer_cas(nom_solveur, n, depart, graine, repetitions)
+                    cas.append(resultat)
+                    if rappel:
+                        rappel(resultat)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "plateforme": platform.platform(),
+            "nb_coeurs": os.cpu_count(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repetitions": repetitions,
+        },
+        "cas": cas,
+    }
+
+
+def comparer(resultats, reference, tolerance=None):
+    """
+    Compare des résultats à une référence enregistrée.
+
+    Sont des régressions : une solution de longueur différente (le solveur n'est plus
+    optimal ou plus correct) et plus d'états développés (les comptes sont déterministes,
+    donc comparables d'une machine à l'autre, sauf pour SOLVEURS_COMPTE_VARIABLE). Si tolerance est donnée, une latence
+    médiane au-delà de (1 + tolerance) fois la référence en est une aussi : la référence
+    doit alors avoir été enregistrée sur la même machine.
+
+    Args:
+        resultats (dict): Résultats de executer_benchmark.
+        reference (dict): Résultats de référence (même format).
+        tolerance (float | None): Hausse de latence médiane tolérée (None : latence non comparée).
+
+    Returns:
+        list[str]: Description de chaque régression (vide si aucune).
+    """
+    cas_reference = {cas["nom"]: cas for cas in reference["cas"]}
+    regressions = []
+    for cas in resultats["cas"]:
+        ancien = cas_reference.get(cas["nom"])
+        if ancien is None:
+            continue
+        if cas["longueur_solution"] != ancien["longueur_solution"]:
+            regressions.append(f"{cas['nom']} : solution de {cas['longueur_solution']} coups "
+                               f"au lieu de {ancien['longueur_solution']}")
+        if cas["solveur"] not in SOLVEURS_COMPTE_VARIABLE and cas["etats_developpes"] > ancien["etats_developpes"]:
+            regressions.append(f"{cas['nom']} : {cas['etats_developpes']} états développés "
+                               f"au lieu de {ancien['etats_developpes']}")
+        if tolerance is None:
+            continue
+        limite = max(ancien["latence_p50"], LATENCE_MINIMALE_COMPAREE) * (1 + tolerance)
+        if cas["latence_p50"] > limite:
+            regressions.append(f"{cas['nom']} : latence médiane {cas['latence_p50'] * 1000:.1f} ms "
+                               f"au lieu de {ancien['latence_p50'] * 1000:.1f} ms")
+    return regressions
+
+
+def afficher_cas(cas):
+    """
+    Affiche une ligne de résumé pour un cas mesuré.
+
+    Args:
+        cas (dict): Résultat de mesurer_cas.
+    """
+    if cas['memoire_pointe'] is None:
+        memoire = "mémoire non mesurée"
+    else:
+        memoire = f"mémoire {cas['memoire_pointe'] / 1024:>9.0f} Kio"
+    print(f"{cas['nom']:<36} {cas['longueur_solution']:>6} coups {cas['etats_developpes']:>8} développés "
+          f"p50 {cas['latence_p50'] * 1000:>9.2f} ms  p99 {cas['latence_p99'] * 1000:>9.2f} ms  {memoire}")
+
+
+def main(arguments=None):
+    analyseur = argparse.ArgumentParser(description="Mesure les performances des solveurs des tours de Hanoï.")
+    analyseur.add_argument("--disques", type=int, nargs="+", default=list(NB_DISQUES_DEFAUT))
+    analyseur.add_argument("--departs", nargs="+", choices=DEPARTS_DEFAUT, default=list(DEPARTS_DEFAUT))
+    analyseur.add_argument("--graines", type=int, nargs="+", default=list(GRAINES_DEFAUT))
+    analyseur.add_argument("--solveurs", nargs="+", choices=sorted(SOLVEURS), default=list(SOLVEURS_DEFAUT))
+    analyseur.add_argument("--repetitions", type=int, default=REPETITIONS_DEFAUT)
+    analyseur.add_argument("--sortie", default="resultats_benchmark.json",
+                           help="fichier JSON des résultats")
+    analyseur.add_argument("--reference", default="benchmark_reference.json",
+                           help="résultats de référence à comparer")
+    analyseur.add_argument("--latence", action="store_true",
+                           help="compare aussi la latence médiane (référence enregistrée sur cette machine)")
+    analyseur.add_argument("--tolerance", type=float, default=TOLERANCE_DEFAUT,
+                           help="hausse de latence médiane tolérée avec --latence (0.5 = +50 %%)")
+    analyseur.add_argument("--enregistrer-reference", action="store_true",
+                           help="écrit les résultats dans le fichier de référence au lieu de comparer")
+    args = analyseur.parse_args(arguments)
+
+    resultats = executer_benchmark(args.disques, args.departs, args.graines, args.solveurs,
+                                   args.repetitions, afficher_cas)
+    with open(args.sortie, "w", encoding="utf-8") as fichier:
+        json.dump(resultats, fichier, indent=1)
+
+    if args.enregistrer_reference:
+        with open(args.reference, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=1)
+        print(f"Référence enregistrée dans {args.reference}")
+        return 0
+
+    try:
+        with open(args.reference, encoding="utf-8") as fichier:
+            reference = json.load(fichier)
+    except FileNotFoundError:
+        print(f"Pas de référence ({args.reference}) : aucune comparaison")
+        return 0
+
+    regressions = comparer(resultats, reference, args.tolerance if args.latence else None)
+    for regression in regressions:
+        print("RÉGRESSION", regression)
+    if regressions:
+        return 1
+    print("Aucune régression par rapport à la référence")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())